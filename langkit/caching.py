@@ -1,6 +1,121 @@
 import hashlib
 import json
-from typing import Dict
+import os
+import shutil
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+
+try:
+    import xxhash  # type: ignore
+except ImportError:
+    xxhash = None
+
+
+def new_hasher() -> Any:
+    """
+    Return a new hash object for content digests. Use xxhash if it is
+    available, as it is much faster than cryptographic hashes, and fall back to
+    blake2b otherwise.
+    """
+    return (xxhash.xxh3_128() if xxhash is not None
+            else hashlib.blake2b(digest_size=16))
+
+
+def content_digest(content: bytes) -> str:
+    """
+    Return the hexadecimal digest for ``content``.
+    """
+    h = new_hasher()
+    h.update(content)
+    return h.hexdigest()
+
+
+def user_cache_dir(name: str) -> Optional[str]:
+    """
+    Return the path to the ``name`` cache directory shared by all Langkit runs
+    for the current user, or None if such caches are disabled.
+
+    Caches go to the directory that the ``LANGKIT_CACHE_DIR`` environment
+    variable designates (setting it to an empty string disables them), or to
+    "langkit" in the XDG cache directory by default. Entries in these caches
+    must be keyed by the digest of everything that they depend on, so that
+    concurrent runs never disagree on their content.
+    """
+    root = os.environ.get('LANGKIT_CACHE_DIR')
+    if root is None:
+        root = os.path.join(
+            os.environ.get('XDG_CACHE_HOME')
+            or os.path.join(os.path.expanduser('~'), '.cache'),
+            'langkit'
+        )
+    elif not root:
+        return None
+    return os.path.join(root, name)
+
+
+unused_cache_entry_max_age = 7 * 24 * 3600
+"""
+Number of seconds after which unused subdirectories of user caches are
+removed. See ``use_cache_subdirectory``.
+"""
+
+
+def use_cache_subdirectory(cache_dir: str, key: str) -> Optional[str]:
+    """
+    Return the ``key`` subdirectory of the ``cache_dir`` user cache, creating
+    it if needed, or None if it cannot be written to.
+
+    Record that this subdirectory is in use and remove the other
+    subdirectories of ``cache_dir`` that were not used for
+    ``unused_cache_entry_max_age`` seconds, so that caches keyed by the digest
+    of their inputs do not grow forever.
+    """
+    result = os.path.join(cache_dir, key)
+    try:
+        os.makedirs(result, exist_ok=True)
+        os.utime(result)
+    except OSError:
+        return None
+    if not os.access(result, os.W_OK):
+        return None
+
+    deadline = time.time() - unused_cache_entry_max_age
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if path == result:
+            continue
+        try:
+            unused = os.stat(path).st_mtime < deadline
+        except OSError:
+            # Another process may have removed it already
+            continue
+        if unused:
+            shutil.rmtree(path, ignore_errors=True)
+
+    return result
+
+
+def write_file_atomically(file_path: str, content: bytes) -> None:
+    """
+    Write ``content`` to the ``file_path`` file, so that other processes never
+    see a partially written file: write a temporary file in the same directory
+    first, and then rename it to ``file_path``.
+    """
+    tmp_path = '{}.{}.tmp'.format(file_path, os.getpid())
+    # Let the umask determine the permissions of the new file, just like for
+    # regular file creation.
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 class Cache:
@@ -9,53 +124,185 @@ class Cache:
 
     Generating and building libraries can be quite long. This cache class is an
     attempt to reduce the time to do this.
+
+    The cache keeps track of files: for each one, it records the digest of its
+    content, the size and modification time it had when the digest was
+    computed and, optionally, a digest for the inputs that were used to produce
+    it. Comparing file stats is enough to tell whether a file was left
+    untouched, so files do not need to be read again to check them.
+
+    Entries are stored as separate small files in the cache directory, named
+    after the digest of the file they describe: loading them is lazy and saving
+    the cache only writes the entries that changed.
     """
 
-    db: Dict[str, str]
+    db: Dict[str, Optional[dict]]
 
-    def __init__(self, cache_file: str) -> None:
-        """Load the cache from `cache_file`, or create a new cache if new.
+    def __init__(self, cache_dir: str) -> None:
+        """Create a cache whose entries are stored in `cache_dir`.
 
-        :param cache_file: Name of the file that contains cache data from
-            another run.
+        :param cache_dir: Name of the directory that contains cache data from
+            another run. It is created if needed on `save`.
         """
-        self.cache_file = cache_file
-        self._load()
+        self.cache_dir = cache_dir
 
-    def _load(self) -> None:
+        self.db = {}
+        """
+        Cache entries loaded so far (None for entries that do not exist).
+        """
+
+        self._dirty: Set[str] = set()
+        """
+        Keys for the entries that need to be written on `save`.
+        """
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir,
+                            content_digest(key.encode('utf-8')))
+
+    def _lookup(self, key: str) -> Optional[dict]:
+        try:
+            return self.db[key]
+        except KeyError:
+            pass
+
+        entry = None
         try:
-            f = open(self.cache_file, 'r')
-        except IOError:
-            self.db = {}
+            with open(self._entry_path(key), 'r') as f:
+                entry = json.load(f)
+        except (IOError, ValueError):
+            pass
         else:
-            with f:
-                self.db = json.load(f)
+            # Discard entries for other files that happen to have the same
+            # name digest.
+            if entry.get('key') != key:
+                entry = None
 
-    def is_stale(self, key: str, content: str) -> bool:
-        """Return whether the `key` cache entry is staled.
+        self.db[key] = entry
+        return entry
 
-        The first time this is called for some `key`, always return False. The
-        next times, return whether `content` is the same as the previous time.
+    def _record(self, file_path: str, digest: str,
+                inputs: Optional[str]) -> None:
+        st = os.stat(file_path)
+        self.db[file_path] = {
+            'key': file_path,
+            'digest': digest,
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'inputs': inputs,
+        }
+        self._dirty.add(file_path)
 
-        :param str key: Key for the cache entry to test.
-        :param str content: Content for the cache entry to test.
-        :rtype: bool
+    def _entry_matches_file(self, entry: Optional[dict],
+                            file_path: str) -> bool:
         """
-        m = hashlib.md5()
-        m.update(content.encode('utf-8'))
-        new_hash = m.hexdigest()
-
+        Return whether ``entry`` describes the current state of ``file_path``.
+        """
+        if entry is None:
+            return False
         try:
-            old_hash = self.db[key]
-        except KeyError:
-            stale = True
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        return (st.st_size == entry['size']
+                and st.st_mtime_ns == entry['mtime_ns'])
+
+    def file_digest(self, file_path: str) -> str:
+        """
+        Return the digest of the content of the ``file_path`` file. The file
+        is read only if it has changed since the last time its digest was
+        computed.
+        """
+        entry = self._lookup(file_path)
+        if self._entry_matches_file(entry, file_path):
+            assert entry is not None
+            return entry['digest']
+
+        with open(file_path, 'rb') as f:
+            digest = content_digest(f.read())
+        self._record(file_path, digest,
+                     entry['inputs'] if entry is not None else None)
+        return digest
+
+    def files_digest(self, file_paths: Iterable[str]) -> str:
+        """
+        Return a digest for the names and contents of all the given files.
+        """
+        h = new_hasher()
+        for f in sorted(set(file_paths)):
+            h.update(f.encode('utf-8'))
+            h.update(self.file_digest(f).encode('ascii'))
+        return h.hexdigest()
+
+    def is_up_to_date(self, file_path: str, inputs: str) -> bool:
+        """
+        Return whether the ``file_path`` file was last written from the given
+        inputs and was not modified since then. In that case, the caller can
+        skip producing its content altogether.
+
+        :param file_path: Name of the file to check.
+        :param inputs: Digest for all the inputs used to produce the content of
+            this file.
+        """
+        entry = self._lookup(file_path)
+        return (entry is not None
+                and entry['inputs'] == inputs
+                and self._entry_matches_file(entry, file_path))
+
+    def write_file(self, file_path: str, content: bytes,
+                   inputs: Optional[str] = None) -> bool:
+        """
+        Write ``content`` to the ``file_path`` file unless it already has this
+        content, so that its modification time is preserved in that case.
+        Return whether the file has been written.
+
+        :param file_path: Name of the file to write.
+        :param content: Content to write.
+        :param inputs: If provided, digest for all the inputs used to produce
+            ``content``. See `is_up_to_date`.
+        """
+        digest = content_digest(content)
+        entry = self._lookup(file_path)
+
+        if self._entry_matches_file(entry, file_path):
+            assert entry is not None
+            stale = entry['digest'] != digest
         else:
-            stale = old_hash != new_hash
+            # We have no trustworthy information about this file: look at its
+            # actual content.
+            try:
+                with open(file_path, 'rb') as f:
+                    stale = content_digest(f.read()) != digest
+            except IOError:
+                stale = True
 
-        self.db[key] = new_hash
+        if stale:
+            write_file_atomically(file_path, content)
+        if stale or entry is None or entry['inputs'] != inputs:
+            self._record(file_path, digest, inputs)
         return stale
 
+    def accept_changes(self, file_path: str) -> None:
+        """
+        Consider that the current content of the ``file_path`` file is
+        equivalent to the content it was last written with. This is useful
+        when a code formatter reformats a file right after it is written: the
+        next runs can then compare new content to what was written instead of
+        to the formatted file.
+        """
+        entry = self._lookup(file_path)
+        assert entry is not None
+        self._record(file_path, entry['digest'], entry['inputs'])
+
     def save(self) -> None:
-        """Save the content of the cache to a file."""
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.db, f)
+        """Write all the cache entries that changed to the cache directory."""
+        # Caches from older versions used to be a single file
+        if os.path.isfile(self.cache_dir):
+            os.remove(self.cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        for key in sorted(self._dirty):
+            entry = self.db[key]
+            write_file_atomically(self._entry_path(key),
+                                  json.dumps(entry).encode('utf-8'))
+        self._dirty.clear()
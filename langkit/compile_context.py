@@ -30,6 +30,7 @@ from langkit.diagnostics import (
     Context, Location, Severity, WarningSet, check_source_language,
     context_stack, error, print_error, print_error_from_sem_result
 )
+from langkit.perfect_hash import PerfectHash
 from langkit.utils import (TopologicalSortError, collapse_concrete_nodes,
                            memoized, memoized_with_default, topological_sort)
 
@@ -37,7 +38,7 @@ from langkit.utils import (TopologicalSortError, collapse_concrete_nodes,
 if TYPE_CHECKING:
     from langkit.compiled_types import StructType, UserField
     from langkit.ocaml_api import OCamlAPISettings
-    from langkit.passes import AbstractPass
+    from langkit.passes import AbstractPass, PassProfiler
     from langkit.python_api import PythonAPISettings
 
 
@@ -309,7 +310,8 @@ class CompileCtx:
                  show_property_logging=False,
                  lkt_file=None,
                  types_from_lkt=False,
-                 lkt_semantic_checks=False):
+                 lkt_semantic_checks=False,
+                 default_memo_strategy=None):
         """Create a new context for code emission.
 
         :param str lang_name: string (mixed case and underscore: see
@@ -391,9 +393,15 @@ class CompileCtx:
 
         :param bool lkt_semantic_checks: Whether to force Lkt semantic checks
             (by default, enabled only if ``types_from_lkt`` is true).
+
+        :param langkit.parsers.MemoStrategy|None default_memo_strategy:
+            Memoization strategy for the packrat tables of parsing rules that
+            do not override it (see ``Grammar.set_memo_strategies``). If left
+            to None, use 16-entry ring tables.
         """
         from langkit.python_api import PythonAPISettings
         from langkit.ocaml_api import OCamlAPISettings
+        from langkit.parsers import MemoStrategy
         from langkit.unparsers import Unparsers
 
         self.lang_name = names.Name(lang_name)
@@ -446,6 +454,26 @@ class CompileCtx:
 
         self.ocaml_api_settings = OCamlAPISettings(self, self.c_api_settings)
 
+        self.default_memo_strategy = (default_memo_strategy
+                                      or MemoStrategy.ring())
+        """
+        Memoization strategy for rules that do not override it.
+
+        :type: langkit.parsers.MemoStrategy
+        """
+
+        self.pass_profiler: Optional[PassProfiler] = None
+        """
+        If profiling of passes is enabled, object to collect resource usage
+        for each pass (see ``create_all_passes``).
+        """
+
+        self.pass_profile_file: Optional[str] = None
+        """
+        If profiling of passes is enabled, name of the file in which to write
+        profiling results (as JSON).
+        """
+
         self.fns = set()
         """
         Set of names (names.Name instances) for all generated parser
@@ -613,6 +641,16 @@ class CompileCtx:
         :type: dict[str, names.Name]
         """
 
+        self.symbol_literals_perfect_hash = None
+        """
+        Minimal perfect hash function for symbol literals, used to look them
+        up in symbol tables without going through the generic hash table. Keys
+        are sorted in the same order as "sorted_symbol_literals". This is None
+        until one calls the finalize_symbol_literals method.
+
+        :type: langkit.perfect_hash.PerfectHash
+        """
+
         self._symbol_literals = set()
         """
         Temporary container for all symbol literal candidates. This is used
@@ -1658,6 +1696,7 @@ class CompileCtx:
         default_max_call_depth: int = 1000,
         plugin_passes: List[Union[str, AbstractPass]] = [],
         strict_sound_envs: bool = False,
+        profile_passes: Optional[str] = None,
         **kwargs
     ) -> None:
         """
@@ -1696,6 +1735,11 @@ class CompileCtx:
         :param bool strict_sound_envs: Whether to enable the strict behavior
             for sound environments.
 
+        :param profile_passes: If provided, record wall time, CPU time and
+            memory usage for each pass (and for each item that passes iterate
+            on), print a summary table when done running passes and write all
+            results as JSON to the file this designates.
+
         See ``langkit.emitter.Emitter``'s constructor for other supported
         keyword arguments.
         """
@@ -1711,6 +1755,11 @@ class CompileCtx:
 
         self.check_only = check_only
 
+        if profile_passes:
+            from langkit.passes import PassProfiler
+            self.pass_profiler = PassProfiler()
+            self.pass_profile_file = profile_passes
+
         if kwargs.get('coverage', False):
             self.gnatcov = GNATcov(self)
 
@@ -1752,6 +1801,22 @@ class CompileCtx:
                     self.emitter.cache.save()
             finally:
                 self.emitter = None
+                if self.pass_profiler is not None:
+                    self.report_pass_profiles()
+
+    def report_pass_profiles(self):
+        """
+        Print the summary of resources used by passes and write detailed
+        results to the profiling output file.
+        """
+        assert self.pass_profiler is not None
+        assert self.pass_profile_file is not None
+        print(self.pass_profiler.report())
+        dirname = os.path.dirname(self.pass_profile_file)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self.pass_profiler.write_json(self.pass_profile_file)
+        print('Passes profile written to {}'.format(self.pass_profile_file))
 
     def lower_lkt(self):
         """
@@ -1917,6 +1982,8 @@ class CompileCtx:
             GrammarPass('check main parsing rule', Grammar.check_main_rule),
             GrammarPass('warn on unreferenced parsing rules',
                         Grammar.warn_unreferenced_parsing_rules),
+            GrammarPass('check memoization strategies',
+                        Grammar.check_memo_strategies),
             EnvSpecPass('create internal properties for env specs',
                         EnvSpec.create_properties,
                         iter_metaclass=True),
@@ -2171,6 +2238,10 @@ class CompileCtx:
 
             self.symbol_literals[name] = candidate_name
 
+        self.symbol_literals_perfect_hash = PerfectHash(
+            [sym for sym, _ in self.sorted_symbol_literals]
+        )
+
     def annotate_fields_types(self):
         """
         Modify the Python files where the node types are defined, to annotate
@@ -2791,6 +2862,18 @@ class CompileCtx:
         )
         return has_keys
 
+    @property
+    def sorted_memoized_properties(self):
+        """
+        Return the list of memoized properties, sorted by qualified name. This
+        is the order of the ``Mmz_Property`` enumeration in the generated
+        library, and thus the order used to index memoized properties in the
+        public APIs.
+
+        :rtype: list[langkit.expressions.base.PropertyDef]
+        """
+        return sorted(self.memoized_properties, key=lambda p: p.qualname)
+
     def check_memoized(self):
         """
         Check that various invariants for memoized properties are respected.
@@ -7,10 +7,13 @@ from __future__ import annotations
 from collections import OrderedDict
 import glob
 import json
+import multiprocessing
 import os.path
 import shutil
 import subprocess
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from typing import (
+    Dict, Iterator, List, Optional, Set, TYPE_CHECKING, Tuple
+)
 import xml.etree.ElementTree as etree
 
 from langkit.gdb.debug_info import DebugInfo, ExprStart
@@ -60,7 +63,7 @@ class InstrumentationMetadata:
     Magic string to identify the metadata file format.
     """
 
-    CURRENT_VERSION = 1
+    CURRENT_VERSION = 2
     """
     Version number for the metadata file format. Used to clearly reject
     obsolete metadata files instead of waiting for obscure errors happening.
@@ -70,6 +73,12 @@ class InstrumentationMetadata:
         self.additional_sources: Set[str] = set()
         self.generated_sources: Set[str] = set()
 
+        self.sources_digest: Optional[str] = None
+        """
+        Digest for the sources that were instrumented, if known. See
+        ``GNATcov.instrument``.
+        """
+
     @staticmethod
     def _filename(instr_dir: str) -> str:
         return os.path.join(instr_dir, 'instr-metadata.json')
@@ -81,6 +90,7 @@ class InstrumentationMetadata:
                 'type': self.MAGIC,
                 'additional_sources': list(self.additional_sources),
                 'generated_sources': list(self.generated_sources),
+                'sources_digest': self.sources_digest,
             }, f)
 
     @classmethod
@@ -101,6 +111,7 @@ class InstrumentationMetadata:
 
         result.additional_sources.update(md['additional_sources'])
         result.generated_sources.update(md['generated_sources'])
+        result.sources_digest = md['sources_digest']
         return result
 
 
@@ -236,9 +247,33 @@ class CoverageReport:
             produced the XML report.
         """
 
-        def load_xml(filename: str) -> etree.Element:
-            with open(os.path.join(xml_dir, filename), 'r') as f:
-                return etree.parse(f).getroot()
+        def iter_xml(
+            filename: str,
+            path: Tuple[Optional[str], ...]
+        ) -> Iterator[etree.Element]:
+            """
+            Parse the ``filename`` XML file incrementally and yield all the
+            elements that ``path`` designates.
+
+            ``path`` contains the tags of the elements to go through from the
+            document root, None matching any tag. Yielded elements are cleared
+            once the caller is done with them, so that memory consumption does
+            not depend on the size of the XML file.
+            """
+            stack: List[str] = []
+            with open(os.path.join(xml_dir, filename), 'rb') as f:
+                for event, elt in etree.iterparse(f, events=('start', 'end')):
+                    if event == 'start':
+                        stack.append(elt.tag)
+                        continue
+
+                    if len(stack) == len(path) and all(
+                        expected is None or tag == expected
+                        for tag, expected in zip(stack, path)
+                    ):
+                        yield elt
+                        elt.clear()
+                    stack.pop()
 
         def get_child(root: etree.Element, tag: str) -> etree.Element:
             for child in root:
@@ -249,18 +284,17 @@ class CoverageReport:
         result: List[CoverageReport.File] = []
 
         # Get the list of file reports from the index file
-        index = load_xml('index.xml')
-        assert index.tag == 'document'
-        summary = get_child(get_child(index, 'coverage_report'),
-                            'coverage_summary')
-        files = [f.attrib['name'] for f in summary if f.tag == 'file']
+        files = [f.attrib['name'] for f in iter_xml(
+            'index.xml',
+            ('document', 'coverage_report', 'coverage_summary', 'file')
+        )]
 
         # Read the coverage report for each file
         for f in files:
             file_report = CoverageReport.File(f)
 
             # Parse all lines
-            for src_mapping in load_xml(f + '.xml'):
+            for src_mapping in iter_xml(f + '.xml', (None, 'src_mapping')):
                 xml_line = get_child(get_child(src_mapping, 'src'), 'line')
                 line = CoverageReport.Line(int(xml_line.attrib['num']),
                                            xml_line.attrib['src'],
@@ -279,7 +313,15 @@ class CoverageReport:
 
         return result
 
-    def render(self, output_dir: str) -> None:
+    def render(self, output_dir: str, jobs: int = 1) -> None:
+        """
+        Write the HTML coverage report in ``output_dir``.
+
+        :param jobs: Maximum number of worker processes to use in order to
+            render per-file pages concurrently.
+        """
+        global _file_pages
+
         def out_path(filename: str) -> str:
             return os.path.join(output_dir, os.path.basename(filename))
 
@@ -293,12 +335,45 @@ class CoverageReport:
         with open(out_path('index.html'), 'w') as f:
             f.write(r.render('coverage/index_html'))
 
-        # Output one page per reported file
-        for group in self.groups.values():
-            for src_file in group.files.values():
-                report_filename = out_path(src_file.html_file)
-                with open(report_filename, 'w') as f:
-                    f.write(r.render('coverage/file_html', src_file=src_file))
+        # Output one page per reported file. Workers inherit the report from
+        # this process, so use them only when forking is available.
+        _file_pages = [
+            (r, src_file, out_path(src_file.html_file))
+            for group in self.groups.values()
+            for src_file in group.files.values()
+        ]
+        try:
+            if (
+                jobs <= 1
+                or len(_file_pages) <= 1
+                or 'fork' not in multiprocessing.get_all_start_methods()
+            ):
+                for i in range(len(_file_pages)):
+                    _render_file_page(i)
+            else:
+                with multiprocessing.get_context('fork').Pool(
+                    min(jobs, len(_file_pages))
+                ) as pool:
+                    pool.map(_render_file_page, range(len(_file_pages)))
+        finally:
+            _file_pages = []
+
+
+_file_pages: List[Tuple[Renderer, CoverageReport.File, str]] = []
+"""
+During calls to ``CoverageReport.render``, renderer, coverage report and
+output filename for each per-file page to render.
+"""
+
+
+def _render_file_page(index: int) -> None:
+    """
+    Render the page for the file coverage report at ``index`` in
+    ``_file_pages``.
+    """
+    r, src_file, filename = _file_pages[index]
+    with open(filename, 'w') as f:
+        f.write(r.render('coverage/file_html', src_file=src_file))
 
 
 class PropertyDSLCoverage:
@@ -552,7 +627,35 @@ class GNATcov:
 
         Put SID files in the ``$BUILD_DIR/obj/$LIBNAME/sids`` directory
         (removed and created if needed).
+
+        "gnatcov instrument" processes units concurrently if the emitter was
+        asked to use multiple jobs. Unless the render cache is disabled,
+        instrumentation is skipped altogether when the sources to instrument
+        did not change since the previous run.
         """
+        default_build_mode = 'dev'
+        project_instr_dir = '{}-gnatcov-instr'.format(emitter.lib_name_low)
+        lib_obj_dir = os.path.join(emitter.lib_root, 'obj', default_build_mode)
+        instr_src_dir = os.path.join(
+            emitter.lib_root, 'obj', project_instr_dir
+        )
+        lib_src_dir = os.path.join(emitter.lib_root, 'include',
+                                   emitter.lib_name_low)
+
+        emitter.instr_md.sources_digest = self._sources_digest(emitter,
+                                                               lib_src_dir)
+        if emitter.render_cache and os.path.isdir(instr_src_dir):
+            try:
+                previous_md = InstrumentationMetadata.load(instr_dir)
+            except (IOError, ValueError, KeyError):
+                pass
+            else:
+                if (
+                    previous_md.sources_digest
+                    == emitter.instr_md.sources_digest
+                ):
+                    return
+
         ensure_clean_dir(instr_dir)
 
         subprocess.check_call([
@@ -560,28 +663,20 @@ class GNATcov:
             '--level', self.covlevel,
             '-P', emitter.main_project_file,
             '--no-subprojects',
+            '-j{}'.format(emitter.jobs),
             '-X{}_COVINSTR=true'.format(emitter.lib_name_up)
         ])
 
-        default_build_mode = 'dev'
-        project_instr_dir = '{}-gnatcov-instr'.format(emitter.lib_name_low)
-
         # At this point, instrumented sources are located in the object
         # directory, which depends on the build mode: relocate it somewhere
         # else (i.e. rename to instr_src_dir) so that the same set of
         # instrumented sources applies to all builds.
-        lib_obj_dir = os.path.join(emitter.lib_root, 'obj', default_build_mode)
-        instr_src_dir = os.path.join(
-            emitter.lib_root, 'obj', project_instr_dir
-        )
         if os.path.exists(instr_src_dir):
             shutil.rmtree(instr_src_dir)
         os.rename(os.path.join(lib_obj_dir, project_instr_dir), instr_src_dir)
 
         # "gnatcov instrument" instruments only Ada sources, so we need to
         # manually copy the C sources (if any).
-        lib_src_dir = os.path.join(emitter.lib_root, 'include',
-                                   emitter.lib_name_low)
         for pattern in ('*.c', '*.h'):
             for filename in glob.glob(os.path.join(lib_src_dir, pattern)):
                 copy_to_dir(filename, instr_src_dir)
@@ -613,6 +708,29 @@ class GNATcov:
         # Create instrumentation metadata
         emitter.instr_md.save(instr_dir)
 
+    def _sources_digest(self, emitter: Emitter, lib_src_dir: str) -> str:
+        """
+        Helper for instrument. Return a digest for everything instrumentation
+        depends on: the version of GNATcoverage, the coverage level and the
+        names and contents of the sources to instrument.
+        """
+        from langkit.caching import new_hasher
+
+        files = {emitter.main_project_file}
+        files.update(emitter.context.additional_source_files)
+        for pattern in ('*.adb', '*.ads'):
+            files.update(glob.glob(os.path.join(emitter.src_dir, pattern)))
+        for pattern in ('*.c', '*.h'):
+            files.update(glob.glob(os.path.join(lib_src_dir, pattern)))
+
+        h = new_hasher()
+        h.update(subprocess.check_output(['gnatcov', '--version']))
+        h.update(self.covlevel.encode('ascii'))
+        h.update(emitter.cache.files_digest(
+            os.path.abspath(f) for f in files
+        ).encode('ascii'))
+        return h.hexdigest()
+
     def _generate_xml_report(self,
                              instr_dir: str,
                              traces: List[str],
@@ -654,7 +772,8 @@ class GNATcov:
                                title: str,
                                instr_dir: str,
                                xml_dir: str,
-                               output_dir: str) -> None:
+                               output_dir: str,
+                               jobs: int) -> None:
         """
         Helper for generate_report. Load GNATcoverage's XML report and produce
         our final coverage report.
@@ -681,14 +800,15 @@ class GNATcov:
             PropertyDSLCoverage(f, orig_sources)
 
         # Output the final report
-        report.render(output_dir)
+        report.render(output_dir, jobs)
 
     def generate_report(self,
                         title: str,
                         instr_dir: str,
                         traces: List[str],
                         output_dir: str,
-                        working_dir: str) -> None:
+                        working_dir: str,
+                        jobs: int = 1) -> None:
         """
         Generate a HTML coverage report.
 
@@ -701,9 +821,12 @@ class GNATcov:
             output the coverage report. Beware, this removes this directory if
             it exists.
         :param str working_dir: Temporary directory.
+        :param int jobs: Maximum number of processes to use in order to render
+            the HTML report.
         """
         # Make sure we start with a clean output directory
         ensure_clean_dir(output_dir)
 
         xml_dir = self._generate_xml_report(instr_dir, traces, working_dir)
-        self._generate_final_report(title, instr_dir, xml_dir, output_dir)
+        self._generate_final_report(title, instr_dir, xml_dir, output_dir,
+                                    jobs)
@@ -23,11 +23,16 @@ All templates can use the "lang" parameter, which contains "ada", "c" or
 
 from __future__ import annotations
 
+import json
+import os.path
 import textwrap
+import types
 from typing import (Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING,
                     Tuple, Union, cast)
 
-from mako.template import Template
+import mako
+from mako.exceptions import MakoException
+from mako.template import ModuleTemplate, Template
 
 
 if TYPE_CHECKING:
@@ -41,9 +46,50 @@ else:
     Protocol = object
 
 
+def compile_template(text: str, cache_dir: Optional[str] = None) -> Template:
+    """
+    Compile the ``text`` documentation Mako template.
+
+    If ``cache_dir`` is provided, look for the Python code that Mako generates
+    for ``text`` in this directory before compiling it, and save it there
+    otherwise.
+
+    :param text: Source for the Mako template.
+    :param cache_dir: Directory for compiled templates. Entries are keyed by
+        the digest of the template source and the Mako version.
+    """
+    if cache_dir is None:
+        return Template(text)
+
+    from langkit.caching import content_digest, write_file_atomically
+
+    digest = content_digest(
+        '{}\n{}'.format(mako.__version__, text).encode('utf-8')
+    )
+    filename = os.path.join(cache_dir, '{}.py'.format(digest))
+
+    try:
+        with open(filename, 'r') as f:
+            code = f.read()
+    except IOError:
+        code = Template(text).code
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            write_file_atomically(filename, code.encode('utf-8'))
+        except OSError:
+            # The cache is just an optimization: ignore write errors
+            pass
+
+    module = types.ModuleType('langkit_doc_{}'.format(digest))
+    exec(compile(code, filename, 'exec'), module.__dict__)
+    return ModuleTemplate(module, template_source=text)
+
+
 class DocDatabase:
     """
     Database for documentation entries.
+
+    Templates are compiled only the first time they are used.
     """
 
     def __init__(self, dict: Dict[str, str]) -> None:
@@ -52,19 +98,99 @@ class DocDatabase:
         Documentation database.
         """
 
+        self._templates: Dict[str, Template] = {}
+        """
+        Compiled templates for the documentation entries used so far.
+        """
+
+        self._text_templates: Dict[str, Template] = {}
+        """
+        Compiled templates for documentation that does not come from entries.
+        See the ``compile`` method.
+        """
+
         self._used: Set[str] = set()
         """
         Set of names for documentation database that were actually used.
         """
 
-    def __getitem__(self, key: str) -> str:
+        self.cache_dir = self._cache_subdirectory()
+        """
+        If not None, directory in which to cache compiled templates. See
+        ``compile_template``.
+        """
+
+    def _cache_subdirectory(self) -> Optional[str]:
+        """
+        Return the directory in which to cache compiled templates, or None if
+        they must not be cached.
+
+        This directory is keyed by the digest of the Mako version and of all
+        documentation entries, so that directories for entries that are no
+        longer used (for instance after an upgrade of Langkit) are eventually
+        evicted, just like for code generation templates.
+        """
+        from langkit.caching import (content_digest, use_cache_subdirectory,
+                                     user_cache_dir)
+
+        cache_dir = user_cache_dir('doc_templates')
+        if cache_dir is None:
+            return None
+        digest = content_digest(
+            json.dumps([mako.__version__, sorted(self._dict.items())])
+            .encode('utf-8')
+        )
+        return use_cache_subdirectory(cache_dir, digest)
+
+    def __getitem__(self, key: str) -> Template:
         self._used.add(key)
-        return self._dict[key]
+        return self._compile_entry(key)
+
+    def _compile_entry(self, key: str) -> Template:
+        """
+        Return the compiled template for the ``key`` documentation entry,
+        compiling it if this is the first time it is requested.
+        """
+        try:
+            return self._templates[key]
+        except KeyError:
+            result = compile_template(self._dict[key], self.cache_dir)
+            self._templates[key] = result
+            return result
+
+    def compile(self, text: str) -> Template:
+        """
+        Return the compiled template for ``text``, for documentation that does
+        not come from a documentation entry (for instance the docstring of a
+        node). Like for entries, compile it only the first time.
+        """
+        try:
+            return self._text_templates[text]
+        except KeyError:
+            result = compile_template(text, self.cache_dir)
+            self._text_templates[text] = result
+            return result
+
+    @property
+    def used_entries(self) -> Set[str]:
+        """
+        Return the set of names for documentation entries used so far.
+        """
+        return set(self._used)
+
+    def mark_used(self, keys: Set[str]) -> None:
+        """
+        Consider that all documentation entries in ``keys`` have been used.
+        """
+        self._used.update(keys)
 
     def report_unused(self) -> None:
         """
         Report all documentation entries that have not been used on the
         standard output. Either they should be used, or they should be removed.
+
+        Since templates are compiled only when used, also compile all the
+        other entries to report the ones that are not valid Mako templates.
         """
         unused = set(self._dict) - self._used
         if unused:
@@ -73,6 +199,18 @@ class DocDatabase:
             for k in sorted(unused):
                 print('   ', k)
 
+        invalid: List[Tuple[str, str]] = []
+        for k in sorted(unused):
+            try:
+                self._compile_entry(k)
+            except MakoException as exc:
+                invalid.append((k, str(exc)))
+        if invalid:
+            print('The following documentation entries are not valid'
+                  ' templates:')
+            for k, msg in invalid:
+                print('    {}: {}'.format(k, msg))
+
 
 def instantiate_templates(doc_dict: Dict[str, str]) -> DocDatabase:
     """
@@ -80,7 +218,7 @@ def instantiate_templates(doc_dict: Dict[str, str]) -> DocDatabase:
 
     :param doc_dict: Documentation database to convert.
     """
-    return DocDatabase({key: Template(val) for key, val in doc_dict.items()})
+    return DocDatabase(dict(doc_dict))
 
 
 base_langkit_docs = {
@@ -315,6 +453,95 @@ base_langkit_docs = {
         relations.  If ``Timeout`` is zero, disable the timeout. By default,
         the timeout is ``100 000`` steps.
     """,
+    'langkit.context_set_lookup_cache_budget': """
+        Limit to ``Max_Memory`` bytes the estimated memory used by the caches
+        for lexical environment lookups in all the units of this context. When
+        the limit is exceeded, cache entries that were not used recently are
+        evicted (CLOCK algorithm). If ``Max_Memory`` is zero, which is the
+        default, caches are not limited.
+
+        Memory usage is only an estimation: it accounts for cache keys and
+        lookup results, not for the overhead of the underlying hash maps.
+    """,
+    'langkit.context_get_lookup_cache_stats': """
+        Return the counters for the caches of lexical environment lookups in
+        all the units of this context: number of cache hits, misses and
+        evictions since the creation of the context, and number of entries
+        and their estimated memory usage (in bytes) currently in the caches.
+    """,
+    'langkit.memoization_policy_kind': """
+        Policy for the memoization of a property:
+
+        * ``Unbounded``: memoize all results (the default).
+
+        * ``LRU``: memoize results, but keep at most ``Max_Entries`` of them in
+          the whole analysis context, evicting the least recently used ones
+          first.
+
+        * ``Disabled``: do not memoize results. Note that this also disables
+          the detection of infinite recursions that memoization provides.
+    """,
+    'langkit.memoization_stats': """
+        Statistics for the memoization of a property in an analysis context:
+        number of calls whose result was found in memoization tables (hits),
+        number of calls whose result had to be computed (misses), number of
+        entries currently in memoization tables and estimation of the memory
+        (in bytes) they use.
+    """,
+    'langkit.memoized_property_count': """
+        Return the number of memoized properties in this language.
+    """,
+    'langkit.memoized_property_name': """
+        Return the qualified name (``Node_Type.property_name``) for the
+        memoized property at index ``Property`` (1-based).
+        % if lang == 'c':
+        The result must be free'd with the ``free`` function.
+        % endif
+    """,
+    'langkit.memoized_properties': """
+        Return the list of qualified names (``NodeType.property_name``) for
+        all memoized properties in this language.
+    """,
+    'langkit.context_set_memoization_policy': """
+        % if lang == 'python':
+        Set the memoization policy for the memoized property called
+        ``property_name`` (see ``memoized_properties``), or for all memoized
+        properties if ``property_name`` is None. ``kind`` must be ``"unbounded"``
+        (memoize all results, the default), ``"lru"`` (keep at most
+        ``max_entries`` results in the whole context, evicting the least
+        recently used ones first) or ``"disabled"``.
+        % elif lang == 'c':
+        Set the memoization policy for the memoized property at index
+        ``property`` (1-based), or for all memoized properties if ``property``
+        is 0. ``kind`` is 0 for an unbounded memoization (the default), 1 for
+        a LRU memoization that keeps at most ``max_entries`` results in the
+        whole context, and 2 to disable memoization.
+        % else:
+        Use ``Policy`` for the memoization of all memoized properties in
+        ``Context``.
+        % endif
+
+        Memoization entries are evicted immediately if needed to honor the new
+        policy.
+    """,
+    'langkit.context_set_property_memoization_policy': """
+        Use ``Policy`` for the memoization of the memoized property at index
+        ``Property`` in ``Context``. Memoization entries are evicted
+        immediately if needed to honor the new policy.
+    """,
+    'langkit.context_memoization_stats': """
+        % if lang == 'python':
+        Return a dict that associates memoization statistics to the qualified
+        names of all memoized properties.
+        % elif lang == 'c':
+        Store in ``*stats`` memoization statistics for the memoized property
+        at index ``property`` (1-based).
+        % else:
+        Return memoization statistics for the memoized property at index
+        ``Property``.
+        % endif
+        Hits and misses are counted since the creation of the context.
+    """,
 
     'langkit.get_unit_from_file': """
         Create a new analysis unit for ``Filename`` or return the existing one
@@ -414,6 +641,35 @@ base_langkit_docs = {
         Return the number of trivias in this unit. This is 0 for units that
         were parsed with trivia analysis disabled.
     """,
+    'langkit.token_columns': """
+        Set of columns to export token data in bulk: each non-null member must
+        point to an array that can hold as many items as the number of tokens
+        to export.
+
+        ``kinds`` receives token kinds, ``start_offsets`` and ``end_offsets``
+        receive the bounds of the token texts, as offsets (in characters, end
+        bound excluded) in the text of the unit. ``start_lines``,
+        ``start_columns``, ``end_lines`` and ``end_columns`` receive source
+        location ranges and ``is_trivia`` receives 1 for trivias and 0 for
+        tokens.
+    """,
+    'langkit.unit_export_tokens': """
+        % if lang == 'python':
+        Return data for the tokens and trivias of this unit, in the same order
+        as ``iter_tokens``, as a ``TokenColumns`` instance. ``start`` and
+        ``stop`` restrict the export to a range of this sequence, with the
+        same semantics as for slices.
+
+        This is much faster than iterating on tokens when processing many
+        tokens, as data for all tokens is fetched in a single call.
+        % else:
+        Store data for at most ``count`` tokens and trivias from ``unit``,
+        starting with the one at index ``first`` (0-based, in the sequence of
+        tokens and trivias of the unit), into the arrays that ``columns``
+        designate. Null members in ``columns`` are ignored. Return the number
+        of exported tokens, or -1 if there was an error.
+        % endif
+    """,
     'langkit.unit_text': """
         Return the source buffer associated to this unit.
     """,
@@ -504,6 +760,62 @@ base_langkit_docs = {
         Return the Nth child for in this node's fields and store it into
         *CHILD_P.  Return zero on failure (when N is too big).
     """,
+    'langkit.node_find_all': """
+        Traverse the subtree rooted at ``Node`` (excluding ``Node`` itself) in
+        prefix order and store all the nodes whose kind is one of the
+        ``Kinds_Count`` kinds in the ``Kinds`` array into a new array in
+        *RESULT_P. If ``Max_Count`` is not zero, stop the traversal as soon as
+        ``Max_Count`` nodes are found. Return zero on failure.
+
+        This is equivalent to (but much faster than) a traversal using the
+        ``node_children_count`` and ``node_child`` functions.
+    """,
+    'langkit.serialization_format': """
+        Format for the serialization of syntax trees:
+
+        * ``JSON_Format``: JSON representation of the tree. List nodes are
+          represented as arrays of their non-null children, and other nodes as
+          objects that map the names of their non-null syntax fields (as
+          exposed in the Python API) to their values. This is the format that
+          the ``to_json`` method of the Python API returns.
+
+        * ``Binary_Format``: compact representation where each node is encoded
+          as a sequence of unsigned LEB128 numbers: its kind (as exposed in
+          the C API), the indexes of its first and last tokens (0 for ghost
+          nodes), the number of its children, and then the encoding of each
+          child in order. Null nodes are encoded as a single 0.
+    """,
+    'langkit.node_serialize': """
+        % if lang == 'python':
+        Serialize the subtree rooted at this node. ``format`` can be
+        ``"json"`` (see ``to_json``) or ``"binary"``, a compact encoding
+        where each node is represented as a sequence of unsigned LEB128
+        numbers: its kind, the indexes of its first and last tokens (0 for
+        ghost nodes), its number of children followed by the encoding of each
+        child. Null children are encoded as a single 0.
+
+        If ``file`` is None, return the serialization as a bytes string.
+        Otherwise, ``file`` must be a file object or a file descriptor: write
+        the serialization to it directly and return None.
+        % elif lang == 'c':
+        Serialize the subtree rooted at ``node`` in the given ``format`` (0
+        for JSON, 1 for the compact binary encoding, see the
+        ``Serialization_Format`` type in the Ada API) to the ``size`` bytes
+        long ``buffer``. Return the size of the whole serialization: if it is
+        greater than ``size``, the output was truncated and this function must
+        be called again with a bigger buffer. Return 0 on failure.
+        % else:
+        Serialize the subtree rooted at ``Node`` in the given ``Format``,
+        passing the output to ``Write`` in successive chunks.
+        % endif
+
+        This is much faster than walking the tree through the node API.
+    """,
+    'langkit.node_serialize_to_fd': """
+        Serialize the subtree rooted at ``node`` in the given ``format`` (see
+        ``node_serialize``) and write the result to the ``fd`` file
+        descriptor. Return zero on failure.
+    """,
     'langkit.node_is_null': """
         Return whether this node is a null node reference.
     """,
@@ -769,6 +1081,9 @@ base_langkit_docs = {
         close Handle and return (Success => True). Otherwise, reparsing did not
         work, so keep Handle and its Context unchanged and return details about
         the error that happened.
+
+        Only units whose tree was actually modified are reparsed: the others
+        keep their current tree, so references to their nodes remain valid.
     """,
     'langkit.rewriting.unit_handles': """
         Return the list of unit rewriting handles in the given context handle
@@ -899,6 +1214,24 @@ base_langkit_docs = {
     'langkit.python.AnalysisUnit.iter_tokens': """
         Iterator over the tokens in an analysis unit.
     """,
+    'langkit.python.TokenColumns': """
+        Data for a sequence of tokens, stored in columns: ``kinds``,
+        ``start_offsets``, ``end_offsets`` (offsets in the text of the unit,
+        end bound excluded), ``start_lines``, ``start_columns``,
+        ``end_lines``, ``end_columns`` and ``is_trivia`` are ``array.array``
+        instances that contain one item per token, and that can be wrapped in
+        ``memoryview`` objects. Token texts are extracted from the text of the
+        unit only when requested.
+    """,
+    'langkit.python.TokenColumns.kind': """
+        Return the name of the kind for the ``i``-th token.
+    """,
+    'langkit.python.TokenColumns.text': """
+        Return the text for the ``i``-th token.
+    """,
+    'langkit.python.TokenColumns.sloc_range': """
+        Return the source location range for the ``i``-th token.
+    """,
     'langkit.python.AnalysisUnit.diagnostics': """
         Diagnostics for this unit.
     """,
@@ -1288,7 +1621,7 @@ def create_doc_printer(
         if isinstance(entity, str):
             doc_template = ctx.documentations[entity]
         elif entity.doc:
-            doc_template = Template(entity.doc)
+            doc_template = ctx.documentations.compile(entity.doc)
         else:
             doc_template = None
 
@@ -4,9 +4,13 @@ Code emission for Langkit-generated libraries.
 
 from distutils.spawn import find_executable
 import json
+import multiprocessing
 import os
 from os import path
 import subprocess
+import sys
+import sysconfig
+from typing import Callable, List
 
 from funcy import keep
 
@@ -14,63 +18,68 @@ from langkit.caching import Cache
 from langkit.compile_context import ADA_BODY, ADA_SPEC, get_context
 from langkit.coverage import InstrumentationMetadata
 from langkit.diagnostics import Severity, check_source_language
+from langkit.gdb.debug_info import write_index as write_debug_info_index
 import langkit.names as names
 from langkit.template_utils import add_template_dir
-from langkit.utils import Colors, printcol
+from langkit.utils import Colors, memoized, printcol
 
 
-def write_source_file(file_path, source, post_process=None):
+def write_source_file(file_path, source, post_process=None, inputs=None):
     """
     Helper to write a source file.
 
-    Return whether the file has been updated.
+    Return whether the file has been updated. The file is left untouched (and
+    thus keeps its modification time) if it already has the expected content.
 
     :param str file_path: Path of the file to write.
     :param str source: Content of the file to write.
     :param post_process: If provided, callable used to transform the source
         file content just before writing it.
     :type post_process: None | (str) -> str
+    :param str|None inputs: If provided, digest for the inputs used to render
+        this file. See ``Emitter.render_outdated``.
 
     :rtype: bool
     """
     context = get_context()
     if post_process:
         source = post_process(source)
-    if (not os.path.exists(file_path) or
-            context.emitter.cache.is_stale(file_path, source)):
+
+    # Emit all source files as UTF-8 with "\n" line endings, no matter the
+    # current platform.
+    if context.emitter.cache.write_file(file_path, source.encode('utf-8'),
+                                        inputs):
         if context.verbosity.debug:
             printcol('Rewriting stale source: {}'.format(file_path),
                      Colors.OKBLUE)
-        # Emit all source files as UTF-8 with "\n" line endings, no matter the
-        # current platform.
-        with open(file_path, 'w', encoding='utf-8', newline='') as f:
-            f.write(source)
         return True
     return False
 
 
-def write_cpp_file(file_path, source, post_process=None):
+def write_cpp_file(file_path, source, post_process=None, inputs=None):
     """
     Helper to write a C/C++ source file.
 
     :param str file_path: Path of the file to write.
     :param str source: Content of the file to write.
     """
-    if write_source_file(file_path, source, post_process):
+    if write_source_file(file_path, source, post_process, inputs):
         if find_executable('clang-format'):
             subprocess.check_call(['clang-format', '-i', file_path])
+            get_context().emitter.cache.accept_changes(file_path)
 
 
-def write_ocaml_file(file_path, source, post_process=None):
+def write_ocaml_file(file_path, source, post_process=None, inputs=None):
     """
     Helper to write a OCaml source file.
 
     :param str file_path: Path of the file to write.
     :param str source: Content of the file to write.
     """
-    if write_source_file(file_path, source, post_process):
+    if write_source_file(file_path, source, post_process, inputs):
         if find_executable('ocamlformat'):
             subprocess.check_call(['ocamlformat', '-i', file_path])
+            get_context().emitter.cache.accept_changes(file_path)
 
 
 def ada_file_path(out_dir, source_kind, qual_name):
@@ -91,7 +100,7 @@ def ada_file_path(out_dir, source_kind, qual_name):
 
 
 def write_ada_file(out_dir, source_kind, qual_name, content,
-                   post_process=None):
+                   post_process=None, inputs=None):
     """
     Helper to write an Ada file.
 
@@ -99,6 +108,8 @@ def write_ada_file(out_dir, source_kind, qual_name, content,
     :param source_kind: See ada_file_path.
     :param qual_name: See ada_file_path.
     :param str content: The source content to write to the file.
+    :param post_process: See write_source_file.
+    :param inputs: See write_source_file.
     """
     file_path = ada_file_path(out_dir, source_kind, qual_name)
 
@@ -109,7 +120,76 @@ def write_ada_file(out_dir, source_kind, qual_name, content,
         content = '\n'.join(l for l in lines if l.strip())
 
     # TODO: no tool is able to pretty-print a single Ada source file
-    write_source_file(file_path, content, post_process)
+    write_source_file(file_path, content, post_process, inputs)
+
+
+_render_tasks: List[Callable[[], str]] = []
+"""
+Rendering callbacks for the ongoing ``render_sources`` call. Worker processes
+are forked from the parent, so they inherit this list and can reach its
+closures (and thus the whole compilation context) by index, without any
+pickling.
+"""
+
+
+def _run_render_task(index):
+    """
+    Worker process entry point for ``render_sources``.
+
+    Return the source code that the ``index``th render task produces, as well
+    as the set of documentation entries it used, so that the parent process
+    can keep track of them.
+
+    :param int index: Index of the task to run in ``_render_tasks``.
+    :rtype: (str, set[str])
+    """
+    source = _render_tasks[index]()
+    return source, get_context().documentations.used_entries
+
+
+def render_sources(tasks, jobs=1):
+    """
+    Call all rendering callbacks in ``tasks`` and return the list of their
+    results, in the same order.
+
+    If ``jobs`` is greater than 1, use a pool of at most ``jobs`` worker
+    processes to run these callbacks concurrently. This requires the "fork"
+    start method: when it is not available, fall back to sequential rendering.
+    Note that only the returned sources (and used documentation entries) are
+    transmitted back to the current process: callbacks must have no other
+    side effect.
+
+    :param list[() -> str] tasks: Rendering callbacks.
+    :param int jobs: Maximum number of worker processes to use.
+    :rtype: list[str]
+    """
+    global _render_tasks
+
+    if (
+        jobs <= 1
+        or len(tasks) <= 1
+        or 'fork' not in multiprocessing.get_all_start_methods()
+    ):
+        return [t() for t in tasks]
+
+    # Make sure the template renderer is created (and templates looked up)
+    # only once, in the parent process, rather than once per worker.
+    ctx = get_context()
+    ctx.renderer
+
+    _render_tasks = tasks
+    try:
+        with multiprocessing.get_context('fork').Pool(
+            min(jobs, len(tasks))
+        ) as pool:
+            results = pool.map(_run_render_task, range(len(tasks)),
+                               chunksize=1)
+    finally:
+        _render_tasks = []
+
+    for _, used_entries in results:
+        ctx.documentations.mark_used(used_entries)
+    return [source for source, _ in results]
 
 
 class Emitter:
@@ -123,7 +203,9 @@ class Emitter:
                  generate_gdb_hook=True, pretty_print=False,
                  post_process_ada=None, post_process_cpp=None,
                  post_process_python=None, coverage=False,
-                 relative_project=False, unparse_script=None):
+                 relative_project=False, unparse_script=None,
+                 minimize_lexer_dfa=True, table_driven_lexer=False,
+                 jobs=1, render_cache=True):
         """
         Generate sources for the analysis library. Also emit a tiny program
         useful for testing purposes.
@@ -173,6 +255,21 @@ class Emitter:
 
         :param bool relative_project: See libmanage's --relative-project
             option.
+
+        :param bool minimize_lexer_dfa: Whether to minimize the lexer state
+            machine before generating code for it.
+
+        :param bool table_driven_lexer: If true, implement the lexer state
+            machine as a loop over compact transition tables. Otherwise,
+            generate one block of code (with case statements) per state.
+
+        :param int jobs: Maximum number of processes to use in order to render
+            independent source files concurrently. Render them sequentially if
+            1.
+
+        :param bool render_cache: If true, do not render again source files
+            whose inputs did not change since they were last generated (see
+            ``render_outdated``).
         """
         self.context = context
         self.verbosity = context.verbosity
@@ -204,6 +301,10 @@ class Emitter:
         self.coverage = coverage
         self.gnatcov = context.gnatcov
         self.relative_project = relative_project
+        self.minimize_lexer_dfa = minimize_lexer_dfa
+        self.table_driven_lexer = table_driven_lexer
+        self.jobs = jobs
+        self.render_cache = render_cache
 
         # Automatically add all source files in the "extensions/src" directory
         # to the generated library project.
@@ -404,16 +505,23 @@ class Emitter:
             [ctx.lib_name, names.Name('Lexer_State_Machine')])
 
         # Generate the lexer state machine iff the file is missing or its
-        # signature has changed since last time.
+        # signature has changed since last time. Code generation options
+        # change the generated code, so they are part of the signature.
         stale_lexer_spec = write_source_file(
             os.path.join(
                 self.lib_root, 'obj',
                 '{}_lexer_signature.txt'
                 .format(ctx.short_name_or_long.lower)),
-            json.dumps(ctx.lexer.signature, indent=2)
+            json.dumps({'lexer': ctx.lexer.signature,
+                        'minimize': self.minimize_lexer_dfa,
+                        'table_driven': self.table_driven_lexer}, indent=2)
         )
         if not os.path.exists(lexer_sm_body) or stale_lexer_spec:
-            self.dfa_code = ctx.lexer.build_dfa_code(ctx)
+            self.dfa_code = ctx.lexer.build_dfa_code(
+                ctx,
+                minimize=self.minimize_lexer_dfa,
+                table_driven=self.table_driven_lexer
+            )
 
     def emit_ada_lib(self, ctx):
         """
@@ -455,6 +563,7 @@ class Emitter:
                 self.has_body = has_body
                 self.cached_body = cached_body
 
+        sources = []
         for u in [
             # Top (pure) package
             Unit('pkg_main', '', has_body=False),
@@ -502,9 +611,20 @@ class Emitter:
                 (not self.generate_unparser and u.unparser)
             ):
                 continue
-            self.write_ada_module(self.src_dir, u.template_base_name,
-                                  u.qual_name, u.has_body, u.cached_body,
-                                  in_library=True)
+            sources.extend(self.ada_module_sources(
+                self.src_dir, u.template_base_name, u.qual_name, u.has_body,
+                u.cached_body, in_library=True
+            ))
+
+        # Units are independent from each other, so render them all at once
+        self.write_ada_sources(self.src_dir, sources)
+
+        # Save GDB helpers the trouble of scanning the whole implementation
+        # body to get debug info at the beginning of each session.
+        write_debug_info_index(ada_file_path(
+            self.src_dir, ADA_BODY,
+            [ctx.lib_name, names.Name('Implementation')]
+        ))
 
     def emit_mains(self, ctx):
         """
@@ -532,29 +652,34 @@ class Emitter:
         """
         Generate header and binding body for the external C API.
         """
-        def render(template_name):
-            return ctx.render_template(template_name)
-
-        with names.lower:
-            # TODO (TA20-017: gprinstall bug): generate the header in
-            # "src" and add it to the library interface (see disabled code
-            # below).
-            header_filename = '{}.h'.format(ctx.c_api_settings.lib_name)
-            write_cpp_file(
-                path.join(self.lib_root, header_filename),
-                render('c_api/header_c'),
-                self.post_process_cpp
-            )
-            if False:
-                self.add_library_interface(
-                    header_filename, generated=True, is_ada=False
-                )
+        def render_header():
+            with names.lower:
+                return ctx.render_template('c_api/header_c')
 
-        self.write_ada_module(
+        ada_sources = self.ada_module_sources(
             self.src_dir, 'c_api/pkg_main',
             [names.Name(n) for n in 'Implementation.C'.split('.')],
             in_library=True
         )
+        header_filename = '{}.h'.format(ctx.c_api_settings.lib_name)
+        header_path = path.join(self.lib_root, header_filename)
+        header, *ada_contents = self.render_outdated(
+            [(header_path, render_header)]
+            + [(ada_file_path(self.src_dir, kind, qual_name), render)
+               for kind, qual_name, render in ada_sources]
+        )
+
+        # TODO (TA20-017: gprinstall bug): generate the header in "src" and
+        # add it to the library interface (see disabled code below).
+        if header is not None:
+            write_cpp_file(header_path, header, self.post_process_cpp,
+                           self.inputs_digest)
+        if False:
+            self.add_library_interface(
+                header_filename, generated=True, is_ada=False
+            )
+
+        self.write_ada_sources(self.src_dir, ada_sources, ada_contents)
 
     def emit_python_api(self, ctx):
         """
@@ -576,53 +701,65 @@ class Emitter:
                 )
                 return code
 
-        def render_python_template(file_path, *args, **kwargs):
-            with names.camel:
-                code = ctx.render_template(*args, **kwargs)
+        def python_template(file_path, *args, **kwargs):
+            def render():
+                with names.camel:
+                    return ctx.render_template(*args, **kwargs)
+            return file_path, render
+
+        modules = [
+            # Emit the Python modules themselves
+            python_template(
+                os.path.join(self.python_pkg_dir, '__init__.py'),
+                'python_api/module_py',
+                c_api=ctx.c_api_settings,
+                pyapi=ctx.python_api_settings,
+                module_name=ctx.python_api_settings.module_name
+            ),
+            python_template(
+                os.path.join(self.python_pkg_dir, '_py2to3.py'),
+                'python_api/py2to3_py'
+            ),
+
+            # Emit stub files for Mypy (type hints)
+            python_template(
+                os.path.join(self.python_pkg_dir, '__init__.pyi'),
+                'python_api/module_pyi',
+                pyapi=ctx.python_api_settings,
+            ),
+            python_template(
+                os.path.join(self.python_pkg_dir, '_py2to3.pyi'),
+                'python_api/py2to3_pyi'
+            ),
+        ]
+
+        def render_setup_py():
+            return ctx.render_template('python_api/setup_py')
+
+        # Emit the setup.py script to easily install the Python binding
+        setup_py_file = os.path.join(self.lib_root, 'python', 'setup.py')
+
+        *codes, setup_py = self.render_outdated(
+            modules + [(setup_py_file, render_setup_py)]
+        )
+
+        for (file_path, _), code in zip(modules, codes):
+            if code is None:
+                continue
 
             # If pretty-printing failed, write the original code anyway in
             # order to ease debugging.
-            exc = None
             try:
                 pp_code = pretty_print(code)
             except SyntaxError:
                 pp_code = code
 
-            write_source_file(file_path, pp_code, self.post_process_python)
-            if exc:
-                raise exc
-
-        # Emit the Python modules themselves
-        render_python_template(
-            os.path.join(self.python_pkg_dir, '__init__.py'),
-            'python_api/module_py',
-            c_api=ctx.c_api_settings,
-            pyapi=ctx.python_api_settings,
-            module_name=ctx.python_api_settings.module_name
-        )
-        render_python_template(
-            os.path.join(self.python_pkg_dir, '_py2to3.py'),
-            'python_api/py2to3_py'
-        )
+            write_source_file(file_path, pp_code, self.post_process_python,
+                              self.inputs_digest)
 
-        # Emit stub files for Mypy (type hints)
-        render_python_template(
-            os.path.join(self.python_pkg_dir, '__init__.pyi'),
-            'python_api/module_pyi',
-            pyapi=ctx.python_api_settings,
-        )
-        render_python_template(
-            os.path.join(self.python_pkg_dir, '_py2to3.pyi'),
-            'python_api/py2to3_pyi'
-        )
-
-        # Emit the setup.py script to easily install the Python binding
-        setup_py_file = os.path.join(self.lib_root, 'python', 'setup.py')
-        write_source_file(
-            setup_py_file,
-            ctx.render_template('python_api/setup_py'),
-            self.post_process_python
-        )
+        if setup_py is not None:
+            write_source_file(setup_py_file, setup_py,
+                              self.post_process_python, self.inputs_digest)
 
     def emit_python_playground(self, ctx):
         """
@@ -685,49 +822,43 @@ class Emitter:
         if not os.path.isdir(self.ocaml_dir):
             os.mkdir(self.ocaml_dir)
 
-        with names.camel:
-            ctx = get_context()
-            code = ctx.render_template(
-                "ocaml_api/module_ocaml",
-                c_api=ctx.c_api_settings,
-                ocaml_api=ctx.ocaml_api_settings
-            )
-
-            ocaml_filename = '{}.ml'.format(ctx.c_api_settings.lib_name)
-            write_ocaml_file(
-                os.path.join(self.ocaml_dir, ocaml_filename),
-                code
-            )
-
-            code = ctx.render_template(
-                "ocaml_api/module_sig_ocaml",
-                c_api=ctx.c_api_settings,
-                ocaml_api=ctx.ocaml_api_settings
-            )
-
-            ocaml_filename = '{}.mli'.format(ctx.c_api_settings.lib_name)
-            write_ocaml_file(
-                os.path.join(self.ocaml_dir, ocaml_filename),
-                code
-            )
+        def ocaml_template(template_name):
+            def render():
+                with names.camel:
+                    return ctx.render_template(
+                        template_name,
+                        c_api=ctx.c_api_settings,
+                        ocaml_api=ctx.ocaml_api_settings
+                    )
+            return render
+
+        lib_name = ctx.c_api_settings.lib_name
+        outputs = [
+            (write_ocaml_file, os.path.join(self.ocaml_dir, f'{lib_name}.ml'),
+             ocaml_template("ocaml_api/module_ocaml")),
+            (write_ocaml_file, os.path.join(self.ocaml_dir, f'{lib_name}.mli'),
+             ocaml_template("ocaml_api/module_sig_ocaml")),
 
             # Emit dune file to easily compile and install bindings
-            code = ctx.render_template(
-                "ocaml_api/dune_ocaml",
-                c_api=ctx.c_api_settings,
-                ocaml_api=ctx.ocaml_api_settings
-            )
+            (write_source_file, os.path.join(self.ocaml_dir, 'dune'),
+             ocaml_template("ocaml_api/dune_ocaml")),
+        ]
+        codes = self.render_outdated(
+            [(file_path, render) for _, file_path, render in outputs]
+        )
+        for (write, file_path, _), code in zip(outputs, codes):
+            if code is not None:
+                write(file_path, code, inputs=self.inputs_digest)
 
-            write_source_file(os.path.join(self.ocaml_dir, 'dune'), code)
-            write_source_file(os.path.join(self.ocaml_dir, 'dune-project'),
-                              '(lang dune 1.6)')
+        write_source_file(os.path.join(self.ocaml_dir, 'dune-project'),
+                          '(lang dune 1.6)')
 
-            # Write an empty opam file to install the lib with dune
-            write_source_file(
-                os.path.join(self.ocaml_dir,
-                             '{}.opam'.format(ctx.c_api_settings.lib_name)),
-                ''
-            )
+        # Write an empty opam file to install the lib with dune
+        write_source_file(
+            os.path.join(self.ocaml_dir,
+                         '{}.opam'.format(ctx.c_api_settings.lib_name)),
+            ''
+        )
 
     def write_ada_module(self, out_dir, template_base_name, qual_name,
                          has_body=True, cached_body=False, in_library=False):
@@ -751,6 +882,33 @@ class Emitter:
         :param bool cached_body: If true, only register the body as a library
             interface, i.e. do not generate it, considering that it is cached.
         """
+        self.write_ada_sources(
+            out_dir,
+            self.ada_module_sources(out_dir, template_base_name, qual_name,
+                                    has_body, cached_body, in_library)
+        )
+
+    def ada_module_sources(self, out_dir, template_base_name, qual_name,
+                           has_body=True, cached_body=False,
+                           in_library=False):
+        """
+        Return the list of sources to write for an Ada module, without
+        rendering them yet. See ``write_ada_module`` for the meaning of
+        arguments.
+
+        :rtype: list[(str, list[names.Name], () -> str)]
+        :return: For each source to write, its kind (ADA_SPEC or ADA_BODY),
+            its fully qualified name and a callback to render its content.
+        """
+        def renderer(template_name, with_clauses):
+            def render():
+                with names.camel_with_underscores:
+                    return self.context.render_template(
+                        template_name, with_clauses=with_clauses
+                    )
+            return render
+
+        result = []
         for kind in [ADA_SPEC] + ([ADA_BODY] if has_body else []):
             qual_name_str = '.'.join(n.camel_with_underscores
                                      for n in qual_name)
@@ -767,20 +925,176 @@ class Emitter:
             if kind == ADA_BODY and cached_body:
                 continue
 
-            with names.camel_with_underscores:
-                write_ada_file(
-                    out_dir=out_dir,
-                    source_kind=kind,
-                    qual_name=full_qual_name,
-                    content=self.context.render_template(
-                        '{}{}_ada'.format(
-                            template_base_name +
-                            # If the base name ends with a /, we don't
-                            # put a "_" separator.
-                            ('' if template_base_name.endswith('/') else '_'),
-                            kind
-                        ),
-                        with_clauses=with_clauses,
-                    ),
-                    post_process=self.post_process_ada
-                )
+            template_name = '{}{}_ada'.format(
+                template_base_name +
+                # If the base name ends with a /, we don't put a "_"
+                # separator.
+                ('' if template_base_name.endswith('/') else '_'),
+                kind
+            )
+            result.append((kind, full_qual_name,
+                           renderer(template_name, with_clauses)))
+        return result
+
+    def write_ada_sources(self, out_dir, sources, contents=None):
+        """
+        Render and write the given Ada sources. Rendering happens concurrently
+        if the emitter was asked to use multiple jobs, and is skipped for
+        sources that are up-to-date.
+
+        :param str out_dir: The out directory for the generated sources.
+        :param list[(str, list[names.Name], () -> str)] sources: Sources to
+            write, as returned by ``ada_module_sources``.
+        :param list[str|None]|None contents: If provided, result of
+            ``render_outdated`` for ``sources``.
+        """
+        if contents is None:
+            contents = self.render_outdated([
+                (ada_file_path(out_dir, kind, qual_name), render)
+                for kind, qual_name, render in sources
+            ])
+        for (kind, qual_name, _), content in zip(sources, contents):
+            if content is None:
+                continue
+            write_ada_file(
+                out_dir=out_dir,
+                source_kind=kind,
+                qual_name=qual_name,
+                content=content,
+                post_process=self.post_process_ada,
+                inputs=self.inputs_digest
+            )
+
+    @property  # type: ignore
+    @memoized
+    def inputs_digest(self):
+        """
+        Digest for everything that rendering templates depends on, or None if
+        rendering must never be skipped.
+
+        Since the language specification, Langkit and the templates are all
+        loaded by this process, consider all the non-standard Python modules
+        loaded so far, all files in the Langkit package, template and
+        extension directories and Lkt sources, as well as command-line
+        arguments, environment variables, the Python version and the options
+        for code generation (see ``options_summary``).
+
+        :rtype: str|None
+        """
+        from langkit.caching import new_hasher
+
+        if not self.render_cache:
+            return None
+
+        # Rendering also keeps track of used documentation entries: when asked
+        # to report unused ones, we need to render everything.
+        if any(
+            p.name == 'report unused documentation entries' and not p.disabled
+            for p in self.context.all_passes
+        ):
+            return None
+
+        files = set()
+
+        stdlib_dirs = tuple(
+            os.path.join(sysconfig.get_paths()[name], '')
+            for name in ('stdlib', 'platstdlib')
+        )
+        for module in list(sys.modules.values()):
+            filename = getattr(module, '__file__', None)
+            if (
+                filename
+                and not filename.startswith(stdlib_dirs)
+                and os.path.isfile(filename)
+            ):
+                files.add(os.path.abspath(filename))
+
+        for dirpath in keep([path.dirname(__file__), self.extensions_dir]
+                            + list(self.context.template_lookup_extra_dirs)):
+            for root, dirnames, filenames in os.walk(dirpath):
+                dirnames[:] = [d for d in dirnames if d != '__pycache__']
+                files.update(os.path.abspath(os.path.join(root, f))
+                             for f in filenames)
+
+        files.update(os.path.abspath(u.filename)
+                     for u in self.context.lkt_units)
+
+        h = new_hasher()
+        h.update(json.dumps([sys.version,
+                             sys.argv,
+                             sorted(os.environ.items()),
+                             self.options_summary()]).encode('utf-8'))
+        h.update(self.cache.files_digest(files).encode('ascii'))
+        return h.hexdigest()
+
+    def options_summary(self):
+        """
+        Return a JSON-compatible summary of the options that affect code
+        generation: the ones given to this emitter and to
+        ``CompileCtx.create_all_passes``. Programs can create contexts with
+        options that do not appear on their command-line, so command-line
+        arguments are not enough to tell whether generated code is up-to-date.
+
+        :rtype: dict
+        """
+        def callable_id(fn):
+            # The code of callables is part of the loaded modules, so their
+            # names are enough to identify them. Fallback to their
+            # representation, which likely changes across runs, when they have
+            # no name.
+            if fn is None:
+                return None
+            qualname = getattr(fn, '__qualname__', None)
+            return ('{}.{}'.format(fn.__module__, qualname)
+                    if qualname else repr(fn))
+
+        return {
+            'lib_root': os.path.abspath(self.lib_root),
+            'extensions_dir': self.extensions_dir,
+            'main_source_dirs': sorted(self.main_source_dirs),
+            'main_programs': sorted(self.main_programs),
+            'no_property_checks': self.no_property_checks,
+            'generate_ada_api': self.generate_ada_api,
+            'generate_gdb_hook': self.generate_gdb_hook,
+            'generate_unparser': self.generate_unparser,
+            'pretty_print': self.pretty_print,
+            'post_process_ada': callable_id(self.post_process_ada),
+            'post_process_cpp': callable_id(self.post_process_cpp),
+            'post_process_python': callable_id(self.post_process_python),
+            'coverage': self.coverage,
+            'relative_project': self.relative_project,
+            'unparse_script': (None if self.unparse_script is None
+                               else self.unparse_script.actions),
+            'minimize_lexer_dfa': self.minimize_lexer_dfa,
+            'table_driven_lexer': self.table_driven_lexer,
+            'default_max_call_depth': self.context.default_max_call_depth,
+            'strict_sound_envs': self.context.strict_sound_envs,
+            'passes': [[p.name, p.disabled]
+                       for p in self.context.all_passes],
+        }
+
+    def render_outdated(self, sources):
+        """
+        Render the given source files, except the ones that are up-to-date,
+        i.e. the ones that were generated from the same inputs (see
+        ``inputs_digest``) and not modified since then. Rendering happens
+        concurrently if the emitter was asked to use multiple jobs.
+
+        :param list[(str, () -> str)] sources: Path for each source file to
+            generate, and callback to render its content.
+        :rtype: list[str|None]
+        :return: Rendered content for each source file, or None for the ones
+            that are up-to-date.
+        """
+        inputs = self.inputs_digest
+        outdated = [
+            i for i, (file_path, _) in enumerate(sources)
+            if inputs is None or not self.cache.is_up_to_date(file_path,
+                                                              inputs)
+        ]
+        result = [None] * len(sources)
+        contents = render_sources([sources[i][1] for i in outdated],
+                                  self.jobs)
+        for i, content in zip(outdated, contents):
+            result[i] = content
+        return result
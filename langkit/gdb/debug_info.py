@@ -4,6 +4,8 @@ properties DSL level.
 """
 
 import inspect
+import json
+import os
 import shlex
 from typing import Dict
 
@@ -22,6 +24,110 @@ class ParseError(Exception):
         super().__init__('line {}: {}'.format(line_no, message))
 
 
+INDEX_VERSION = 1
+"""
+Version number for the format of debug info index files. Index files with
+another version number are ignored.
+"""
+
+
+def index_filename(filename):
+    """
+    Return the name of the debug info index file for the ``filename`` source
+    file.
+
+    :param str filename: Name of the "$-implementation.adb" source file.
+    :rtype: str
+    """
+    return filename + '.gdb-index.json'
+
+
+def scan_directives(lines):
+    """
+    Look for GDB helpers directives in ``lines``.
+
+    Yield a (line_no, directive name, directive arguments) tuple for each
+    directive found. Raise a ParseError if a directive is malformed.
+
+    :param iter[str] lines: Iterable that yields all the lines to parse.
+    :rtype: iter[(int, str, list[str])]
+    """
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line.startswith('--#'):
+            continue
+        line = line[3:].strip()
+        args = shlex.split(line)
+
+        try:
+            name = args.pop(0)
+        except IndexError:
+            raise ParseError(line_no, 'directive name is missing')
+
+        yield (line_no, name, args)
+
+
+def _source_digest(filename):
+    from langkit.caching import content_digest
+
+    with open(filename, 'rb') as f:
+        return content_digest(f.read())
+
+
+def load_index(filename):
+    """
+    Load the debug info index for the ``filename`` source file.
+
+    Return the list of directives it contains (see ``scan_directives``), or
+    None if there is no index or if it is stale.
+
+    :param str filename: Name of the "$-implementation.adb" source file.
+    :rtype: list[(int, str, list[str])]|None
+    """
+    try:
+        with open(index_filename(filename), 'r') as f:
+            index = json.load(f)
+    except (IOError, ValueError):
+        return None
+
+    if (
+        not isinstance(index, dict)
+        or index.get('version') != INDEX_VERSION
+        or index.get('digest') != _source_digest(filename)
+    ):
+        return None
+
+    return [(line_no, name, args)
+            for line_no, name, args in index['directives']]
+
+
+def write_index(filename):
+    """
+    Write the debug info index for the ``filename`` source file, unless there
+    is already an up-to-date one. This allows GDB helpers to load debug info
+    without scanning the whole source file.
+
+    :param str filename: Name of the "$-implementation.adb" source file.
+    """
+    if load_index(filename) is not None:
+        return
+
+    index_file = index_filename(filename)
+    try:
+        with open(filename, 'r') as f:
+            directives = list(scan_directives(f))
+    except ParseError:
+        # Let GDB helpers report the error when they scan the source file
+        if os.path.exists(index_file):
+            os.remove(index_file)
+        return
+
+    with open(index_file, 'w') as f:
+        json.dump({'version': INDEX_VERSION,
+                   'digest': _source_digest(filename),
+                   'directives': directives}, f)
+
+
 class DebugInfo:
     """
     Holder for all info that maps generated code to the properties DSL level.
@@ -61,9 +167,10 @@ class DebugInfo:
         """
         Try to parse the $-implementation.adb source file that GDB found.
 
-        This extracts mapping information from its GDB helpers directives.
-        Print error messages on standard output if anything goes wrong, but
-        always return a DebugInfo instance anyway.
+        This extracts mapping information from its GDB helpers directives,
+        loading them from the index emitted at generation time if it is up to
+        date. Print error messages on standard output if anything goes wrong,
+        but always return a DebugInfo instance anyway.
 
         :rtype: DebugInfo
         """
@@ -79,8 +186,12 @@ class DebugInfo:
             return result
 
         filename = has_unit_sym.symtab.fullname()
-        with open(filename, 'r') as f:
-            result._try_parse(filename, f)
+        directives = load_index(filename)
+        if directives is not None:
+            result._try_parse(filename, directives)
+        else:
+            with open(filename, 'r') as f:
+                result._try_parse(filename, scan_directives(f))
 
         return result
 
@@ -96,30 +207,28 @@ class DebugInfo:
             a custom iterator, ...
         """
         result = cls(context=None)
-        result._try_parse(filename, lines)
+        result._try_parse(filename, scan_directives(lines))
         return result
 
-    def _try_parse(self, filename, lines):
+    def _try_parse(self, filename, directives):
         """
         Internal method. Same semantics as parse_from_iterable, but work on an
-        existing instance.
+        existing instance and on directives (see ``scan_directives``).
         """
         self.filename = filename
         try:
-            self._parse_file(lines)
+            self._parse_directives(directives)
         except ParseError as exc:
             print('Error while parsing directives in {}:'.format(filename))
             print(str(exc))
 
-    def _parse_file(self, lines):
+    def _parse_directives(self, directives):
         """
-        Internal method. Read GDB helpers directives from the "lines" source
-        file and fill self according to it. Raise a ParseError if anything goes
-        wrong.
+        Internal method. Fill self according to the given GDB helpers
+        directives. Raise a ParseError if anything goes wrong.
 
-        :param iter[str] lines: Iterable that yields all the lines to parse.
-            This can be any iterator: a read file, a list of strings in memory,
-            a custom iterator, ...
+        :param iter[(int, str, list[str])] directives: Iterable that yields
+            all the directives to process, as ``scan_directives`` does.
         :rtype: None
         """
         self.properties = []
@@ -127,18 +236,7 @@ class DebugInfo:
         scope_stack = []
         expr_stack = []
 
-        for line_no, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line.startswith('--#'):
-                continue
-            line = line[3:].strip()
-            args = shlex.split(line)
-
-            try:
-                name = args.pop(0)
-            except IndexError:
-                raise ParseError(line_no, 'directive name is missing')
-
+        for line_no, name, args in directives:
             d = Directive.parse(line_no, name, args)
 
             if d.is_a(PropertyStart):
@@ -8,6 +8,7 @@ from langkit.diagnostics import (Context, check_source_language,
                                  extract_library_location)
 from langkit.lexer.regexp import DFACodeGenHolder, NFAState, RegexpCollection
 from langkit.names import Name
+from langkit.utils import Colors, printcol
 
 
 # All "signature" properties in classes below are used to identify the whole
@@ -599,9 +600,14 @@ class Lexer:
         """
         self.newline_after.update(tokens)
 
-    def build_dfa_code(self, context):
+    def build_dfa_code(self, context, minimize=True, table_driven=False):
         """
         Build the DFA that implements this lexer (self.dfa_code).
+
+        :param bool minimize: Whether to minimize the DFA before generating
+            code for it.
+        :param bool table_driven: Whether to compute transition tables for
+            the table-driven lexer backend.
         """
         assert context.nfa_start is not None
 
@@ -613,7 +619,20 @@ class Lexer:
             return sorted_actions[0][1] if sorted_actions else None
 
         # Compute the corresponding DFA
-        return DFACodeGenHolder(context.nfa_start.to_dfa(), get_action)
+        dfa = context.nfa_start.to_dfa()
+
+        # Merge equivalent states. Code generation for a state only depends on
+        # its action, so states with different labels can still be merged as
+        # long as they yield the same action.
+        if minimize:
+            states_count = len(dfa.reachable_states)
+            dfa = dfa.minimize(lambda s: get_action(s.labels))
+            if context.verbosity.debug:
+                printcol('Lexer DFA minimization: {} states -> {} states'
+                         .format(states_count, len(dfa.reachable_states)),
+                         Colors.OKBLUE)
+
+        return DFACodeGenHolder(dfa, get_action, table_driven)
 
     def get_token(self, literal):
         """
@@ -1,4 +1,8 @@
+import array
+import bisect
 import os.path
+import sys
+from typing import Dict
 import unicodedata
 
 
@@ -36,7 +40,11 @@ def format_char_ranges(ranges):
 
 class CharSet:
     """
-    Set of characters.
+    Immutable set of characters.
+
+    Character sets are represented as a flat array of boundaries, so that set
+    operations (union, intersection, difference, ...) are linear merges of
+    such arrays. As they are immutable, instances can be freely shared.
     """
 
     _repr_ellipsis = True
@@ -47,33 +55,95 @@ class CharSet:
     """
 
     def __init__(self, *items):
-        self.ranges = []
-        """
-        Sorted, disjoint and as merged as possible list of ranges for character
-        ordinals in the set. Both bounds are included in the ranges.
-
-        :type: list[(int, int)]
-        """
-
+        ranges = []
         for item in items:
             if isinstance(item, str):
-                self.add(item)
+                ranges.append((ord(item), ord(item)))
             elif isinstance(item, tuple):
                 low, high = item
-                self.add_range(low, high)
+                ranges.append((ord(low), ord(high)))
             else:
                 raise TypeError('Invalid CharSet item: {}'.format(repr(item)))
 
+        self._bounds = self._bounds_for(ranges)
+        """
+        Sorted list of boundaries for character ordinals in the set. Items go
+        by pairs: the first one is the first character in a range while the
+        second one is the character right after the end of the range. Ranges
+        are disjoint and as merged as possible (there is no range adjacent to
+        another one).
+
+        :type: array.array[int]
+        """
+
+        self._hash = None
+        """
+        Cache for __hash__.
+
+        :type: None|int
+        """
+
+    @staticmethod
+    def _bounds_for(ranges):
+        """
+        Return the array of boundaries corresponding to the given ranges.
+
+        :param list[(int, int)] ranges: List of character ranges, both bounds
+            included. Ranges can appear in any order, can overlap and can be
+            empty.
+        :rtype: array.array[int]
+        """
+        result = array.array('l')
+        for low, high in sorted(ranges):
+            assert low <= MAXUNICODE and high <= MAXUNICODE
+
+            # Empty ranges do not add anything to this set
+            if low > high:
+                continue
+
+            # Merge this range with the previous one if they overlap or are
+            # adjacent, or just append it otherwise.
+            if result and low <= result[-1]:
+                if high >= result[-1]:
+                    result[-1] = high + 1
+            else:
+                result.append(low)
+                result.append(high + 1)
+        return result
+
+    @classmethod
+    def _from_bounds(cls, bounds):
+        """
+        Create a character set from an array of boundaries (see
+        ``CharSet._bounds``).
+
+        :type bounds: array.array[int]
+        :rtype: CharSet
+        """
+        result = cls.__new__(cls)
+        result._bounds = bounds
+        result._hash = None
+        return result
+
     @classmethod
     def from_int(cls, item):
         return cls.from_int_ranges((item, item))
 
     @classmethod
     def from_int_ranges(cls, *items):
-        result = cls()
-        for l, h in items:
-            result.add_int_range(l, h)
-        return result
+        return cls._from_bounds(cls._bounds_for(items))
+
+    @property
+    def ranges(self):
+        """
+        Sorted, disjoint and as merged as possible list of ranges for character
+        ordinals in the set. Both bounds are included in the ranges.
+
+        :rtype: list[(int, int)]
+        """
+        bounds = self._bounds
+        return [(bounds[i], bounds[i + 1] - 1)
+                for i in range(0, len(bounds), 2)]
 
     def __repr__(self):
         ranges = []
@@ -86,10 +156,12 @@ class CharSet:
         return format_char_ranges(ranges)
 
     def __hash__(self):
-        return hash(tuple(self.ranges))
+        if self._hash is None:
+            self._hash = hash(self._bounds.tobytes())
+        return self._hash
 
     def __eq__(self, other):
-        return isinstance(other, CharSet) and self.ranges == other.ranges
+        return isinstance(other, CharSet) and self._bounds == other._bounds
 
     def __ne__(self, other):
         return not (self == other)
@@ -105,9 +177,52 @@ class CharSet:
         :type char: str
         :rtype: bool
         """
-        char = ord(char)
-        found, _ = self._lookup(char)
-        return found
+        # Characters in the set are the ones for which there is an odd number
+        # of boundaries lower or equal to them.
+        return bool(bisect.bisect_right(self._bounds, ord(char)) & 1)
+
+    def _combine(self, other, predicate):
+        """
+        Return a character set that contains all characters for which
+        ``predicate`` returns true. This is a linear merge of the boundaries
+        for both sets.
+
+        :type other: CharSet
+        :param (bool, bool) -> bool predicate: Function that computes whether
+            a character belongs to the result given whether it belongs to
+            ``self`` and whether it belongs to ``other``.
+        :rtype: CharSet
+        """
+        assert isinstance(other, CharSet)
+        self_bounds = self._bounds
+        other_bounds = other._bounds
+        self_len = len(self_bounds)
+        other_len = len(other_bounds)
+        end = MAXUNICODE + 2
+
+        result = array.array('l')
+        i = j = 0
+        in_self = in_other = inside = False
+        while i < self_len or j < other_len:
+            self_next = self_bounds[i] if i < self_len else end
+            other_next = other_bounds[j] if j < other_len else end
+            char = min(self_next, other_next)
+
+            # Process the boundaries from both sets that are at this position,
+            # then emit a boundary if the membership of the result changes.
+            if self_next == char:
+                in_self = not in_self
+                i += 1
+            if other_next == char:
+                in_other = not in_other
+                j += 1
+
+            new_inside = predicate(in_self, in_other)
+            if new_inside != inside:
+                result.append(char)
+                inside = new_inside
+
+        return self._from_bounds(result)
 
     def __or__(self, other):
         """
@@ -116,16 +231,29 @@ class CharSet:
         :type other: CharSet
         :rtype: CharSet
         """
-        assert isinstance(other, CharSet)
-        result = CharSet()
-        for cs in (self, other):
-            for l, h in cs.ranges:
-                result.add_int_range(l, h)
-        return result
+        return self._combine(other, lambda a, b: a or b)
+
+    def __and__(self, other):
+        """
+        Return the intersection of two character sets.
+
+        :type other: CharSet
+        :rtype: CharSet
+        """
+        return self._combine(other, lambda a, b: a and b)
+
+    def __sub__(self, other):
+        """
+        Return the set of characters in ``self`` that are not in ``other``.
+
+        :type other: CharSet
+        :rtype: CharSet
+        """
+        return self._combine(other, lambda a, b: a and not b)
 
     @property
     def is_empty(self):
-        return not self.ranges
+        return not self._bounds
 
     @property
     def ada_ranges(self):
@@ -152,9 +280,7 @@ class CharSet:
 
     @classmethod
     def any_char(cls):
-        result = cls()
-        result.add_int_range(0, MAXUNICODE)
-        return result
+        return cls._from_bounds(array.array('l', [0, MAXUNICODE + 1]))
 
     @property
     def negation(self):
@@ -164,22 +290,19 @@ class CharSet:
 
         :rtype: CharSet
         """
-        result = CharSet()
-
-        last = None
-        for l, h in self.ranges:
-            if last is None:
-                if l > 0:
-                    result.add_int_range(0, l - 1)
-            else:
-                result.add_int_range(last + 1, l - 1)
-            last = h
-
-        # Handle the empty character set
-        result.add_int_range(
-            0 if last is None else last + 1,
-            MAXUNICODE)
-        return result
+        # Negating a set just means toggling membership at 0 and at
+        # MAXUNICODE + 1: add these boundaries if they are missing, remove
+        # them otherwise.
+        result = array.array('l', self._bounds)
+        if result and result[0] == 0:
+            del result[0]
+        else:
+            result.insert(0, 0)
+        if result and result[-1] == MAXUNICODE + 1:
+            del result[-1]
+        else:
+            result.append(MAXUNICODE + 1)
+        return self._from_bounds(result)
 
     @property
     def split_ascii_subsets(self):
@@ -189,22 +312,18 @@ class CharSet:
 
         :rtype: (CharSet, CharSet)
         """
-        ascii = CharSet()
-        non_ascii = CharSet()
-
-        def add_range(char_set, l, h):
-            char_set.add_int_range(l, h)
-
-        for l, h in self.ranges:
-            if h < 128:
-                ascii.add_int_range(l, h)
-            elif l < 128:
-                ascii.add_int_range(l, 127)
-                non_ascii.add_int_range(128, h)
-            else:
-                non_ascii.add_int_range(l, h)
-
-        return (ascii, non_ascii)
+        # Find the first boundary after the ASCII range and split the array
+        # there. If a range contains both 127 and 128, it must be split too.
+        bounds = self._bounds
+        i = bisect.bisect_left(bounds, 128)
+        if i & 1 and bounds[i] == 128:
+            i += 1
+        ascii = bounds[:i]
+        non_ascii = bounds[i:]
+        if i & 1:
+            ascii.append(128)
+            non_ascii.insert(0, 128)
+        return (self._from_bounds(ascii), self._from_bounds(non_ascii))
 
     def overlaps_with(self, other):
         """
@@ -214,182 +333,159 @@ class CharSet:
         :rtype: bool
         """
         assert isinstance(other, CharSet)
-
-        def overlap(r1, r2):
-            return r1[0] <= r2[1] and r1[1] >= r2[0]
-
-        self_r = list(self.ranges)
-        other_r = list(other.ranges)
-
-        while self_r and other_r:
-            # Remove the first item from one list if it precedes (without
-            # overlapping) the first item from the other list.
-            if self_r[0][0] > other_r[0][1]:
-                other_r.pop(0)
-            elif self_r[0][1] < other_r[0][0]:
-                self_r.pop(0)
+        self_bounds = self._bounds
+        other_bounds = other._bounds
+
+        i = j = 0
+        while i < len(self_bounds) and j < len(other_bounds):
+            # Skip the current range from one set if it ends before (without
+            # overlapping) the current range from the other set.
+            if self_bounds[i] >= other_bounds[j + 1]:
+                j += 2
+            elif other_bounds[j] >= self_bounds[i + 1]:
+                i += 2
             else:
                 return True
         return False
 
-    def _lookup(self, char):
-        """
-        Look for the range that contains ``char``.
-
-        If found, return ``(True, index)`` where ``index`` is the index of the
-        range that contains ``char``. Otherwise, return ``(False, index)``
-        where ``index`` is the index of the range right after the position for
-        ``char`` in the range list, plus 1, or 0 if it comes before the first
-        range.
-
-        :rtype: (bool, int)
-        """
-        # Inclusive bounds for the potential index we are looking for
-        low = 0
-        high = len(self.ranges) - 1
-
-        while low <= high:
-            # Inspect the range right in the middle of [low; high]
-            i = (low + high) // 2
-            r = self.ranges[i]
-
-            # If the range does not include ``char``, update the corresponding
-            # bound. Otherwise, just return the result.
-            if char < r[0]:
-                high = i - 1
-            elif char > r[1]:
-                low = i + 1
-            else:
-                return (True, i)
-
-        return (False, low)
-
-    def add(self, char):
+    @staticmethod
+    def for_category(category):
         """
-        Add a single character to this set.
+        Return the character set corresponding to the given Unicode general
+        category. Raise a KeyError if ``category`` is invalid.
 
-        :type char: str
+        :param str category: Name of the Unicode general category (see
+            unicodedata.category).
+        :rtype: CharSet
         """
-        self.add_range(char, char)
+        try:
+            return _unicode_categories_char_sets[category]
+        except KeyError:
+            pass
 
-    def add_int_range(self, low, high):
-        """
-        Add a range of characters to this set.
+        # The unicode_data module is auto-generated, so import it only when
+        # required.
+        from langkit.lexer.unicode_data import unicode_categories_ranges
+        offset, count = unicode_categories_ranges[category]
+        data = array.array(
+            'l', _load_unicode_data()[2 * offset:2 * (offset + count)]
+        )
 
-        :type low: int
-        :type righ: int
-        """
-        assert low <= MAXUNICODE and high <= MAXUNICODE
-
-        # Look for a range that contains the low bound
-        found, index = self._lookup(low)
-
-        # If we could find one, try to extend its high bound to include
-        # ``high``.
-        if found:
-            if high <= self.ranges[index][1]:
-                # If there is nothing to extend, just stop there
-                return
-            self.ranges[index] = (self.ranges[index][0], high)
-
-        # If the high bound of the range before is next to our low bound,
-        # extend its high bound.
-        elif index > 0 and self.ranges[index - 1][1] == low - 1:
-            self.ranges[index - 1] = (self.ranges[index - 1][0], high)
-            index = index - 1
-
-        # Otherwise just insert a new range
-        else:
-            self.ranges.insert(index, (low, high))
+        # Ranges in the packed data are already sorted and disjoint, so we
+        # just have to turn their inclusive high bounds into boundaries.
+        data[1::2] = array.array('l', [h + 1 for h in data[1::2]])
+        result = CharSet._from_bounds(data)
+        _unicode_categories_char_sets[category] = result
+        return result
 
-        # Convenient access to the range we added/extended
-        r0 = self.ranges[index]
 
-        # Merge ranges that can overlap with the modified entries
-        to_merge_index = index + 1
-        while to_merge_index < len(self.ranges):
-            r = self.ranges[to_merge_index]
+_unicode_categories_char_sets: Dict[str, CharSet] = {}
+"""
+Cache for CharSet.for_category.
+"""
 
-            if r[1] <= high:
-                # This range is completely included in the range we are adding,
-                # so we can remove it from our list.
-                self.ranges.pop(to_merge_index)
+_unicode_data = None
+"""
+Cache for _load_unicode_data.
 
-            elif r[0] <= high + 1:
-                # The low part of this range overlaps/is adjacent with the
-                # range we are adding, so we can extend the latter and remove
-                # the former.
-                self.ranges[index] = (r0[0], r[1])
-                self.ranges.pop(to_merge_index)
+:type: None|array.array
+"""
 
-            else:
-                # This range appears after and cannot be merged with the range
-                # we added, so there is nothing else to do.
-                break
+UNICODE_DATA_FILENAME = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'unicode_data.bin'
+)
 
-    def add_range(self, low, high):
-        """
-        Add a range of characters to this set.
 
-        :type low: str
-        :type righ: str
-        """
-        self.add_int_range(ord(low), ord(high))
+def _load_unicode_data():
+    """
+    Return the packed character ranges for all Unicode general categories, as
+    an array of unsigned 32-bit integers. Entries go by pair: low and high
+    bounds (both included) for each range.
 
-    @staticmethod
-    def for_category(category):
-        """
-        Return the character set corresponding to the given Unicode general
-        category. Raise a KeyError if ``category`` is invalid.
+    :rtype: array.array
+    """
+    global _unicode_data
+    if _unicode_data is None:
+        result = array.array('I')
+        assert result.itemsize == 4
+        with open(UNICODE_DATA_FILENAME, 'rb') as f:
+            result.frombytes(f.read())
 
-        :param str category: Name of the Unicode general category (see
-            unicodedata.category).
-        :rtype: CharSet
-        """
-        # The unicode_data module is auto-generated, so import is only when
-        # required.
-        from langkit.lexer.unicode_data import unicode_categories_char_sets
-        return unicode_categories_char_sets[category]
+        # The packed data is stored in little-endian byte order
+        if sys.byteorder != 'little':
+            result.byteswap()
+        _unicode_data = result
+    return _unicode_data
 
 
 def compute_unicode_categories_char_sets():
     # We assume here that the Python interpreter is built to use UCS-4 to
     # represent strings. It's fine because this code runs only to precompute
-    # data that will be cached in source code, not on every script using
+    # data that will be cached in the source tree, not on every script using
     # Langkit.
     sets = {}
     for i in range(MAXUNICODE + 1):
-        char = chr(i)
         cat = unicodedata.category(chr(i))
         for subcat in (cat, cat[0]):
-            sets.setdefault(subcat, CharSet())
-            sets[subcat].add(char)
+            ranges = sets.setdefault(subcat, [])
+            if ranges and ranges[-1][1] == i - 1:
+                ranges[-1] = (ranges[-1][0], i)
+            else:
+                ranges.append((i, i))
+    write_unicode_data(sets)
+
+
+def write_unicode_data(sets):
+    """
+    Write the unicode_data.py and unicode_data.bin files for the given
+    character ranges.
+
+    The binary file contains the packed ranges for all categories, as
+    little-endian unsigned 32-bit integers (low and high bounds for each
+    range) while the Python module maps category names to the location of
+    their ranges in the binary file. This way, loading category data is
+    cheap and only categories actually used get materialized as CharSet
+    instances.
+
+    :param dict[str, list[(int, int)]] sets: Sorted and disjoint ranges for
+        each Unicode general category.
+    """
+    data = array.array('I')
+    assert data.itemsize == 4
 
     lines = [
-        'from langkit.lexer.char_set import CharSet',
-        '',
-        '# Character sets for Unicode general categories. The following',
-        '# literal is precomputed from',
-        '# langkit.lexer.char_set.compute_unicode_categories_char_sets to',
-        '# avoid taking 6s at startup, even on modern hardware.',
+        '# Index for Unicode general categories in unicode_data.bin. This',
+        '# module is generated by',
+        '# langkit.lexer.char_set.compute_unicode_categories_char_sets: see',
+        '# langkit.lexer.char_set.CharSet.for_category.',
+        '#',
+        '# For each category name, this contains the index of its first range',
+        '# in unicode_data.bin and its number of ranges.',
         '',
-        'unicode_categories_char_sets = {',
+        'unicode_categories_ranges = {',
     ]
-    for cat, char_set in sorted(sets.items()):
-        lines.append('    {}: CharSet.from_int_ranges(*['.format(repr(cat)))
-        for low, high in char_set.ranges:
-            lines.append('        ({}, {}),'.format(low, high))
-        lines.append('    ]),')
+    for cat, ranges in sorted(sets.items()):
+        lines.append('    {}: ({}, {}),'.format(repr(cat), len(data) // 2,
+                                                len(ranges)))
+        for low, high in ranges:
+            data.append(low)
+            data.append(high)
     lines.append('}')
 
+    if sys.byteorder != 'little':
+        data.byteswap()
+    with open(UNICODE_DATA_FILENAME, 'wb') as f:
+        f.write(data.tobytes())
+
     filename = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                             'unicode_data.py')
-    with open(filename, 'wb') as f:
+    with open(filename, 'w') as f:
         for l in lines:
             f.write(l)
             f.write('\n')
 
 
 if __name__ == '__main__':
-    # When executed as the main script, regenerate the unicode_data.py file
+    # When executed as the main script, regenerate the unicode_data.py and
+    # unicode_data.bin files.
     compute_unicode_categories_char_sets()
@@ -1,16 +1,15 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import contextmanager
+import heapq
 import itertools
 import re
 
 
 from langkit.diagnostics import check_source_language
 from langkit.lexer.char_set import CharSet
-from langkit.lexer.unicode_data import unicode_categories_char_sets
 
 
 rule_name_re = re.compile('[a-zA-Z][a-zA-Z0-9_]*')
-del unicode_categories_char_sets
 
 
 def _to_dot(starting_state, get_transitions, get_state_label):
@@ -62,6 +61,59 @@ def _to_dot(starting_state, get_transitions, get_state_label):
     return '\n'.join(['digraph g {'] + nodes + edges + ['}'])
 
 
+def compute_char_classes(char_sets):
+    """
+    Compute equivalence classes of characters for the given character sets.
+
+    Two characters belong to the same class iff, for each character set in
+    ``char_sets``, they are either both in it or both out of it. Characters
+    that belong to no character set are left out of all classes.
+
+    Return a couple: the list of character sets for all classes, and for each
+    input character set, the sorted list of indexes (in the list of classes)
+    for the classes it is made of.
+
+    :param list[CharSet] char_sets: Character sets to partition.
+    :rtype: (list[CharSet], list[list[int]])
+    """
+    # Compute the stream of events: for each character, which character sets
+    # start to include it and which ones stop to include it.
+    events = defaultdict(lambda: ([], []))
+    for i, char_set in enumerate(char_sets):
+        for low, high in char_set.ranges:
+            events[low][0].append(i)
+            events[high + 1][1].append(i)
+
+    # Follow the stream of events: each interval between two consecutive events
+    # has a constant set of "active" character sets, which identifies the
+    # class that the interval belongs to.
+    class_indexes = {}
+    class_ranges = []
+    memberships = [[] for _ in char_sets]
+
+    active = set()
+    last_char = None
+    for char, (adding, removing) in sorted(events.items()):
+        if active:
+            key = frozenset(active)
+            try:
+                index = class_indexes[key]
+            except KeyError:
+                index = len(class_ranges)
+                class_indexes[key] = index
+                class_ranges.append([])
+                for i in key:
+                    memberships[i].append(index)
+            class_ranges[index].append((last_char, char - 1))
+
+        active.update(adding)
+        active.difference_update(removing)
+        last_char = char
+
+    return ([CharSet.from_int_ranges(*ranges) for ranges in class_ranges],
+            memberships)
+
+
 class SequenceReader:
     def __init__(self, sequence):
         self.sequence = sequence
@@ -546,197 +598,223 @@ class NFAState:
         :rtype: set[NFAState]
         """
         result = set()
-
-        def process(state):
+        queue = list(states)
+        while queue:
+            state = queue.pop()
             if state in result:
-                return
+                continue
             result.add(state)
             for chars, next_state in state.transitions:
-                if chars is None:
-                    process(next_state)
-
-        for state in states:
-            process(state)
+                if chars is None and next_state not in result:
+                    queue.append(next_state)
         return result
 
-    @staticmethod
-    def reachable_nonspontaneous_transitions(states):
+    def to_dfa(self):
         """
-        Return the list of non-spontaneous transitions that can be reached from
-        the given set of states.
+        Return the conversion of this NFA into a DFA.
 
-        Computing this is valid if following any spontaneous transition from
-        one given state leads to a state that is also in ``states``, i.e. if
-        ``follow_spontaneous_transitions(states) == states``.
+        :rtype: DFAState
+        """
+        return _SubsetConstruction().run(self)
 
-        :param set[NFAState] states: List of starting states.
-        :rtype: list[(CharSet, set[NFAState])]
+    def to_dot(self):
         """
-        result = []
-        for state in states:
-            for chars, next_state in state.transitions:
-                if chars is None:
-                    assert next_state in states
-                else:
-                    result.append((chars, next_state))
-        return result
+        Return a dot script representing this NFA.
 
-    @staticmethod
-    def hashable_state_set(states):
+        :rtype: str
         """
-        Return a value that can be used as a dict key/set element to represent
-        a set of states.
+        return _to_dot(self, lambda s: s.transitions, lambda s: s.label)
 
-        :rtype: set[states]
+
+class _SubsetConstruction:
+    """
+    Helper to convert a NFA into a DFA using the subset construction.
+
+    Sets of NFA states are represented as frozensets, interned so that each
+    DFA state is represented by exactly one frozenset instance. Spontaneous
+    closures (for single NFA states and for sets of NFA states) are computed
+    only once and the non-spontaneous transitions of each NFA state are
+    pre-sorted, so that computing the deterministic transitions for a set of
+    NFA states is a single sweep over the merged transition boundaries.
+    """
+
+    def __init__(self):
+        self.state_closures = {}
         """
-        return tuple(sorted(states))
+        Cache for spontaneous closures of single NFA states.
 
-    @staticmethod
-    def deterministic_transitions(states):
+        :type: dict[NFAState, frozenset[NFAState]]
         """
-        Return the set of deterministic (non-spontaneous and disjoint)
-        transitions that leave the "states" sub-graph.
 
-        This is a major helper in the convertion of NFAs into corresponding
-        DFAs.
+        self.set_closures = {}
+        """
+        Cache for spontaneous closures of sets of NFA states. Values are
+        interned: equal closures are the same frozenset instance.
 
-        The result is a mapping from sets of NFA states (destination of
-        deterministic transitions) to disjoint character sets (label for
-        transitions).
+        :type: dict[frozenset[NFAState], frozenset[NFAState]]
+        """
 
-        :param list[NFAState] states: Set of states from which we compute
-            transitions.
-        :rtype: dict[tuple[NFAState], CharSet]
+        self.boundaries = {}
         """
-        # First, collect for each reachable state the set of characters that
-        # allow to reach that state.
-        transitions = {}
-        for chars, next_state in NFAState.reachable_nonspontaneous_transitions(
-            states
-        ):
-            assert chars is not None
-            try:
-                other_chars = transitions[next_state]
-            except KeyError:
-                transitions[next_state] = chars
-            else:
-                transitions[next_state] = other_chars | chars
+        Cache for the transition boundaries of NFA states. For each NFA state,
+        this contains a list of ``(char, delta, next_state)`` triples sorted by
+        ``char``: ``delta`` is 1 when a range of characters that allows to
+        reach ``next_state`` starts at ``char``, and -1 when such a range ends
+        right before ``char``.
 
-        # Linearize the transition labels: flatten all character sets to have a
-        # stream of "start range"/"end range" of transitions considering all
-        # input characters.
-        #
-        # For instance, for the following transitions: {
-        #    S1: [a:z],
-        #    S2: [a:h, s],
-        #    S3: [f:l]
-        # }
-        # we will get the following stream of events: {
-        #    'a': Event(adding=S1;S2),
-        #    'f': Event(adding=S3),
-        #    'h': Event(removing=S2),
-        #    'l': Event(removing=S3),
-        #    's': Event(adding=S2,removing=S2),
-        #    'z': Event(removing=S1),
-        # }.
-        class Event:
-            def __init__(self):
-                self.adding = set()
-                self.removing = set()
-
-        events = defaultdict(Event)
-        for next_state, chars in transitions.items():
-            for r in chars.ranges:
-                events[r[0]].adding.add(next_state)
-                events[r[1]].removing.add(next_state)
-        events = sorted(events.items())
-
-        # The final step is to compute the set of transitions for which
-        # character sets are disjoint: just follow the stream of events.
-
-        result = defaultdict(CharSet)
-
-        def add_transition(low, high, states):
-            if not states:
-                return
-            states = NFAState.follow_spontaneous_transitions(states)
-            result[NFAState.hashable_state_set(states)].add_int_range(low,
-                                                                      high)
-
-        # Set of states "active" for the current position in the events stream
-        states = set()
-
-        # Character for the last event we processed
-        last_char = None
+        :type: dict[NFAState, list[(int, int, NFAState)]]
+        """
 
-        for char, event in events:
-            assert event.adding or event.removing
+    def state_closure(self, state):
+        """
+        Return the spontaneous closure of ``state``.
 
-            if event.adding:
-                add_transition(last_char, char - 1, states)
-                states = states.union(event.adding)
-                last_char = char
+        :type state: NFAState
+        :rtype: frozenset[NFAState]
+        """
+        try:
+            return self.state_closures[state]
+        except KeyError:
+            result = frozenset(
+                NFAState.follow_spontaneous_transitions([state]))
+            self.state_closures[state] = result
+            return result
+
+    def closure(self, states):
+        """
+        Return the interned spontaneous closure of the ``states`` set.
 
-            if event.removing:
-                add_transition(last_char, char, states)
-                states = states.difference(event.removing)
-                last_char = char + 1
+        :type states: frozenset[NFAState]
+        :rtype: frozenset[NFAState]
+        """
+        try:
+            return self.set_closures[states]
+        except KeyError:
+            pass
 
+        if len(states) == 1:
+            state, = states
+            result = self.state_closure(state)
+        else:
+            result = frozenset().union(*[self.state_closure(s)
+                                         for s in states])
+
+        # Intern the result so that all equal closures share the same
+        # instance.
+        result = self.set_closures.setdefault(result, result)
+        self.set_closures[states] = result
         return result
 
-    def to_dfa(self):
+    def state_boundaries(self, state):
         """
-        Return the conversion of this NFA into a DFA.
+        Return the sorted transition boundaries for ``state``.
 
-        :rtype: DFAState
+        :type state: NFAState
+        :rtype: list[(int, int, NFAState)]
         """
-        result = None
-
-        # Mapping from sets of NFAState nodes (see NFAState.hashable_state_set)
-        # to the corresponding DFAState nodes.
-        dfa_states = {}
-
-        # List of tuple[NFAState], CharSet and tuple[NFAState] for the
-        # transitions that constitute the DFA.
-        transitions = []
+        try:
+            return self.boundaries[state]
+        except KeyError:
+            pass
 
-        queue = {
-            self.hashable_state_set(
-                self.follow_spontaneous_transitions([self])
-            )
-        }
-        while queue:
-            states = queue.pop()
-            if states in dfa_states:
-                return
+        result = []
+        for chars, next_state in state.transitions:
+            if chars is not None:
+                for low, high in chars.ranges:
+                    result.append((low, 1, next_state))
+                    result.append((high + 1, -1, next_state))
+        result.sort(key=lambda b: b[0])
+        self.boundaries[state] = result
+        return result
 
-            new_node = DFAState(labels={s.label for s in states
-                                        if s.label is not None})
-            dfa_states[states] = new_node
-            if result is None:
-                result = new_node
+    def deterministic_transitions(self, states):
+        """
+        Return the set of deterministic (non-spontaneous and disjoint)
+        transitions that leave the "states" sub-graph.
 
-            for next_states, char_set in self.deterministic_transitions(
-                states
-            ).items():
-                if next_states not in dfa_states:
-                    queue.add(next_states)
-                transitions.append((states, char_set, next_states))
+        The result is a list of couples: interned closures of NFA states
+        (destination of deterministic transitions) and disjoint character sets
+        (label for transitions), sorted by first character.
 
-        for states, char_set, next_states in transitions:
-            dfa_states[states].add_transition(char_set,
-                                              dfa_states[next_states])
+        :param frozenset[NFAState] states: Closed set of states from which we
+            compute transitions.
+        :rtype: list[(frozenset[NFAState], CharSet)]
+        """
+        # Sweep over the merged stream of boundaries for all states. For each
+        # position in this stream, "active" contains the set of NFA states
+        # that are reachable with the characters that follow this position,
+        # associated to the number of ranges that allow to reach them (several
+        # states in "states" can have overlapping transitions to the same
+        # next state).
+        ranges = {}
+        active = {}
+        last_char = None
+        for char, delta, next_state in heapq.merge(
+            *[self.state_boundaries(s) for s in states],
+            key=lambda b: b[0]
+        ):
+            if char != last_char:
+                if active:
+                    ranges.setdefault(frozenset(active), []).append(
+                        (last_char, char - 1)
+                    )
+                last_char = char
 
-        assert result
-        return result
+            count = active.get(next_state, 0) + delta
+            if count:
+                active[next_state] = count
+            else:
+                del active[next_state]
+        assert not active
+
+        # Ranges for each set of next states are sorted and disjoint, so
+        # building character sets out of them is straightforward.
+        result = {}
+        for next_states, next_ranges in ranges.items():
+            char_set = CharSet.from_int_ranges(*next_ranges)
+            next_states = self.closure(next_states)
+            try:
+                other_char_set = result[next_states]
+            except KeyError:
+                result[next_states] = char_set
+            else:
+                result[next_states] = other_char_set | char_set
+        return sorted(result.items(), key=lambda t: t[1].ranges[0])
 
-    def to_dot(self):
+    def run(self, start):
         """
-        Return a dot script representing this NFA.
+        Return the conversion of the NFA that starts at ``start`` into a DFA.
 
-        :rtype: str
+        :type start: NFAState
+        :rtype: DFAState
         """
-        return _to_dot(self, lambda s: s.transitions, lambda s: s.label)
+        start_states = self.closure(frozenset([start]))
+
+        # Mapping from interned sets of NFAState nodes to the corresponding
+        # DFAState nodes.
+        dfa_states = {}
+
+        def get_dfa_state(states):
+            try:
+                return dfa_states[states]
+            except KeyError:
+                result = DFAState(labels={s.label for s in states
+                                          if s.label is not None})
+                dfa_states[states] = result
+                queue.append(states)
+                return result
+
+        queue = deque()
+        result = get_dfa_state(start_states)
+        while queue:
+            states = queue.popleft()
+            dfa_state = dfa_states[states]
+            for next_states, char_set in self.deterministic_transitions(
+                states
+            ):
+                dfa_state.add_transition(char_set, get_dfa_state(next_states))
+
+        return result
 
 
 class DFAState:
@@ -784,6 +862,159 @@ class DFAState:
 
         self.transitions.append((chars, next_state))
 
+    @property
+    def reachable_states(self):
+        """
+        Return the list of states reachable from this one, including itself.
+
+        States are sorted in breadth-first order (transitions are followed in
+        character set order), so that the result is deterministic. The first
+        element is always ``self``.
+
+        :rtype: list[DFAState]
+        """
+        result = [self]
+        visited = {self}
+        i = 0
+        while i < len(result):
+            for _, next_state in sorted(result[i].transitions,
+                                        key=lambda t: t[0]):
+                if next_state not in visited:
+                    visited.add(next_state)
+                    result.append(next_state)
+            i += 1
+        return result
+
+    def minimize(self, get_key):
+        """
+        Return the start state of a minimal DFA equivalent to the one that
+        starts at this state.
+
+        This implements Hopcroft's partition refinement algorithm. The input
+        alphabet is first compressed into equivalence classes of characters
+        (see ``compute_char_classes``), so that refinement works on a
+        reasonably small set of letters even with big Unicode character sets.
+
+        Note that the start state is never merged with other states: no
+        transition can go to it in the original DFA, and code generation
+        relies on this property.
+
+        :param get_key: Function that returns, for a given DFA state, a
+            hashable value that identifies what happens when the automaton
+            reaches it (for instance the token action to execute). Only states
+            with equal keys can be merged.
+        :type get_key: (DFAState) -> T
+        :rtype: DFAState
+        """
+        states = self.reachable_states
+        state_indexes = {s: i for i, s in enumerate(states)}
+
+        # Compress the input alphabet into character classes
+        char_sets = sorted({chars
+                            for s in states
+                            for chars, _ in s.transitions})
+        char_set_indexes = {cs: i for i, cs in enumerate(char_sets)}
+        _, memberships = compute_char_classes(char_sets)
+
+        # For each couple (character class, target state), compute the list of
+        # states that transition to that target for that class. Also compute,
+        # for each state, the set of classes for incoming transitions, so that
+        # we do not consider useless splitters.
+        inverse = defaultdict(list)
+        incoming = [set() for _ in states]
+        for i, s in enumerate(states):
+            for chars, next_state in s.transitions:
+                target = state_indexes[next_state]
+                classes = memberships[char_set_indexes[chars]]
+                incoming[target].update(classes)
+                for c in classes:
+                    inverse[(c, target)].append(i)
+
+        # Compute the initial partition: the start state on its own, and other
+        # states grouped by key.
+        blocks = [{0}]
+        block_of = [0] * len(states)
+        key_to_block = {}
+        for i, s in enumerate(states[1:], 1):
+            key = get_key(s)
+            try:
+                b = key_to_block[key]
+            except KeyError:
+                b = len(blocks)
+                key_to_block[key] = b
+                blocks.append(set())
+            blocks[b].add(i)
+            block_of[i] = b
+
+        def splitters(b):
+            return {(b, c) for i in blocks[b] for c in incoming[i]}
+
+        # Since the DFA is not complete (characters that do not appear in
+        # transitions lead to an implicit sink state), all blocks from the
+        # initial partition must be used as splitters.
+        worklist = set()
+        for b in range(len(blocks)):
+            worklist.update(splitters(b))
+
+        while worklist:
+            b, c = worklist.pop()
+
+            # Group by block all states that transition to ``b`` for the ``c``
+            # character class.
+            touched = defaultdict(set)
+            for target in blocks[b]:
+                for source in inverse.get((c, target), ()):
+                    touched[block_of[source]].add(source)
+
+            # Split all blocks that ``b`` partially reaches. The biggest half
+            # keeps the original block index, so that splitters already in the
+            # worklist remain valid and so that we only need to add splitters
+            # for the smallest half.
+            for y, inter in touched.items():
+                block = blocks[y]
+                if len(inter) == len(block):
+                    continue
+                rest = block - inter
+                small, big = ((inter, rest)
+                              if len(inter) <= len(rest) else
+                              (rest, inter))
+                new_block = len(blocks)
+                blocks[y] = big
+                blocks.append(small)
+                for i in small:
+                    block_of[i] = new_block
+                worklist.update(splitters(new_block))
+
+        # Now create the minimal DFA: one state per block. Process blocks in
+        # the order of their first state in ``states`` for determinism.
+        first_index = {}
+        for i, b in enumerate(block_of):
+            first_index.setdefault(b, i)
+
+        new_states = {}
+        for b, i in sorted(first_index.items(), key=lambda item: item[1]):
+            new_states[b] = DFAState(labels=set().union(
+                *(states[j].labels for j in blocks[b])
+            ))
+
+        for b, i in first_index.items():
+            # All states in a block have equivalent transitions, so use the
+            # first one as representative. Group transitions by target block
+            # to create as few transitions as possible.
+            transitions = {}
+            for chars, next_state in states[i].transitions:
+                target = block_of[state_indexes[next_state]]
+                try:
+                    transitions[target] = transitions[target] | chars
+                except KeyError:
+                    transitions[target] = chars
+
+            for target, chars in sorted(transitions.items(),
+                                        key=lambda t: t[1]):
+                new_states[b].add_transition(chars, new_states[target])
+
+        return new_states[block_of[0]]
+
     def to_dot(self):
         """
         Return a dot script representing this DFA.
@@ -885,7 +1116,15 @@ class DFACodeGenHolder:
         def has_transitions(self):
             return self.case_transitions or self.table_transitions
 
-    def __init__(self, dfa, get_action):
+    def __init__(self, dfa, get_action, table_driven=False):
+        """
+        :param DFAState dfa: Start state for the DFA to implement.
+        :param get_action: Function that returns the action to execute for a
+            given set of DFA state labels.
+        :param bool table_driven: If true, compute compact transition tables
+            (see DFATables) to generate a table-driven lexer instead of a
+            state machine made of case statements.
+        """
         self.states = []
         """
         :type: list[DFACodeGenHolder.State]
@@ -944,6 +1183,14 @@ class DFACodeGenHolder:
                 new_transitions.append((table_name, next_state))
             state.table_transitions = new_transitions
 
+        self.tables = DFATables(self.states) if table_driven else None
+        """
+        If the table-driven lexer backend is requested, transition tables for
+        this DFA. None otherwise.
+
+        :type: DFATables|None
+        """
+
     def ada_table_decls(self, prefix):
         """
         Helper to generate the Ada declarations for character lookup tables.
@@ -966,3 +1213,268 @@ class DFACodeGenHolder:
             lines.extend(ranges)
             lines.append(');')
         return '\n'.join(prefix + line for line in lines)
+
+
+class DFATables:
+    """
+    Compact transition tables to implement a DFA, for the table-driven lexer
+    backend.
+
+    The character space is compressed into equivalence classes (see
+    ``compute_char_classes``), numbered from 1 (0 stands for characters that
+    no transition accepts). States are numbered from 1 following the order of
+    ``DFACodeGenHolder.states``.
+
+    The transition function is then stored in comb-packed arrays (also known
+    as row displacement): for a state S and a character class C, if
+    ``checks[bases[S] + C] == S`` then the next state is ``targets[bases[S] +
+    C]``, and there is no transition otherwise.
+    """
+
+    def __init__(self, states):
+        """
+        :param list[DFACodeGenHolder.State] states: States for the DFA to
+            implement.
+        """
+        state_ids = {s.dfa_state: i for i, s in enumerate(states, 1)}
+
+        char_sets = sorted({chars
+                            for s in states
+                            for chars, _ in s.dfa_state.transitions})
+        char_set_indexes = {cs: i for i, cs in enumerate(char_sets)}
+        classes, memberships = compute_char_classes(char_sets)
+
+        self.classes_count = len(classes)
+        """
+        Number of character classes.
+
+        :type: int
+        """
+
+        self.ascii_classes = [0] * 128
+        """
+        Class for each ASCII character.
+
+        :type: list[int]
+        """
+
+        self.non_ascii_classes = []
+        """
+        Sorted list of disjoint character ranges, with the associated class,
+        for non-ASCII characters. Characters that are not covered have class
+        0.
+
+        :type: list[(int, int, int)]
+        """
+
+        for c, char_set in enumerate(classes, 1):
+            ascii, non_ascii = char_set.split_ascii_subsets
+            for low, high in ascii.ranges:
+                for char in range(low, high + 1):
+                    self.ascii_classes[char] = c
+            self.non_ascii_classes.extend(
+                (low, high, c) for low, high in non_ascii.ranges
+            )
+        self.non_ascii_classes.sort()
+
+        self.actions = []
+        """
+        List of distinct actions to execute when reaching DFA states. Action
+        indexes start at 1.
+
+        :type: list[langkit.lexer.Action]
+        """
+
+        self.state_actions = []
+        """
+        For each state, index of the action to execute when reaching it, or 0
+        if there is no action.
+
+        :type: list[int]
+        """
+
+        action_indexes = {}
+        for s in states:
+            if s.action is None:
+                self.state_actions.append(0)
+                continue
+            try:
+                index = action_indexes[s.action]
+            except KeyError:
+                self.actions.append(s.action)
+                index = len(self.actions)
+                action_indexes[s.action] = index
+            self.state_actions.append(index)
+
+        # Compute transition rows: for each state, mapping from character
+        # classes to next state ids.
+        rows = []
+        for s in states:
+            row = {}
+            for chars, next_state in s.dfa_state.transitions:
+                for c in memberships[char_set_indexes[chars]]:
+                    row[c + 1] = state_ids[next_state]
+            rows.append(row)
+
+        self.bases, self.targets, self.checks = self._pack(rows)
+
+    def _pack(self, rows):
+        """
+        Pack the given transition rows into row displacement tables.
+
+        This uses the "first fit decreasing" heuristic: rows are placed from
+        the biggest to the smallest one, each at the lowest base that does not
+        make it collide with already placed rows.
+
+        :param list[dict[int, int]] rows: For each state, mapping from
+            character classes to next state ids.
+        :return: The list of bases, the list of next states and the list of
+            check values. Note that indexes for bases start at 1 (for state
+            ids) while indexes for targets and checks start at 0.
+        :rtype: (list[int], list[int], list[int])
+        """
+        bases = [0] * len(rows)
+        size = self.classes_count + 1
+        occupied = bytearray(size)
+        targets = [0] * size
+        checks = [0] * size
+
+        for state_id, row in sorted(enumerate(rows, 1),
+                                    key=lambda r: (-len(r[1]), r[0])):
+            if not row:
+                continue
+            classes = sorted(row)
+            first = classes[0]
+
+            # Look for the first free slot for the first class, then check
+            # that all other classes fit as well.
+            pos = occupied.find(0, first)
+            while True:
+                if pos == -1:
+                    pos = len(occupied)
+                base = pos - first
+                if all(base + c >= len(occupied) or not occupied[base + c]
+                       for c in classes):
+                    break
+                pos = occupied.find(0, pos + 1)
+
+            # Make sure tables are big enough for any class lookup from this
+            # state.
+            required = base + self.classes_count + 1
+            if required > len(occupied):
+                extra = required - len(occupied)
+                occupied.extend(bytes(extra))
+                targets.extend([0] * extra)
+                checks.extend([0] * extra)
+
+            bases[state_id - 1] = base
+            for c in classes:
+                occupied[base + c] = 1
+                targets[base + c] = row[c]
+                checks[base + c] = state_id
+
+        return bases, targets, checks
+
+    @staticmethod
+    def _ada_array(name, type_name, values, prefix):
+        """
+        Return lines for the declaration of an Ada constant array.
+
+        :param str name: Name for the constant.
+        :param str type_name: Name of the array type.
+        :param list[str] values: Values for array items.
+        :param str prefix: Prefix for all lines.
+        :rtype: list[str]
+        """
+        # Positional aggregates need at least two items
+        if len(values) == 1:
+            values = ['1 => {}'.format(values[0])]
+
+        lines = ['{} : constant {} := ('.format(name, type_name)]
+        line = ''
+        for i, v in enumerate(values):
+            item = v + (',' if i < len(values) - 1 else '')
+            if line and len(prefix) + len(line) + len(item) > 75:
+                lines.append(line)
+                line = ''
+            line = '{} {}'.format(line, item) if line else '   ' + item
+        lines.append(line)
+        lines.append(');')
+        return [prefix + text for text in lines]
+
+    def ada_table_decls(self, prefix):
+        """
+        Helper to generate the Ada declarations for transition tables.
+        """
+        states_count = len(self.state_actions)
+        lines = [
+            'subtype Character_Class is Natural range 0 .. {};'
+            .format(self.classes_count),
+            '--  Character equivalence class. 0 is for characters that no'
+            ' transition',
+            '--  accepts.',
+            '',
+            'subtype State_Id is Natural range 0 .. {};'
+            .format(states_count),
+            '--  DFA state. 0 is used in the transition checks table to'
+            ' denote unused',
+            '--  entries.',
+            '',
+            'subtype Action_Id is Natural range 0 .. {};'
+            .format(len(self.actions)),
+            '--  Action to execute when reaching a DFA state. 0 is for no'
+            ' action.',
+            '',
+            'type ASCII_Class_Array is array',
+            "  (Character_Type range Character_Type'Val (0)"
+            " .. Character_Type'Val (127))",
+            '  of Character_Class;',
+            'type Action_Array is array (1 .. {}) of Action_Id;'
+            .format(states_count),
+            'type Base_Array is array (1 .. {}) of Natural;'
+            .format(states_count),
+            'type State_Array is array (1 .. {}) of State_Id;'
+            .format(len(self.targets)),
+            '',
+        ]
+        lines = [prefix + text if text else text for text in lines]
+
+        lines.extend(self._ada_array(
+            'ASCII_Classes', 'ASCII_Class_Array',
+            [str(c) for c in self.ascii_classes], prefix
+        ))
+
+        if self.non_ascii_classes:
+            lines.extend([
+                '',
+                prefix + 'type Class_Range is record',
+                prefix + '   First, Last : Character_Type;',
+                prefix + '   Class       : Character_Class;',
+                prefix + 'end record;',
+                '',
+                prefix + 'type Class_Range_Array is array (Positive range <>)'
+                ' of Class_Range;',
+                prefix + '--  Sorted list of dijoint character ranges',
+                '',
+            ])
+            lines.extend(self._ada_array(
+                'Non_ASCII_Classes', 'Class_Range_Array',
+                ["(Character_Type'Val ({}), Character_Type'Val ({}), {})"
+                 .format(low, high, c)
+                 for low, high, c in self.non_ascii_classes],
+                prefix
+            ))
+
+        # Table indexes start at 1 in Ada, while they start at 0 here: shift
+        # targets and checks so that "bases[S] + C" is still the right index.
+        for name, type_name, values in [
+            ('State_Actions', 'Action_Array', self.state_actions),
+            ('State_Bases', 'Base_Array', self.bases),
+            ('Transition_Targets', 'State_Array', self.targets[1:] + [0]),
+            ('Transition_Checks', 'State_Array', self.checks[1:] + [0]),
+        ]:
+            lines.append('')
+            lines.extend(self._ada_array(name, type_name,
+                                         [str(v) for v in values], prefix))
+
+        return '\n'.join(lines)
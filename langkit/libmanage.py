@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 import glob
 import inspect
@@ -24,6 +25,7 @@ from langkit.diagnostics import (
     Context, DiagnosticError, DiagnosticStyle, Diagnostics, Location,
     WarningSet, check_source_language, extract_library_location
 )
+from langkit.gdb.debug_info import write_index as write_debug_info_index
 from langkit.packaging import Packager
 from langkit.utils import (Colors, LibraryTypes, Log, add_to_path, col,
                            format_setenv, get_cpu_count, printcol)
@@ -106,6 +108,12 @@ class ManageScript:
     Whether to enable build warnings.
     """
 
+    parallel_library_types: bool
+    """
+    Whether each library type gets its own object directory, so that library
+    types can be built concurrently.
+    """
+
     context: CompileCtx
     """
     Langkit compilation context. The create_context method will create the
@@ -155,6 +163,7 @@ class ManageScript:
             self.do_generate, needs_context=True
         )
         self.add_generate_args(generate_parser)
+        self.add_jobs_arg(generate_parser)
 
         #########
         # Build #
@@ -164,6 +173,7 @@ class ManageScript:
             self.do_build, needs_context=True
         )
         self.add_build_args(build_parser)
+        self.add_jobs_arg(build_parser)
 
         ########
         # Make #
@@ -174,6 +184,7 @@ class ManageScript:
         )
         self.add_generate_args(make_parser)
         self.add_build_args(make_parser)
+        self.add_jobs_arg(make_parser)
 
         ########################
         # List optional passes #
@@ -501,6 +512,45 @@ class ManageScript:
             '--strict-sound-envs', action='store_true',
             help='Enable strict behavior for sound environments'
         )
+        subparser.add_argument(
+            '--no-lexer-minimization', action='store_true',
+            help='Do not minimize the lexer state machine before generating'
+                 ' code for it. Minimization reduces the size of the'
+                 ' generated lexer, but takes more time during generation.'
+        )
+        subparser.add_argument(
+            '--profile-passes', action='store_true',
+            help='Record wall time, CPU time and memory usage for each'
+                 ' compilation pass, print a summary table at the end of'
+                 ' generation and write detailed results to'
+                 ' $BUILD_DIR/passes_profile.json.'
+        )
+        subparser.add_argument(
+            '--table-driven-lexer', action='store_true',
+            help='Implement the lexer state machine as a loop over compact'
+                 ' transition tables instead of one block of code per state.'
+                 ' This generates much less code for big lexers, and thus'
+                 ' reduces compilation time.'
+        )
+        subparser.add_argument(
+            '--no-render-cache', action='store_true',
+            help='Render all source files, even the ones whose inputs did not'
+                 ' change since they were last generated.'
+        )
+
+    @staticmethod
+    def add_jobs_arg(subparser: argparse.ArgumentParser) -> None:
+        """
+        Add the argument to control parallelism to "subparser".
+        """
+        subparser.add_argument(
+            '--jobs', '-j', type=int, default=None,
+            help='Number of parallel jobs to spawn in parallel. For code'
+                 ' generation, this is the number of processes used to render'
+                 ' independent source files concurrently (default: 1). For'
+                 ' builds, this is passed to gprbuild (default: your number'
+                 ' of cpu).'
+        )
 
     def add_build_mode_arg(self, subparser: argparse.ArgumentParser) -> None:
         subparser.add_argument(
@@ -508,16 +558,18 @@ class ManageScript:
             default='dev',
             help='Selects a preset for build options.'
         )
+        subparser.add_argument(
+            '--parallel-library-types', action='store_true',
+            help='Use one object directory per library type for the generated'
+                 ' library, and build library types concurrently. As this'
+                 ' changes the layout of the build tree, pass this option to'
+                 ' all the commands that use a given build tree.'
+        )
 
     def add_build_args(self, subparser: argparse.ArgumentParser) -> None:
         """
         Add arguments to tune code compilation to "subparser".
         """
-        subparser.add_argument(
-            '--jobs', '-j', type=int, default=get_cpu_count(),
-            help='Number of parallel jobs to spawn in parallel (default: your'
-                 ' number of cpu).'
-        )
         self.add_build_mode_arg(subparser)
         subparser.add_argument(
             '--enable-build-warnings',
@@ -633,6 +685,9 @@ class ManageScript:
         self.enable_build_warnings = getattr(
             parsed_args, "enable_build_warnings", False
         )
+        self.parallel_library_types = getattr(
+            parsed_args, "parallel_library_types", False
+        )
 
         # If there is no build_mode (ie. we're not running a command that
         # requires it), we still need one to call gnatpp, so set it to a dummy
@@ -764,6 +819,12 @@ class ManageScript:
             unparse_script=args.unparse_script,
             explicit_passes_triggers=explicit_passes_triggers,
             strict_sound_envs=args.strict_sound_envs,
+            minimize_lexer_dfa=not args.no_lexer_minimization,
+            table_driven_lexer=args.table_driven_lexer,
+            profile_passes=(self.dirs.build_dir('passes_profile.json')
+                            if args.profile_passes else None),
+            jobs=getattr(args, 'jobs', None) or 1,
+            render_cache=not args.no_render_cache,
         )
 
     def gnatpp(self, project_file: str, glob_pattern: str) -> None:
@@ -826,6 +887,12 @@ class ManageScript:
             self.gnatpp(self.mains_project,
                         self.dirs.build_dir('src-mains', '*.ad*'))
 
+            # Pretty-printing moved GDB helpers directives around: refresh
+            # their index so that it matches the final sources.
+            write_debug_info_index(self.dirs.build_dir(
+                'src', '{}-implementation.adb'.format(self.lib_name.lower())
+            ))
+
         self.log_info("Generation complete!", Colors.OKGREEN)
 
     def what_to_build(self,
@@ -882,8 +949,47 @@ class ManageScript:
                 '-X{}_WARNINGS=true'.format(self.lib_name.upper())
             )
 
+        if self.parallel_library_types:
+            result.append(
+                '-X{}_LIBRARY_TYPE_OBJ_DIRS=true'.format(self.lib_name.upper())
+            )
+
         return result
 
+    def library_obj_dir(self, library_type: str) -> str:
+        """
+        Return the object directory for the generated library project when
+        each library type gets its own object directory.
+
+        :param library_type: Library flavor to use.
+        """
+        return self.dirs.build_dir(
+            'obj', '{}-{}'.format(self.build_mode, library_type)
+        )
+
+    def seed_obj_dir(self, src_dir: str, dest_dir: str) -> None:
+        """
+        Copy compilation artifacts from the ``src_dir`` object directory to
+        the ``dest_dir`` one, unless ``dest_dir`` already has up-to-date
+        copies. This allows GPRbuild to reuse compilation results across
+        library types that are compiled with the same switches.
+
+        "*.lexch" files are not copied, so that GPRbuild still builds the
+        library in ``dest_dir`` (see SB18-035 in the "gprbuild" method).
+        """
+        os.makedirs(dest_dir, exist_ok=True)
+        for name in os.listdir(src_dir):
+            src = os.path.join(src_dir, name)
+            dest = os.path.join(dest_dir, name)
+            if (
+                name.endswith('.lexch')
+                or not os.path.isfile(src)
+                or (os.path.exists(dest)
+                    and os.path.getmtime(dest) >= os.path.getmtime(src))
+            ):
+                continue
+            shutil.copy2(src, dest)
+
     def gprbuild(self,
                  args: argparse.Namespace,
                  project_file: str,
@@ -913,15 +1019,17 @@ class ManageScript:
         :param mains: If provided, list of main programs to build. By default,
             GPRbuild builds them all, so this arguments makes it possible to
             build only a subset of them.
+
+        If each library type gets its own object directory (see the
+        --parallel-library-types option), the generated library is built for
+        the first library type, then for all the other ones concurrently.
         """
         lexch_patterns = [os.path.join(os.path.dirname(project_file),
                                        obj_dir, '*.lexch')
                           for obj_dir in obj_dirs]
 
-        base_argv = [
-            'gprbuild', '-p', '-j{}'.format(args.jobs),
-            '-P{}'.format(project_file),
-        ]
+        jobs = args.jobs or get_cpu_count()
+        base_argv = ['gprbuild', '-p', '-P{}'.format(project_file)]
 
         if not args.with_rpath:
             # Prevent GPRbuild from adding RPATH to links, as paths will not be
@@ -939,18 +1047,14 @@ class ManageScript:
         gargs = getattr(args, 'gargs') or []
         gargs = sum((shlex.split(args) for args in gargs), [])
 
-        def run(library_type: str) -> None:
-            # Remove the "*.lexch" file
-            for pattern in lexch_patterns:
-                files = glob.glob(pattern)
-                for f in files:
-                    self.log_debug('Removing {}'.format(f), Colors.CYAN)
-                    os.remove(f)
-                if not files:
-                    self.log_debug('No *.lexch file to remove from {}'
-                                   .format(pattern), Colors.CYAN)
-
+        def run(library_type: str,
+                jobs: int,
+                extra_argv: Optional[List[str]] = None,
+                abort_on_error: bool = True) -> bool:
             argv = list(base_argv)
+            argv.append('-j{}'.format(jobs))
+            if extra_argv:
+                argv.extend(extra_argv)
             argv.extend(
                 self.gpr_scenario_vars(library_type=library_type)
             )
@@ -959,16 +1063,65 @@ class ManageScript:
             if Diagnostics.style == DiagnosticStyle.gnu_full:
                 argv.append('-gnatef')
             argv.extend(gargs)
-            self.check_call('Build', argv)
+            return self.check_call('Build', argv,
+                                   abort_on_error=abort_on_error)
+
+        library_types = [
+            library_type
+            for library_type, enabled in zip(
+                ('relocatable', 'static-pic', 'static'),
+                self.what_to_build(args, is_library)
+            )
+            if enabled
+        ]
 
-        build_shared, build_static_pic, build_static = self.what_to_build(
-            args, is_library)
-        if build_shared:
-            run('relocatable')
-        if build_static_pic:
-            run('static-pic')
-        if build_static:
-            run('static')
+        if (
+            not self.parallel_library_types
+            or project_file != self.lib_project
+            or len(library_types) <= 1
+        ):
+            for library_type in library_types:
+                # Remove the "*.lexch" file
+                for pattern in lexch_patterns:
+                    files = glob.glob(pattern)
+                    for f in files:
+                        self.log_debug('Removing {}'.format(f), Colors.CYAN)
+                        os.remove(f)
+                    if not files:
+                        self.log_debug('No *.lexch file to remove from {}'
+                                       .format(pattern), Colors.CYAN)
+
+                run(library_type, jobs)
+            return
+
+        # GPRbuild compiles relocatable and static-pic libraries with the same
+        # switches (both are position-independent code), but not static ones.
+        # So first build the library for one library type only, with the
+        # whole job budget, and if it is position-independent, make its
+        # compilation results available to the other position-independent
+        # library type.
+        pic_library_types = ('relocatable', 'static-pic')
+        first, others = library_types[0], library_types[1:]
+        run(first, jobs)
+        if first in pic_library_types:
+            for library_type in others:
+                if library_type in pic_library_types:
+                    self.seed_obj_dir(self.library_obj_dir(first),
+                                      self.library_obj_dir(library_type))
+
+        # Then build the other library types concurrently, sharing the job
+        # budget. Thanks to "-s", GPRbuild still recompiles seeded units whose
+        # compilation switches differ for some library type (for instance
+        # because of project extensions).
+        others_jobs = max(1, jobs // len(others))
+        with ThreadPoolExecutor(len(others)) as executor:
+            results = list(executor.map(
+                lambda library_type: run(library_type, others_jobs, ['-s'],
+                                         abort_on_error=False),
+                others
+            ))
+        if not all(results):
+            sys.exit(1)
 
     def gprinstall(self,
                    args: argparse.Namespace,
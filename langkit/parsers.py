@@ -182,6 +182,76 @@ def reject_synthetic(node):
                           'Parsers cannot create synthetic nodes')
 
 
+class MemoStrategy:
+    """
+    Memoization strategy for the packrat table of a parsing rule.
+
+    Use the ``ring``, ``dense`` and ``hashed`` class methods to create
+    instances: see ``Langkit_Support.Packrat`` for more details about each
+    strategy.
+    """
+
+    RING = 'ring'
+    DENSE = 'dense'
+    HASHED = 'hashed'
+
+    def __init__(self, kind, size=None):
+        """
+        :param str kind: One of RING, DENSE or HASHED.
+        :param int|None size: Number of entries for RING tables, None for
+            other kinds.
+        """
+        assert kind in (self.RING, self.DENSE, self.HASHED)
+        assert (size is not None) == (kind == self.RING)
+        self.kind = kind
+        self.size = size
+
+    @classmethod
+    def ring(cls, size=16):
+        """
+        Return a strategy for fixed-size tables that keep only one entry per
+        ``offset mod size`` slot. This is the default.
+
+        :param int size: Number of entries in the table.
+        :rtype: MemoStrategy
+        """
+        check_source_language(size > 0, 'Ring memo tables must not be empty')
+        return cls(cls.RING, size)
+
+    @classmethod
+    def dense(cls):
+        """
+        Return a strategy for tables that have one entry per token.
+
+        :rtype: MemoStrategy
+        """
+        return cls(cls.DENSE)
+
+    @classmethod
+    def hashed(cls):
+        """
+        Return a strategy for tables that store entries in a hashed map keyed
+        on token offsets.
+
+        :rtype: MemoStrategy
+        """
+        return cls(cls.HASHED)
+
+    @property
+    def ada_kind(self):
+        """
+        Name of the corresponding Langkit_Support.Packrat.Memo_Kind value.
+
+        :rtype: str
+        """
+        return names.Name.from_lower(self.kind).camel_with_underscores
+
+    def __repr__(self):
+        return ('<MemoStrategy {} ({})>'.format(self.kind, self.size)
+                if self.size else
+                '<MemoStrategy {}>'.format(self.kind))
+
+
 class Grammar:
     """
     Holder for parsing rules.
@@ -202,6 +272,14 @@ class Grammar:
         :type: dict[str, liblktlang.GrammarRuleExpr]
         """
 
+        self.memo_strategies = {}
+        """
+        Mapping from rule names to the memoization strategy to use for them,
+        overriding the context-wide default strategy.
+
+        :type: dict[str, MemoStrategy]
+        """
+
     def context(self):
         return Context(self.location)
 
@@ -274,6 +352,23 @@ class Grammar:
                 rule.set_location(Location(loc.file, keywords[name].lineno))
             self._add_rule(name, rule)
 
+    def set_memo_strategies(self, **kwargs):
+        """
+        Override the memoization strategy for some rules. The keyword
+        arguments associate rule names to memoization strategies.
+
+        :param dict[str, MemoStrategy] kwargs: The strategies to use.
+        """
+        for name, strategy in kwargs.items():
+            with self.context():
+                check_source_language(
+                    isinstance(strategy, MemoStrategy),
+                    'Invalid memoization strategy for rule {}: {}'.format(
+                        name, strategy
+                    )
+                )
+            self.memo_strategies[name] = strategy
+
     def get_rule(self, rule_name):
         """
         Helper to return the rule corresponding to rule_name. The benefit of
@@ -395,6 +490,21 @@ class Grammar:
                     )
                 )
 
+    def check_memo_strategies(self, context):
+        """
+        Emit an error if a memoization strategy was set for a missing rule.
+
+        :type context: langkit.compile_context.CompileCtx
+        """
+        for name in sorted(self.memo_strategies):
+            with self.context():
+                check_source_language(
+                    name in self.rules,
+                    'Memoization strategy set for unknown rule: {}'.format(
+                        name
+                    )
+                )
+
 
 class Parser:
     """
@@ -668,6 +778,19 @@ class Parser:
         self._name = name
         self.gen_fn_name = gen_name(name + self.base_name)
 
+    @property
+    def memo_strategy(self):
+        """
+        Memoization strategy for the packrat table of the parsing function
+        generated for this parser.
+
+        :rtype: MemoStrategy
+        """
+        result = None
+        if self.is_root and self.grammar:
+            result = self.grammar.memo_strategies.get(self.name)
+        return result or get_context().default_memo_strategy
+
     def is_left_recursive(self):
         """Return whether this parser is left-recursive."""
         return self._is_left_recursive(self.name)
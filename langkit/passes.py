@@ -4,7 +4,12 @@ Helpers to manage compilation passes.
 
 from __future__ import annotations
 
-from typing import Callable, List, TYPE_CHECKING
+from contextlib import contextmanager
+import json
+import time
+import tracemalloc
+from typing import (Any, Callable, ContextManager, Dict, Iterator, List,
+                    Optional, TYPE_CHECKING)
 
 from langkit.compiled_types import ASTNodeType, CompiledTypeRepo
 from langkit.diagnostics import errors_checkpoint
@@ -16,11 +21,216 @@ from langkit.parsers import Grammar, Parser
 from langkit.utils import Colors, printcol
 
 
+try:
+    import resource
+except ImportError:  # no-code-coverage
+    # The resource module is not available on Windows
+    resource = None  # type: ignore
+
+
 # Do this only during typing to avoid circular dependencies
 if TYPE_CHECKING:
     from langkit.compile_context import CompileCtx
 
 
+def peak_rss() -> Optional[int]:
+    """
+    Return the peak resident set size of the current process (in KiB), or
+    None if this information is not available on this platform.
+    """
+    if resource is None:  # no-code-coverage
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class PassProfile:
+    """
+    Resources used to run a pass, or to process one item in a pass that
+    iterates on several items (grammar rules, properties, ...).
+    """
+
+    name: str
+    """
+    Name of the pass, or label for the item.
+    """
+
+    wall_time: float
+    """
+    Elapsed time, in seconds.
+    """
+
+    cpu_time: float
+    """
+    CPU time for the current process, in seconds.
+    """
+
+    rss_delta: Optional[int]
+    """
+    Increase of the peak resident set size of the process, in KiB, or None if
+    this information is not available.
+    """
+
+    alloc_delta: Optional[int]
+    """
+    Difference of the size of memory blocks allocated by Python, in bytes, or
+    None if the tracemalloc module is not tracing memory allocations.
+    """
+
+    items: List[PassProfile]
+    """
+    Profiles for the items processed in this pass, if any.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.rss_delta = None
+        self.alloc_delta = None
+        self.items = []
+
+    def as_json(self) -> Dict[str, Any]:
+        """
+        Return a JSON-compatible representation for this profile.
+        """
+        result: Dict[str, Any] = {
+            'name': self.name,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'rss_delta': self.rss_delta,
+            'alloc_delta': self.alloc_delta,
+        }
+        if self.items:
+            result['items'] = [i.as_json() for i in self.items]
+        return result
+
+
+class PassProfiler:
+    """
+    Collect resource usage for all the passes that a pass manager runs.
+
+    Memory allocation deltas are computed only if the tracemalloc module is
+    tracing allocations (for instance with the PYTHONTRACEMALLOC environment
+    variable), as this slows down execution significantly.
+    """
+
+    profiles: List[PassProfile]
+    """
+    Profiles for all the passes that were run, in execution order.
+    """
+
+    max_items: int = 5
+    """
+    Maximum number of items to show for each pass in the report table.
+    """
+
+    def __init__(self) -> None:
+        self.profiles = []
+        self._current: Optional[PassProfile] = None
+
+    @contextmanager
+    def _measure(self, profile: PassProfile) -> Iterator[None]:
+        """
+        Measure resources used while running the body of the "with" statement
+        and store them in ``profile``.
+        """
+        tracing = tracemalloc.is_tracing()
+        start_alloc = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start_rss = peak_rss()
+        start_cpu = time.process_time()
+        start_wall = time.perf_counter()
+        try:
+            yield
+        finally:
+            profile.wall_time = time.perf_counter() - start_wall
+            profile.cpu_time = time.process_time() - start_cpu
+            end_rss = peak_rss()
+            if start_rss is not None and end_rss is not None:
+                profile.rss_delta = end_rss - start_rss
+            if tracing and tracemalloc.is_tracing():
+                profile.alloc_delta = (tracemalloc.get_traced_memory()[0]
+                                       - start_alloc)
+
+    @contextmanager
+    def pass_profile(self, name: str) -> Iterator[None]:
+        """
+        Measure resources used to run the pass called ``name``.
+        """
+        profile = PassProfile(name)
+        self.profiles.append(profile)
+        self._current = profile
+        try:
+            with self._measure(profile):
+                yield
+        finally:
+            self._current = None
+
+    def item_profile(self, name: str) -> ContextManager[None]:
+        """
+        Measure resources used to process one item in the current pass.
+        """
+        assert self._current is not None
+        profile = PassProfile(name)
+        self._current.items.append(profile)
+        return self._measure(profile)
+
+    def report(self) -> str:
+        """
+        Return a table that lists all passes (and their most expensive items),
+        sorted by decreasing wall time.
+        """
+        def format_delta(value: Optional[int], unit: int) -> str:
+            return '-' if value is None else str(value // unit)
+
+        def format_row(profile: PassProfile, label: str) -> str:
+            return '{:>10.3f} {:>10.3f} {:>10} {:>10}  {}'.format(
+                profile.wall_time, profile.cpu_time,
+                format_delta(profile.rss_delta, 1),
+                format_delta(profile.alloc_delta, 1024),
+                label
+            )
+
+        lines = ['{:>10} {:>10} {:>10} {:>10}  {}'.format(
+            'Wall (s)', 'CPU (s)', 'RSS (KiB)', 'Heap (KiB)', 'Pass'
+        )]
+        for profile in sorted(self.profiles, key=lambda p: -p.wall_time):
+            lines.append(format_row(profile, profile.name))
+            items = sorted(profile.items, key=lambda p: -p.wall_time)
+            for item in items[:self.max_items]:
+                lines.append(format_row(item, '  ' + item.name))
+            if len(items) > self.max_items:
+                lines.append('{:>45}  ... {} more'.format(
+                    '', len(items) - self.max_items
+                ))
+        return '\n'.join(lines)
+
+    def write_json(self, filename: str) -> None:
+        """
+        Write profiles for all passes, in execution order, to ``filename``.
+        """
+        with open(filename, 'w') as f:
+            json.dump([p.as_json() for p in self.profiles], f, indent=2)
+
+
+def item_profile(context: CompileCtx, name: str) -> ContextManager[None]:
+    """
+    Shortcut for passes that iterate on items: return a context manager to
+    profile the processing of one item if profiling is enabled for
+    ``context``, a no-op context manager otherwise.
+
+    :param context: Context for which passes are run.
+    :param name: Label for the item to process.
+    """
+    if context.pass_profiler is None:
+        return _no_profile()
+    return context.pass_profiler.item_profile(name)
+
+
+@contextmanager
+def _no_profile() -> Iterator[None]:
+    yield
+
+
 class PassManager:
     """
     Holder for compilation passes. Handles passes sequential execution.
@@ -67,11 +277,16 @@ class PassManager:
                     printcol('Stopping pipeline execution: {}'.format(p.name),
                              Colors.OKBLUE)
                 return
+            elif isinstance(p, MajorStepPass):
+                p.run(context)
             else:
-                if (not isinstance(p, MajorStepPass)
-                        and context.verbosity.debug):  # no-code-coverage
+                if context.verbosity.debug:  # no-code-coverage
                     printcol('Running pass: {}'.format(p.name), Colors.YELLOW)
-                p.run(context)
+                if context.pass_profiler is None:
+                    p.run(context)
+                else:
+                    with context.pass_profiler.pass_profile(p.name):
+                        p.run(context)
 
 
 class AbstractPass:
@@ -245,7 +460,7 @@ class GrammarRulePass(AbstractPass):
     def run(self, context: CompileCtx) -> None:
         # Sort grammar rules by name, so that the pass order is deterministic
         for name, rule in sorted(context.grammar.rules.items()):
-            with rule.diagnostic_context:
+            with rule.diagnostic_context, item_profile(context, name):
                 self.pass_fn(rule)
 
 
@@ -270,11 +485,12 @@ class ASTNodePass(AbstractPass):
 
     def run(self, context: CompileCtx) -> None:
         for astnode in context.astnode_types:
-            if self.auto_context:
-                with astnode.diagnostic_context:
+            with item_profile(context, astnode.dsl_name):
+                if self.auto_context:
+                    with astnode.diagnostic_context:
+                        self.pass_fn(context, astnode)
+                else:
                     self.pass_fn(context, astnode)
-            else:
-                self.pass_fn(context, astnode)
 
 
 class EnvSpecPass(AbstractPass):
@@ -305,7 +521,8 @@ class EnvSpecPass(AbstractPass):
             env_spec = astnode.env_spec
             if env_spec is None:
                 continue
-            self.pass_fn(env_spec, context)
+            with item_profile(context, astnode.dsl_name):
+                self.pass_fn(env_spec, context)
 
 
 class PropertyPass(AbstractPass):
@@ -322,7 +539,8 @@ class PropertyPass(AbstractPass):
 
     def run(self, context: CompileCtx) -> None:
         for prop in context.all_properties(include_inherited=False):
-            with prop.diagnostic_context:
+            with prop.diagnostic_context, item_profile(context,
+                                                       prop.qualname):
                 self.pass_fn(prop, context)
 
 
@@ -0,0 +1,116 @@
+"""
+Computation of minimal perfect hash functions for sets of strings known at
+code generation time, such as symbol literals.
+
+The hash function family used here must be kept in sync with
+``Langkit_Support.Symbols.Perfect_Hash``.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+_mask = 2 ** 32 - 1
+
+
+def perfect_hash(text: str, seed: int) -> int:
+    """
+    Return the 32-bit hash for ``text`` in the hash function family that
+    ``seed`` designates.
+
+    This is FNV-1a over code points, with an offset basis altered by ``seed``,
+    followed by the finalization step of MurmurHash3 so that all bits of the
+    result depend on the seed.
+    """
+    h = 0x811c9dc5 ^ seed
+    for c in text:
+        h = ((h ^ ord(c)) * 0x01000193) & _mask
+    h ^= h >> 16
+    h = (h * 0x85ebca6b) & _mask
+    h ^= h >> 13
+    h = (h * 0xc2b2ae35) & _mask
+    h ^= h >> 16
+    return h
+
+
+class PerfectHash:
+    """
+    Minimal perfect hash function for a set of strings, computed with the
+    "hash and displace" method.
+
+    Looking up a key first hashes it with seed 0 to get a displacement, then
+    hashes it again with this displacement as a seed to get its slot::
+
+        slot = H(key, displacements[H(key, 0) % N]) % N
+
+    The lookup is branch-free. Since every string hashes to some slot, callers
+    need to check that the key stored at this slot is the looked up string.
+    """
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        """
+        Compute a minimal perfect hash function for ``keys``.
+
+        :param keys: Strings to hash. They must be unique.
+        """
+        assert len(set(keys)) == len(keys)
+        n = len(keys)
+
+        self.displacements: List[int] = [0] * n
+        """
+        Seed to use for the second hash, for each value of the first hash.
+        """
+
+        self.slots: List[int] = [0] * n
+        """
+        Index in ``keys`` of the string that hashes to each slot.
+        """
+
+        # Group keys by value for the first hash, and place the biggest groups
+        # first, while many slots are still free.
+        buckets: Dict[int, List[int]] = {}
+        for i, key in enumerate(keys):
+            buckets.setdefault(perfect_hash(key, 0) % n, []).append(i)
+
+        free = [True] * n
+        for b, indexes in sorted(buckets.items(),
+                                 key=lambda item: (-len(item[1]), item[0])):
+            seed = 1
+            candidate = self._place(keys, indexes, seed, free)
+            while candidate is None:
+                seed += 1
+                candidate = self._place(keys, indexes, seed, free)
+            self.displacements[b] = seed
+            for i, slot in candidate:
+                free[slot] = False
+                self.slots[slot] = i
+
+    @staticmethod
+    def _place(keys: Sequence[str],
+               indexes: List[int],
+               seed: int,
+               free: List[bool]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Return the slot for each key in ``indexes`` when using ``seed`` as a
+        displacement, or None if two keys would get the same slot or if one of
+        these slots is already used.
+        """
+        n = len(free)
+        result = []
+        used = set()
+        for i in indexes:
+            slot = perfect_hash(keys[i], seed) % n
+            if not free[slot] or slot in used:
+                return None
+            used.add(slot)
+            result.append((i, slot))
+        return result
+
+    def lookup(self, key: str) -> int:
+        """
+        Return the index of the only key that can be equal to ``key``.
+        """
+        n = len(self.slots)
+        d = self.displacements[perfect_hash(key, 0) % n]
+        return self.slots[perfect_hash(key, d) % n]
@@ -1,6 +1,9 @@
+import json
+import os
 import os.path
 import sys
 
+import mako
 import mako.exceptions
 from mako.lookup import TemplateLookup
 
@@ -49,8 +52,80 @@ _template_lookup = None
 def add_template_dir(path):
     global _template_lookup
     _template_dirs.append(path)
-    _template_lookup = TemplateLookup(directories=_template_dirs,
-                                      strict_undefined=True)
+
+    # Templates in this directory are part of the key for the compiled
+    # templates cache: create the lookup only when rendering the first
+    # template.
+    _template_lookup = None
+
+
+def _langkit_version():
+    """
+    Return the version of the installed Langkit distribution, or an empty
+    string if it is not installed.
+    """
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # no-code-coverage
+        return ''
+    try:
+        return version('langkit')
+    except PackageNotFoundError:
+        return ''
+
+
+def _module_directory():
+    """
+    Return the directory in which Mako must save the Python modules it
+    compiles templates to, or None if these must not be saved.
+
+    This directory is keyed by the digest of the Langkit and Mako versions and
+    of the names (relative to their template directory) and content of all
+    templates, so that it never contains stale modules and so that concurrent
+    generations that use the same templates share it, even from different
+    source trees. Mako writes modules atomically, so concurrent generations
+    never see incomplete modules.
+    """
+    from langkit.caching import (new_hasher, use_cache_subdirectory,
+                                 user_cache_dir)
+
+    cache_dir = user_cache_dir('templates')
+    if cache_dir is None:
+        return None
+
+    h = new_hasher()
+    h.update(json.dumps([_langkit_version(), mako.__version__])
+             .encode('utf-8'))
+    for i, dirpath in enumerate(_template_dirs):
+        for root, dirnames, filenames in os.walk(dirpath):
+            dirnames.sort()
+            for f in sorted(filenames):
+                if not f.endswith('.mako'):
+                    continue
+                filename = os.path.join(root, f)
+                h.update(json.dumps([i, os.path.relpath(filename, dirpath)])
+                         .encode('utf-8'))
+                with open(filename, 'rb') as fp:
+                    h.update(fp.read())
+
+    return use_cache_subdirectory(cache_dir, h.hexdigest())
+
+
+def _get_template_lookup():
+    global _template_lookup
+    if _template_lookup is None:
+        module_directory = _module_directory()
+        _template_lookup = TemplateLookup(
+            directories=_template_dirs,
+            strict_undefined=True,
+            module_directory=module_directory,
+
+            # Compiled modules are up-to-date by construction (see
+            # _module_directory): do not compare their timestamps with the
+            # templates', which differ from one source tree to another.
+            filesystem_checks=module_directory is None,
+        )
+    return _template_lookup
 
 
 add_template_dir(os.path.join(os.path.dirname(os.path.realpath(__file__)),
@@ -58,4 +133,4 @@ add_template_dir(os.path.join(os.path.dirname(os.path.realpath(__file__)),
 
 
 def mako_template(file_name):
-    return _template_lookup.get_template("{}.mako".format(file_name))
+    return _get_template_lookup().get_template("{}.mako".format(file_name))
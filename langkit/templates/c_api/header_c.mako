@@ -243,6 +243,37 @@ ${capi.get_name("context_discard_errors_in_populate_lexical_env")}(
         ${analysis_context_type} context,
         int discard);
 
+${c_doc('langkit.memoization_stats')}
+typedef struct {
+    long long hits;
+    long long misses;
+    long long entries;
+    long long bytes;
+} ${capi.get_name('memoization_stats')};
+
+${c_doc('langkit.memoized_property_count')}
+extern int
+${capi.get_name('memoized_property_count')}(void);
+
+${c_doc('langkit.memoized_property_name')}
+extern char *
+${capi.get_name('memoized_property_name')}(int property);
+
+${c_doc('langkit.context_set_memoization_policy')}
+extern void
+${capi.get_name('context_set_memoization_policy')}(
+        ${analysis_context_type} context,
+        int property,
+        int kind,
+        int max_entries);
+
+${c_doc('langkit.context_memoization_stats')}
+extern void
+${capi.get_name('context_memoization_stats')}(
+        ${analysis_context_type} context,
+        int property,
+        ${capi.get_name('memoization_stats')} *stats);
+
 ${c_doc('langkit.get_unit_from_file')}
 extern ${analysis_unit_type}
 ${capi.get_name("get_analysis_unit_from_file")}(
@@ -296,6 +327,27 @@ ${c_doc('langkit.unit_trivia_count')}
 extern int
 ${capi.get_name('unit_trivia_count')}(${analysis_unit_type} unit);
 
+${c_doc('langkit.token_columns')}
+typedef struct {
+    int *kinds;
+    int *start_offsets;
+    int *end_offsets;
+    uint32_t *start_lines;
+    uint16_t *start_columns;
+    uint32_t *end_lines;
+    uint16_t *end_columns;
+    unsigned char *is_trivia;
+} ${capi.get_name('token_columns')};
+
+${c_doc('langkit.unit_export_tokens')}
+extern int
+${capi.get_name('unit_export_tokens')}(
+   ${analysis_unit_type} unit,
+   int first,
+   int count,
+   ${capi.get_name('token_columns')} *columns
+);
+
 ${c_doc('langkit.unit_dump_lexical_env')}
 extern void
 ${capi.get_name('unit_dump_lexical_env')}(${analysis_unit_type} unit);
@@ -396,6 +448,29 @@ ${capi.get_name("node_child")}(${entity_type} *node,
                                unsigned n,
                                ${entity_type}* child_p);
 
+${c_doc('langkit.node_find_all')}
+extern int
+${capi.get_name("node_find_all")}(
+   ${entity_type} *node,
+   const ${node_kind_type} *kinds,
+   unsigned kinds_count,
+   unsigned max_count,
+   ${T.entity.array.c_type(capi).name} *result_p
+);
+
+${c_doc('langkit.node_serialize')}
+extern size_t
+${capi.get_name("node_serialize")}(${entity_type} *node,
+                                   int format,
+                                   char *buffer,
+                                   size_t size);
+
+${c_doc('langkit.node_serialize_to_fd')}
+extern int
+${capi.get_name("node_serialize_to_fd")}(${entity_type} *node,
+                                         int format,
+                                         int fd);
+
 ${c_doc('langkit.text_to_locale_string')}
 extern char *
 ${capi.get_name("text_to_locale_string")}(${text_type} *text);
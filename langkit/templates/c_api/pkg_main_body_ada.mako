@@ -8,6 +8,7 @@
 <% entity_type = root_entity.c_type(capi).name %>
 
 with Ada.Finalization;
+with Ada.IO_Exceptions;
 pragma Warnings (Off, "is an internal GNAT unit");
 with Ada.Strings.Wide_Wide_Unbounded.Aux;
 use Ada.Strings.Wide_Wide_Unbounded.Aux;
@@ -16,10 +17,13 @@ pragma Warnings (On, "is an internal GNAT unit");
 with System.Memory;
 use type System.Address;
 
+with GNAT.OS_Lib;
+
 with GNATCOLL.Iconv;
 
 with Langkit_Support.Diagnostics; use Langkit_Support.Diagnostics;
 with Langkit_Support.Text;        use Langkit_Support.Text;
+with Langkit_Support.Vectors;
 
 with ${ada_lib_name}.Private_Converters;
 use ${ada_lib_name}.Private_Converters;
@@ -31,6 +35,9 @@ package body ${ada_lib_name}.Implementation.C is
    --  Avoid hiding from $.Lexer
    subtype Token_Data_Type is Common.Token_Data_Type;
 
+   package Bare_Node_Vectors is new Langkit_Support.Vectors
+     (${T.root_node.name});
+
    type C_Unit_Provider is limited new
       Ada.Finalization.Limited_Controlled
       and Internal_Unit_Provider
@@ -167,6 +174,64 @@ package body ${ada_lib_name}.Implementation.C is
          Set_Last_Exception (Exc);
    end;
 
+   function ${capi.get_name('memoized_property_count')} return int is
+   begin
+      return int (Memoized_Property_Count);
+   end;
+
+   function ${capi.get_name('memoized_property_name')}
+     (Property : int) return chars_ptr is
+   begin
+      Clear_Last_Exception;
+      return New_String (Memoized_Property_Name (Positive (Property)));
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return Null_Ptr;
+   end;
+
+   procedure ${capi.get_name('context_set_memoization_policy')}
+     (Context     : ${analysis_context_type};
+      Property    : int;
+      Kind        : int;
+      Max_Entries : int)
+   is
+   begin
+      Clear_Last_Exception;
+      declare
+         Policy : constant Memoization_Policy :=
+           (Kind        => Memoization_Policy_Kind'Val (Kind),
+            Max_Entries => Natural (Max_Entries));
+      begin
+         if Property = 0 then
+            Set_Memoization_Policy (Context, Policy);
+         else
+            Set_Memoization_Policy (Context, Positive (Property), Policy);
+         end if;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure ${capi.get_name('context_memoization_stats')}
+     (Context  : ${analysis_context_type};
+      Property : int;
+      Stats    : access ${capi.get_name('memoization_stats')})
+   is
+   begin
+      Clear_Last_Exception;
+      declare
+         S : constant Memoization_Stats :=
+           Get_Memoization_Stats (Context, Positive (Property));
+      begin
+         Stats.all := (S.Hits, S.Misses, S.Entries, S.Bytes);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("get_analysis_unit_from_file")}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -311,6 +376,115 @@ package body ${ada_lib_name}.Implementation.C is
          return -1;
    end;
 
+   function ${capi.get_name('unit_export_tokens')}
+     (Unit    : ${analysis_unit_type};
+      First   : int;
+      Count   : int;
+      Columns : access ${capi.get_name('token_columns')}) return int is
+   begin
+      Clear_Last_Exception;
+
+      if First < 0 or else Count < 0 then
+         raise Constraint_Error with "invalid token range";
+      end if;
+
+      declare
+         subtype Column_Range is Positive range 1 .. Natural (Count);
+
+         type Int_Column is array (Column_Range) of int
+            with Convention => C;
+         type Line_Column is array (Column_Range) of Unsigned_32
+            with Convention => C;
+         type Column_Column is array (Column_Range) of Unsigned_16
+            with Convention => C;
+         type Bool_Column is array (Column_Range) of Unsigned_8
+            with Convention => C;
+
+         --  Columns whose address is null must not be accessed
+
+         Kinds         : Int_Column with Import, Address => Columns.Kinds;
+         Start_Offsets : Int_Column
+            with Import, Address => Columns.Start_Offsets;
+         End_Offsets   : Int_Column
+            with Import, Address => Columns.End_Offsets;
+         Start_Lines   : Line_Column
+            with Import, Address => Columns.Start_Lines;
+         Start_Columns : Column_Column
+            with Import, Address => Columns.Start_Columns;
+         End_Lines     : Line_Column
+            with Import, Address => Columns.End_Lines;
+         End_Columns   : Column_Column
+            with Import, Address => Columns.End_Columns;
+         Trivia_Flags  : Bool_Column
+            with Import, Address => Columns.Is_Trivia;
+
+         T      : Token_Reference := First_Token (Unit);
+         Base   : Positive;
+         Result : Natural := 0;
+
+         Source_Buffer : Text_Cst_Access;
+         Source_First  : Positive;
+         Source_Last   : Natural;
+      begin
+         if T = No_Token then
+            return 0;
+         end if;
+
+         --  Offsets are relative to the beginning of the unit's text, i.e.
+         --  to the first character of its first token.
+
+         Extract_Token_Text (Data (T), Source_Buffer, Base, Source_Last);
+
+         for I in 1 .. First loop
+            exit when T = No_Token;
+            T := Next (T);
+         end loop;
+
+         while T /= No_Token and then Result < Column_Range'Last loop
+            Result := Result + 1;
+            declare
+               D : constant Token_Data_Type := Data (T);
+               R : constant Source_Location_Range := Sloc_Range (D);
+            begin
+               Extract_Token_Text
+                 (D, Source_Buffer, Source_First, Source_Last);
+
+               if Columns.Kinds /= System.Null_Address then
+                  Kinds (Result) := Token_Kind'Enum_Rep (Kind (D));
+               end if;
+               if Columns.Start_Offsets /= System.Null_Address then
+                  Start_Offsets (Result) := int (Source_First - Base);
+               end if;
+               if Columns.End_Offsets /= System.Null_Address then
+                  End_Offsets (Result) := int (Source_Last + 1 - Base);
+               end if;
+               if Columns.Start_Lines /= System.Null_Address then
+                  Start_Lines (Result) := Unsigned_32 (R.Start_Line);
+               end if;
+               if Columns.Start_Columns /= System.Null_Address then
+                  Start_Columns (Result) := Unsigned_16 (R.Start_Column);
+               end if;
+               if Columns.End_Lines /= System.Null_Address then
+                  End_Lines (Result) := Unsigned_32 (R.End_Line);
+               end if;
+               if Columns.End_Columns /= System.Null_Address then
+                  End_Columns (Result) := Unsigned_16 (R.End_Column);
+               end if;
+               if Columns.Is_Trivia /= System.Null_Address then
+                  Trivia_Flags (Result) := Boolean'Pos (Is_Trivia (D));
+               end if;
+            end;
+            T := Next (T);
+         end loop;
+
+         return int (Result);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return -1;
+   end;
+
    procedure ${capi.get_name('unit_lookup_token')}
      (Unit   : ${analysis_unit_type};
       Sloc   : access ${sloc_type};
@@ -614,6 +788,161 @@ package body ${ada_lib_name}.Implementation.C is
          return 0;
    end;
 
+   function ${capi.get_name('node_find_all')}
+     (Node        : ${entity_type}_Ptr;
+      Kinds       : System.Address;
+      Kinds_Count : unsigned;
+      Max_Count   : unsigned;
+      Result_P    : access ${T.entity.array.c_type(capi).name}) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         type Kind_Array is array (1 .. Natural (Kinds_Count))
+            of ${node_kind_type}
+            with Convention => C;
+         Kinds_Array : Kind_Array with Import, Address => Kinds;
+
+         Sought : array (${T.node_kind}) of Boolean := (others => False);
+         --  Set of node kinds to look for
+
+         Stack : Bare_Node_Vectors.Vector;
+         --  Nodes left to visit. The next node to visit is the last one.
+
+         Found : Bare_Node_Vectors.Vector;
+         --  Nodes found so far, in prefix order
+
+         N      : ${T.root_node.name} := Node.Node;
+         Result : ${T.entity.array.name};
+      begin
+         for K of Kinds_Array loop
+            Sought (${T.node_kind}'Enum_Val (K)) := True;
+         end loop;
+
+         --  Iterative prefix traversal of the subtree: push children in
+         --  reverse order so that the first one is visited first.
+
+         while N /= null loop
+            for I in reverse 1 .. Children_Count (N) loop
+               declare
+                  C : constant ${T.root_node.name} := Child (N, I);
+               begin
+                  if C /= null then
+                     Stack.Append (C);
+                  end if;
+               end;
+            end loop;
+
+            exit when Stack.Is_Empty;
+            N := Stack.Pop;
+            if Sought (N.Kind) then
+               Found.Append (N);
+
+               --  Stop the traversal as soon as we found enough nodes
+
+               exit when Max_Count > 0
+                         and then Found.Length = Natural (Max_Count);
+            end if;
+         end loop;
+
+         Result := ${T.entity.array.constructor_name} (Found.Length);
+         for I in 1 .. Found.Length loop
+            Result.Items (I) := (Found.Get (I), Node.Info);
+         end loop;
+         Stack.Destroy;
+         Found.Destroy;
+
+         Result_P.all := Result;
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function ${capi.get_name('node_serialize')}
+     (Node   : ${entity_type}_Ptr;
+      Format : int;
+      Buffer : System.Address;
+      Size   : size_t) return size_t is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Output : String (1 .. Natural (Size))
+            with Import, Address => Buffer;
+         Length : size_t := 0;
+
+         procedure Write (Bytes : String);
+         --  Copy to Output the part of Bytes that fits in it, and keep track
+         --  of the total size of the serialization.
+
+         -----------
+         -- Write --
+         -----------
+
+         procedure Write (Bytes : String) is
+         begin
+            if Length < Size then
+               declare
+                  First : constant Positive := Natural (Length) + 1;
+                  Count : constant Natural :=
+                    Natural'Min (Bytes'Length, Output'Last - First + 1);
+               begin
+                  Output (First .. First + Count - 1) :=
+                    Bytes (Bytes'First .. Bytes'First + Count - 1);
+               end;
+            end if;
+            Length := Length + Bytes'Length;
+         end Write;
+      begin
+         Serialize
+           (Node.Node, Serialization_Format'Val (Format), Write'Access);
+         return Length;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function ${capi.get_name('node_serialize_to_fd')}
+     (Node   : ${entity_type}_Ptr;
+      Format : int;
+      FD     : int) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         procedure Write (Bytes : String);
+         --  Write Bytes to FD
+
+         -----------
+         -- Write --
+         -----------
+
+         procedure Write (Bytes : String) is
+         begin
+            if GNAT.OS_Lib.Write
+                 (GNAT.OS_Lib.File_Descriptor (FD), Bytes'Address,
+                  Bytes'Length) /= Bytes'Length
+            then
+               raise Ada.IO_Exceptions.Device_Error
+                  with "cannot write serialized nodes";
+            end if;
+         end Write;
+      begin
+         Serialize
+           (Node.Node, Serialization_Format'Val (Format), Write'Access);
+         return 1;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
    function ${capi.get_name("text_to_locale_string")}
      (Text : ${text_type}) return System.Address is
    begin
@@ -230,6 +230,45 @@ private package ${ada_lib_name}.Implementation.C is
               'context_discard_errors_in_populate_lexical_env')}";
    ${ada_c_doc('langkit.context_discard_errors_in_populate_lexical_env', 3)}
 
+   type ${capi.get_name('memoization_stats')} is record
+      Hits, Misses, Entries, Bytes : Long_Long_Integer;
+   end record
+      with Convention => C;
+   ${ada_c_doc('langkit.memoization_stats', 3)}
+
+   function ${capi.get_name('memoized_property_count')} return int
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('memoized_property_count')}";
+   ${ada_c_doc('langkit.memoized_property_count', 3)}
+
+   function ${capi.get_name('memoized_property_name')}
+     (Property : int) return chars_ptr
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('memoized_property_name')}";
+   ${ada_c_doc('langkit.memoized_property_name', 3)}
+
+   procedure ${capi.get_name('context_set_memoization_policy')}
+     (Context     : ${analysis_context_type};
+      Property    : int;
+      Kind        : int;
+      Max_Entries : int)
+      with Export        => True,
+           Convention    => C,
+           External_name =>
+              "${capi.get_name('context_set_memoization_policy')}";
+   ${ada_c_doc('langkit.context_set_memoization_policy', 3)}
+
+   procedure ${capi.get_name('context_memoization_stats')}
+     (Context  : ${analysis_context_type};
+      Property : int;
+      Stats    : access ${capi.get_name('memoization_stats')})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('context_memoization_stats')}";
+   ${ada_c_doc('langkit.context_memoization_stats', 3)}
+
    function ${capi.get_name('get_analysis_unit_from_file')}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -307,6 +346,26 @@ private package ${ada_lib_name}.Implementation.C is
            External_Name => "${capi.get_name('unit_trivia_count')}";
    ${ada_c_doc('langkit.unit_trivia_count', 3)}
 
+   type ${capi.get_name('token_columns')} is record
+      Kinds                      : System.Address;
+      Start_Offsets, End_Offsets : System.Address;
+      Start_Lines, Start_Columns : System.Address;
+      End_Lines, End_Columns     : System.Address;
+      Is_Trivia                  : System.Address;
+   end record
+      with Convention => C;
+   ${ada_c_doc('langkit.token_columns', 3)}
+
+   function ${capi.get_name('unit_export_tokens')}
+     (Unit    : ${analysis_unit_type};
+      First   : int;
+      Count   : int;
+      Columns : access ${capi.get_name('token_columns')}) return int
+      with Export        => True,
+           Convention    => C,
+           External_Name => "${capi.get_name('unit_export_tokens')}";
+   ${ada_c_doc('langkit.unit_export_tokens', 3)}
+
    procedure ${capi.get_name('unit_lookup_token')}
      (Unit   : ${analysis_unit_type};
       Sloc   : access ${sloc_type};
@@ -465,6 +524,36 @@ private package ${ada_lib_name}.Implementation.C is
            External_name => "${capi.get_name('node_child')}";
    ${ada_c_doc('langkit.node_child', 3)}
 
+   function ${capi.get_name('node_find_all')}
+     (Node        : ${entity_type}_Ptr;
+      Kinds       : System.Address;
+      Kinds_Count : unsigned;
+      Max_Count   : unsigned;
+      Result_P    : access ${T.entity.array.c_type(capi).name}) return int
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_find_all')}";
+   ${ada_c_doc('langkit.node_find_all', 3)}
+
+   function ${capi.get_name('node_serialize')}
+     (Node   : ${entity_type}_Ptr;
+      Format : int;
+      Buffer : System.Address;
+      Size   : size_t) return size_t
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_serialize')}";
+   ${ada_c_doc('langkit.node_serialize', 3)}
+
+   function ${capi.get_name('node_serialize_to_fd')}
+     (Node   : ${entity_type}_Ptr;
+      Format : int;
+      FD     : int) return int
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_serialize_to_fd')}";
+   ${ada_c_doc('langkit.node_serialize_to_fd', 3)}
+
    function ${capi.get_name('text_to_locale_string')}
      (Text : ${text_type}) return System.Address
       with Export        => True,
@@ -1,11 +1,16 @@
 ## vim: filetype=makoada
 
 with Ada.Calendar;              use Ada.Calendar;
+with Ada.Command_Line;
 with Ada.Containers.Hashed_Sets;
+with Ada.Containers.Vectors;
+with Ada.Directories;
+with Ada.Exceptions;            use Ada.Exceptions;
 with Ada.Strings;               use Ada.Strings;
 with Ada.Strings.Unbounded;     use Ada.Strings.Unbounded;
 pragma Warnings (Off, "internal");
 with Ada.Text_IO;               use Ada.Text_IO;
+with System.Multiprocessors;
 
 with GNATCOLL.Opt_Parse;
 
@@ -91,6 +96,16 @@ procedure Parse is
            "Parse files listed in the provided filename with the regular"
             & " analysis circuitry (useful for timing measurements)");
 
+      package Jobs is new Parse_Option
+        (Parser, "-j", "--jobs",
+         Arg_Type    => Natural,
+         Convert     => Natural'Value,
+         Default_Val => 1,
+         Help        =>
+           "Number of tasks to use in order to parse files (0 means one per"
+           & " CPU). Each task uses its own analysis context, and results"
+           & " for files are printed in no particular order.");
+
       % if ctx.generate_unparser:
       package Do_Unparse is new Parse_Flag
         (Parser, "-u", "--unparse",
@@ -104,9 +119,42 @@ procedure Parse is
          Allow_Empty => True);
    end Args;
 
+   package String_Vectors is new Ada.Containers.Vectors
+     (Positive, Unbounded_String);
+
+   protected Output_Lock is
+      entry Seize;
+      procedure Release;
+   private
+      Locked : Boolean := False;
+   end Output_Lock;
+   --  Lock to hold while printing results for a file, so that the output of
+   --  concurrent jobs is not interleaved.
+
+   protected File_Queue is
+      procedure Set_Files (Filenames : String_Vectors.Vector);
+      procedure Next (Filename : out Unbounded_String; Found : out Boolean);
+   private
+      Files : String_Vectors.Vector;
+      Next_File : Positive := 1;
+   end File_Queue;
+   --  Queue of files for jobs to parse
+
+   protected Stats is
+      procedure Add (Tokens, Bytes : Long_Long_Integer);
+      procedure Get (Files, Tokens, Bytes : out Long_Long_Integer);
+   private
+      Files_Count  : Long_Long_Integer := 0;
+      Tokens_Count : Long_Long_Integer := 0;
+      Bytes_Count  : Long_Long_Integer := 0;
+   end Stats;
+   --  Aggregate statistics about processed files, for throughput
+   --  measurements.
+
    procedure Process_Lookups (Node : ${root_entity.api_name}'Class);
    procedure Process_Node (Res : ${root_entity.api_name}'Class);
    procedure Process_File (Filename : String; Ctx : Analysis_Context);
+   procedure Process_Files (Files : String_Vectors.Vector);
    procedure Print_Token_Stream (Unit : Analysis_Unit);
    procedure Parse_Input (Content : String);
 
@@ -115,6 +163,70 @@ procedure Parse is
                       With_Trivia => Args.Do_Print_Trivia.Get
                                      or else Args.Do_Print_Tokens.Get));
 
+   -----------------
+   -- Output_Lock --
+   -----------------
+
+   protected body Output_Lock is
+
+      entry Seize when not Locked is
+      begin
+         Locked := True;
+      end Seize;
+
+      procedure Release is
+      begin
+         Locked := False;
+      end Release;
+
+   end Output_Lock;
+
+   ----------------
+   -- File_Queue --
+   ----------------
+
+   protected body File_Queue is
+
+      procedure Set_Files (Filenames : String_Vectors.Vector) is
+      begin
+         Files := Filenames;
+         Next_File := 1;
+      end Set_Files;
+
+      procedure Next (Filename : out Unbounded_String; Found : out Boolean)
+      is
+      begin
+         Found := Next_File <= Files.Last_Index;
+         if Found then
+            Filename := Files.Element (Next_File);
+            Next_File := Next_File + 1;
+         end if;
+      end Next;
+
+   end File_Queue;
+
+   -----------
+   -- Stats --
+   -----------
+
+   protected body Stats is
+
+      procedure Add (Tokens, Bytes : Long_Long_Integer) is
+      begin
+         Files_Count := Files_Count + 1;
+         Tokens_Count := Tokens_Count + Tokens;
+         Bytes_Count := Bytes_Count + Bytes;
+      end Add;
+
+      procedure Get (Files, Tokens, Bytes : out Long_Long_Integer) is
+      begin
+         Files := Files_Count;
+         Tokens := Tokens_Count;
+         Bytes := Bytes_Count;
+      end Get;
+
+   end Stats;
+
    -------------
    -- Convert --
    -------------
@@ -268,64 +380,194 @@ procedure Parse is
          end loop;
       end Check_Consistency;
 
+      procedure Print_Results;
+      --  Print the results of the processing of Filename
+
       Unit         : Analysis_Unit;
       Time_Before  : constant Time := Clock;
       Time_After   : Time;
       AST          : ${root_entity.api_name};
-   begin
-      Unit := Get_From_File (Ctx, Filename, "", True, Rule => Args.Rule.Get);
-      AST := Root (Unit);
-      Time_After := Clock;
 
-      if Has_Diagnostics (Unit) then
-         for D of Diagnostics (Unit) loop
-            Put_Line (Format_GNU_Diagnostic (Unit, D));
-         end loop;
-      end if;
+      -------------------
+      -- Print_Results --
+      -------------------
 
-      if Args.Do_Print_Tokens.Get then
-         Print_Token_Stream (Unit);
+      procedure Print_Results is
+      begin
+         if Has_Diagnostics (Unit) then
+            for D of Diagnostics (Unit) loop
+               Put_Line (Format_GNU_Diagnostic (Unit, D));
+            end loop;
+         end if;
+
+         if Args.Do_Print_Tokens.Get then
+            Print_Token_Stream (Unit);
 
-      elsif not Is_Null (AST) then
-         if not Args.Silent.Get then
-            if Args.Do_Print_Trivia.Get then
-               PP_Trivia (Unit);
-            else
-               Print (AST, not Args.Hide_Slocs.Get);
+         elsif not Is_Null (AST) then
+            if not Args.Silent.Get then
+               if Args.Do_Print_Trivia.Get then
+                  PP_Trivia (Unit);
+               else
+                  Print (AST, not Args.Hide_Slocs.Get);
+               end if;
+
+               Process_Lookups (AST);
             end if;
 
-            Process_Lookups (AST);
-         end if;
+            if Args.Print_Envs.Get then
+               Populate_Lexical_Env (Unit);
+               Put_Line ("");
+               Put_Line ("==== Dumping lexical environments ====");
+               Dump_Lexical_Env (Unit);
+            end if;
 
-         if Args.Print_Envs.Get then
-            Populate_Lexical_Env (Unit);
-            Put_Line ("");
-            Put_Line ("==== Dumping lexical environments ====");
-            Dump_Lexical_Env (Unit);
-         end if;
+            if Args.Check.Get then
+               Put_Line ("");
+               Put_Line ("==== Checking tree consistency ====");
+               if not AST.Is_Null then
+                  Check_Consistency
+                    (AST, No_${root_entity.api_name});
+               end if;
+            end if;
 
-         if Args.Check.Get then
-            Put_Line ("");
-            Put_Line ("==== Checking tree consistency ====");
-            if not AST.Is_Null then
-               Check_Consistency
-                 (AST, No_${root_entity.api_name});
+            % if ctx.generate_unparser:
+            if Args.Do_Unparse.Get then
+               Put_Line (Unparse (AST));
             end if;
+            % endif
          end if;
 
-         % if ctx.generate_unparser:
-         if Args.Do_Unparse.Get then
-            Put_Line (Unparse (AST));
+         if Args.Measure_Time.Get then
+            Put_Line
+              ("Time elapsed: " & Duration'Image (Time_After - Time_Before));
          end if;
-         % endif
+      end Print_Results;
+
+   begin
+      Unit := Get_From_File (Ctx, Filename, "", True, Rule => Args.Rule.Get);
+      AST := Root (Unit);
+      Time_After := Clock;
+
+      Stats.Add
+        (Tokens => Long_Long_Integer (Token_Count (Unit)),
+         Bytes  =>
+           (if Ada.Directories.Exists (Filename)
+            then Long_Long_Integer (Ada.Directories.Size (Filename))
+            else 0));
+
+      Output_Lock.Seize;
+      begin
+         Print_Results;
+      exception
+         when others =>
+            Output_Lock.Release;
+            raise;
+      end;
+      Output_Lock.Release;
+   end Process_File;
+
+   -------------------
+   -- Process_Files --
+   -------------------
+
+   procedure Process_Files (Files : String_Vectors.Vector) is
+      Jobs        : constant Positive :=
+        (if Args.Jobs.Get = 0
+         then Positive (System.Multiprocessors.Number_Of_CPUs)
+         else Args.Jobs.Get);
+      Time_Before : constant Time := Clock;
+      Time_After  : Time;
+   begin
+      if Jobs = 1 then
+         declare
+            Ctx : constant Analysis_Context := Create_Parse_Context;
+         begin
+            for Filename of Files loop
+               Process_File (To_String (Filename), Ctx);
+            end loop;
+         end;
+
+      else
+         File_Queue.Set_Files (Files);
+         declare
+            task type Worker;
+
+            ------------
+            -- Worker --
+            ------------
+
+            task body Worker is
+               Ctx      : constant Analysis_Context := Create_Parse_Context;
+               Filename : Unbounded_String;
+               Found    : Boolean;
+            begin
+               loop
+                  File_Queue.Next (Filename, Found);
+                  exit when not Found;
+
+                  begin
+                     Process_File (To_String (Filename), Ctx);
+                  exception
+                     when Exc : others =>
+                        --  Exceptions do not propagate out of tasks: report
+                        --  them and go on with the next files.
+
+                        Output_Lock.Seize;
+                        Put_Line
+                          (Standard_Error,
+                           "Error while processing " & To_String (Filename)
+                           & ": " & Exception_Information (Exc));
+                        Output_Lock.Release;
+                        Ada.Command_Line.Set_Exit_Status
+                          (Ada.Command_Line.Failure);
+                  end;
+               end loop;
+            end Worker;
+
+            Workers : array (1 .. Jobs) of Worker;
+            pragma Unreferenced (Workers);
+         begin
+            --  Wait for all workers to complete
+            null;
+         end;
       end if;
+      Time_After := Clock;
 
       if Args.Measure_Time.Get then
-         Put_Line
-           ("Time elapsed: " & Duration'Image (Time_After - Time_Before));
-      end if;
+         declare
+            Elapsed : constant Duration := Time_After - Time_Before;
 
-   end Process_File;
+            Files_Count, Tokens_Count, Bytes_Count : Long_Long_Integer;
+
+            function Rate (Count : Long_Long_Integer) return String;
+            --  Return the image of the number of items per second, for Count
+            --  items processed in Elapsed.
+
+            ----------
+            -- Rate --
+            ----------
+
+            function Rate (Count : Long_Long_Integer) return String is
+               Result : Long_Long_Integer := 0;
+            begin
+               if Elapsed > 0.0 then
+                  Result := Long_Long_Integer
+                    (Long_Float (Count) / Long_Float (Elapsed));
+               end if;
+               return Long_Long_Integer'Image (Result);
+            end Rate;
+
+         begin
+            Stats.Get (Files_Count, Tokens_Count, Bytes_Count);
+            Put_Line
+              ("Total time elapsed:" & Duration'Image (Elapsed)
+               & " for" & Long_Long_Integer'Image (Files_Count) & " file(s)");
+            Put_Line
+              ("Throughput:" & Rate (Tokens_Count) & " tokens/s,"
+               & Rate (Bytes_Count) & " bytes/s");
+         end;
+      end if;
+   end Process_Files;
 
 begin
    if not Args.Parser.Parse then
@@ -334,27 +576,25 @@ begin
 
    if Args.File_List.Get /= Null_Unbounded_String then
       declare
-         F   : File_Type;
-         Ctx : constant Analysis_Context := Create_Parse_Context;
+         F     : File_Type;
+         Files : String_Vectors.Vector;
       begin
          Open (F, In_File, To_String (Args.File_List.Get));
          while not End_Of_File (F) loop
-            declare
-               Filename : constant String := Get_Line (F);
-            begin
-               Process_File (Filename, Ctx);
-            end;
+            Files.Append (To_Unbounded_String (Get_Line (F)));
          end loop;
          Close (F);
+         Process_Files (Files);
       end;
 
    elsif Args.File_Names.Get'Length /= 0 then
       declare
-         Ctx : constant Analysis_Context := Create_Parse_Context;
+         Files : String_Vectors.Vector;
       begin
          for File_Name of Args.File_Names.Get loop
-            Process_File (To_String (File_Name), Ctx);
+            Files.Append (File_Name);
          end loop;
+         Process_Files (Files);
       end;
 
    else
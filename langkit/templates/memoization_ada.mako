@@ -5,8 +5,7 @@
    key_types = ctx.sorted_types(ctx.memoization_keys)
    value_types = ctx.sorted_types(ctx.memoization_values)
 
-   memoized_props = sorted(ctx.memoized_properties,
-                           key=lambda p: p.qualname)
+   memoized_props = ctx.sorted_memoized_properties
 
    # We want discrimanted types below to be constrained, so we want
    # discriminant default values.
@@ -51,12 +50,46 @@ end record;
 function Hash (Key : Mmz_Key) return Hash_Type;
 function Equivalent (L, R : Mmz_Key) return Boolean;
 
+type Mmz_LRU_Item is record
+   Unit : Internal_Unit;
+   Key  : Mmz_Key;
+end record;
+--  Reference to the entry for Key in Unit's memoization table
+
+package Mmz_LRU_Lists is new Ada.Containers.Doubly_Linked_Lists
+  (Mmz_LRU_Item);
+--  Lists of memoization entries for a given property, from the least
+--  recently used to the most recently used.
+
+type Mmz_Entry is record
+   Value : Mmz_Value;
+   --  Memoized result
+
+   LRU_Position : Mmz_LRU_Lists.Cursor;
+   --  Position of this entry in the LRU list for its property
+end record;
+
 package Memoization_Maps is new Ada.Containers.Hashed_Maps
-  (Mmz_Key, Mmz_Value, Hash, Equivalent_Keys => Equivalent);
+  (Mmz_Key, Mmz_Entry, Hash, Equivalent_Keys => Equivalent);
+
+type Mmz_Policy_Array is array (Mmz_Property) of Memoization_Policy;
+type Mmz_Stats_Array is array (Mmz_Property) of Memoization_Stats;
+type Mmz_LRU_Array is array (Mmz_Property) of Mmz_LRU_Lists.List;
+
+function To_Mmz_Property
+  (Property : Memoized_Property_Index) return Mmz_Property
+is (Mmz_Property'Val (Property - 1));
+
+procedure Reset_Memoization_Map (Unit : Internal_Unit);
+--  Free all resources stored in Unit's memoization map and clear it. This
+--  includes destroying ref-count shares the map owns.
 
-procedure Destroy (Map : in out Memoization_Maps.Map);
---  Free all resources stored in a memoization map. This includes destroying
---  ref-count shares the map owns.
+procedure Set_Memoization_Policy
+  (Context  : Internal_Context;
+   Property : Mmz_Property;
+   Policy   : Memoization_Policy);
+--  Use Policy for the memoization of Property in Context, evicting
+--  memoization entries if needed to honor it.
 
 type Memoization_Handle is record
    Key : Mmz_Key;
@@ -77,12 +110,16 @@ end record;
 
 function Find_Memoized_Value
   (Unit       : Internal_Unit;
+   Property   : Mmz_Property;
    Handle     : out Memoization_Handle;
    Value      : out Mmz_Value;
    Create_Key : access function return Mmz_Key) return Boolean;
 --  Initialize Handle and look for a memoization entry in Unit.Memoization_Map
 --  that corresponds to the key in Handle/Create_Key. If one is found, put it
 --  in Value and return True. Create such an entry and return False otherwise.
+--
+--  If memoization is disabled for Property, just return False: no entry is
+--  created and the next call to Add_Memoized_Value for Handle is a no-op.
 
 procedure Add_Memoized_Value
   (Unit   : Internal_Unit;
@@ -106,6 +143,24 @@ procedure Add_Memoized_Value
 function Hash (Key : Mmz_Key_Item) return Hash_Type;
 function Equivalent (L, R : Mmz_Key_Item) return Boolean;
 procedure Destroy (Key : in out Mmz_Key_Array_Access);
+procedure Destroy (Value : in out Mmz_Value);
+
+function Mmz_Entry_Cost (Key : Mmz_Key) return Long_Long_Integer
+is (Long_Long_Integer
+      ((Mmz_Key'Size + Mmz_Entry'Size + Mmz_LRU_Item'Size) / 8
+       + Key.Items'Length * Mmz_Key_Item'Size / 8));
+--  Return an estimation of the memory (in bytes) used by the memoization
+--  entry for Key, including its bookkeeping in LRU lists.
+
+procedure Forget_Entry
+  (Context : Internal_Context; Key : Mmz_Key; E : Mmz_Entry);
+--  Update Context's memoization statistics and LRU lists to account for the
+--  removal of the Key/E entry from a memoization map.
+
+procedure Enforce_Memoization_Policy
+  (Context : Internal_Context; Property : Mmz_Property);
+--  Evict memoization entries for Property as needed to honor its policy in
+--  Context. Entries that are being evaluated are never evicted.
 
 ----------------
 -- Equivalent --
@@ -181,13 +236,15 @@ begin
    return True;
 end Equivalent;
 
--------------
--- Destroy --
--------------
+---------------------------
+-- Reset_Memoization_Map --
+---------------------------
 
-procedure Destroy (Map : in out Memoization_Maps.Map) is
+procedure Reset_Memoization_Map (Unit : Internal_Unit) is
    use Memoization_Maps;
 
+   Map : Memoization_Maps.Map renames Unit.Memoization_Map;
+
    --  We need keys and values to be valid when clearing the memoization map,
    --  but on the other hand we need to free keys and values as well. To
    --  achieve both goals, we first copy key and values into arrays, then we
@@ -211,8 +268,9 @@ procedure Destroy (Map : in out Memoization_Maps.Map) is
    I      : Positive := 1;
 begin
    for Cur in Map.Iterate loop
+      Forget_Entry (Unit.Context, Key (Cur), Element (Cur));
       Keys (I) := Key (Cur).Items;
-      Values (I) := Element (Cur);
+      Values (I) := Element (Cur).Value;
       I := I + 1;
    end loop;
 
@@ -222,23 +280,13 @@ begin
       Destroy (K_Array);
    end loop;
 
-   <% refcounted_value_types = [t for t in value_types if t.is_refcounted] %>
-   % if refcounted_value_types:
-      for V of Values.all loop
-         case V.Kind is
-            % for t in refcounted_value_types:
-               when ${t.memoization_kind} =>
-                  Dec_Ref (V.As_${t.name});
-            % endfor
-
-            when others => null;
-         end case;
-      end loop;
-   % endif
+   for V of Values.all loop
+      Destroy (V);
+   end loop;
 
    Free (Keys);
    Free (Values);
-end Destroy;
+end Reset_Memoization_Map;
 
 -------------
 -- Destroy --
@@ -266,37 +314,174 @@ begin
    Free (Key);
 end Destroy;
 
+-------------
+-- Destroy --
+-------------
+
+procedure Destroy (Value : in out Mmz_Value) is
+begin
+   <% refcounted_value_types = [t for t in value_types if t.is_refcounted] %>
+   % if refcounted_value_types:
+      case Value.Kind is
+         % for t in refcounted_value_types:
+            when ${t.memoization_kind} =>
+               Dec_Ref (Value.As_${t.name});
+         % endfor
+
+         when others => null;
+      end case;
+   % else:
+      pragma Unreferenced (Value);
+   % endif
+end Destroy;
+
+------------------
+-- Forget_Entry --
+------------------
+
+procedure Forget_Entry
+  (Context : Internal_Context; Key : Mmz_Key; E : Mmz_Entry)
+is
+   Stats        : Memoization_Stats renames Context.Mmz_Stats (Key.Property);
+   LRU_Position : Mmz_LRU_Lists.Cursor := E.LRU_Position;
+begin
+   Stats.Entries := Stats.Entries - 1;
+   Stats.Bytes := Stats.Bytes - Mmz_Entry_Cost (Key);
+   Context.Mmz_LRU (Key.Property).Delete (LRU_Position);
+end Forget_Entry;
+
+--------------------------------
+-- Enforce_Memoization_Policy --
+--------------------------------
+
+procedure Enforce_Memoization_Policy
+  (Context : Internal_Context; Property : Mmz_Property)
+is
+   use Mmz_LRU_Lists;
+
+   Policy      : Memoization_Policy renames Context.Mmz_Policies (Property);
+   LRU_List    : List renames Context.Mmz_LRU (Property);
+   Max_Entries : Natural;
+   Cur, Next   : Cursor;
+begin
+   case Policy.Kind is
+      when Unbounded =>
+         return;
+      when LRU =>
+         Max_Entries := Policy.Max_Entries;
+      when Disabled =>
+         Max_Entries := 0;
+   end case;
+
+   --  Evict the least recently used entries first
+
+   Cur := LRU_List.First;
+   while Natural (LRU_List.Length) > Max_Entries
+         and then Has_Element (Cur)
+   loop
+      Next := Mmz_LRU_Lists.Next (Cur);
+      declare
+         Item     : constant Mmz_LRU_Item := Element (Cur);
+         Position : Memoization_Maps.Cursor :=
+           Item.Unit.Memoization_Map.Find (Item.Key);
+         E        : Mmz_Entry := Memoization_Maps.Element (Position);
+         Items    : Mmz_Key_Array_Access := Item.Key.Items;
+      begin
+         --  Entries that are being evaluated are referenced by memoization
+         --  handles, so we must keep them.
+
+         if E.Value.Kind /= Mmz_Evaluating then
+            Forget_Entry (Context, Item.Key, E);
+            Item.Unit.Memoization_Map.Delete (Position);
+            Destroy (Items);
+            Destroy (E.Value);
+         end if;
+      end;
+      Cur := Next;
+   end loop;
+end Enforce_Memoization_Policy;
+
+----------------------------
+-- Set_Memoization_Policy --
+----------------------------
+
+procedure Set_Memoization_Policy
+  (Context  : Internal_Context;
+   Property : Mmz_Property;
+   Policy   : Memoization_Policy) is
+begin
+   Context.Mmz_Policies (Property) := Policy;
+   Enforce_Memoization_Policy (Context, Property);
+end Set_Memoization_Policy;
+
 -------------------------
 -- Find_Memoized_Value --
 -------------------------
 
 function Find_Memoized_Value
   (Unit       : Internal_Unit;
+   Property   : Mmz_Property;
    Handle     : out Memoization_Handle;
    Value      : out Mmz_Value;
    Create_Key : access function return Mmz_Key) return Boolean
 is
+   Context  : constant Internal_Context := Unit.Context;
+   Stats    : Memoization_Stats renames Context.Mmz_Stats (Property);
+   LRU_List : Mmz_LRU_Lists.List renames Context.Mmz_LRU (Property);
    Inserted : Boolean;
+   E        : Mmz_Entry;
 begin
    --  Make sure that we don't lookup stale caches
    Reset_Caches (Unit);
 
+   Handle.Cache_Version := Unit.Cache_Version;
+   Value := (Kind => Mmz_Evaluating);
+
+   --  If memoization is disabled for this property, do not even create the
+   --  key, and leave Handle without a cursor so that Add_Memoized_Value does
+   --  nothing.
+
+   if Context.Mmz_Policies (Property).Kind = Disabled then
+      Handle.Cur := Memoization_Maps.No_Element;
+      Stats.Misses := Stats.Misses + 1;
+      return False;
+   end if;
+
    --  Initialize handle: create the key and create a cursor pointing to an
    --  existing entry.
    Handle.Key := Create_Key.all;
-   Handle.Cache_Version := Unit.Cache_Version;
-   Value := (Kind => Mmz_Evaluating);
-   Unit.Memoization_Map.Insert (Handle.Key, Value, Handle.Cur, Inserted);
-
-   --  No existing entry yet? The above just created one. Otherwise, destroy
-   --  our key and reuse the existing entry's.
-   if not Inserted then
-      Destroy (Handle.Key.Items);
-      Handle.Key := Memoization_Maps.Key (Handle.Cur);
-      Value := Memoization_Maps.Element (Handle.Cur);
+   Unit.Memoization_Map.Insert
+     (Handle.Key, (Value, Mmz_LRU_Lists.No_Element), Handle.Cur, Inserted);
+
+   --  No existing entry yet? The above just created one: register it in the
+   --  LRU list for this property, and evict older entries if needed.
+   --  Otherwise, destroy our key and reuse the existing entry's.
+   if Inserted then
+      Stats.Misses := Stats.Misses + 1;
+      Stats.Entries := Stats.Entries + 1;
+      Stats.Bytes := Stats.Bytes + Mmz_Entry_Cost (Handle.Key);
+
+      LRU_List.Append ((Unit, Handle.Key));
+      Unit.Memoization_Map.Replace_Element
+        (Handle.Cur, (Value, LRU_List.Last));
+      Enforce_Memoization_Policy (Context, Property);
+      return False;
+   end if;
+
+   Destroy (Handle.Key.Items);
+   Handle.Key := Memoization_Maps.Key (Handle.Cur);
+   E := Memoization_Maps.Element (Handle.Cur);
+   Value := E.Value;
+
+   --  Infinite recursions are not cache hits: they will just raise an error
+
+   if Value.Kind /= Mmz_Evaluating then
+      Stats.Hits := Stats.Hits + 1;
+      LRU_List.Splice
+        (Before => Mmz_LRU_Lists.No_Element, Position => E.LRU_Position);
    end if;
 
-   return not Inserted;
+   return True;
 end Find_Memoized_Value;
 
 ------------------------
@@ -311,11 +496,18 @@ procedure Add_Memoized_Value
 begin
    --  If Handle was created using a memoization map that has been since then
    --  reset, do nothing: the result can be partly stale due to the event that
-   --  triggered the memoization tables reset.
+   --  triggered the memoization tables reset. Likewise if memoization was
+   --  disabled when Handle was created.
 
-   Stored := Unit.Cache_Version <= Handle.Cache_Version;
+   Stored := Unit.Cache_Version <= Handle.Cache_Version
+             and then Memoization_Maps.Has_Element (Handle.Cur);
    if Stored then
-      Unit.Memoization_Map.Replace_Element (Handle.Cur, Value);
+      declare
+         E : Mmz_Entry := Memoization_Maps.Element (Handle.Cur);
+      begin
+         E.Value := Value;
+         Unit.Memoization_Map.Replace_Element (Handle.Cur, E);
+      end;
    end if;
 end Add_Memoized_Value;
 
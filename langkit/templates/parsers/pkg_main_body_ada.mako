@@ -3,6 +3,8 @@
 with Ada.Containers.Vectors;
 with Ada.Unchecked_Deallocation;
 
+with GNATCOLL.Traces;
+
 with Langkit_Support.Diagnostics; use Langkit_Support.Diagnostics;
 with Langkit_Support.Packrat;
 with Langkit_Support.Symbols; use Langkit_Support.Symbols;
@@ -19,6 +21,11 @@ with ${ada_lib_name}.Private_Converters; use ${ada_lib_name}.Private_Converters;
 package body ${ada_lib_name}.Parsers is
    use all type Langkit_Support.Symbols.Symbol_Type;
 
+   Memo_Trace : constant GNATCOLL.Traces.Trace_Handle :=
+     GNATCOLL.Traces.Create
+       ("${ctx.lib_name.upper}.PACKRAT_STATS", GNATCOLL.Traces.From_Config);
+   --  Trace to log usage statistics for memo tables (only in debug builds)
+
    --  Prepare packrat instantiations: one per enum type and onefor each kind
    --  of node (including lists). Likewise for bump ptr. allocators, except
    --  we need them only for non-abstract AST nodes.
@@ -122,6 +129,11 @@ package body ${ada_lib_name}.Parsers is
    procedure Add_Last_Fail_Diagnostic (Parser : in out Parser_Type);
    --  Add a diagnostic for the last fail position of the parser
 
+   procedure Trace_Memo_Stats (Parser : Parser_Type);
+   --  If Memo_Trace is active, log hit/miss/eviction counters for all the
+   --  memo tables in Parser. These counters are updated only in debug builds,
+   --  so this is meant to be called through pragma Debug.
+
    function Get_Parse_List (Parser : Parser_Type) return Free_Parse_List;
    --  Get a free parse list, or allocate one if there is no free parse list in
    --  Parser. When done with the result, the caller must invoke
@@ -161,8 +173,46 @@ package body ${ada_lib_name}.Parsers is
         (Input, With_Trivia, TDH.all, Parser.Diagnostics);
       Parser.Unit := Unit;
       Parser.TDH := TDH;
+
+      --  Make sure dense memo tables are big enough for all tokens, so that
+      --  they do not need to grow during parsing.
+      % for fn in sorted_fns:
+         % if fn.memo_strategy.kind == fn.memo_strategy.DENSE:
+            ${fn.type.storage_type_name}_Memos.Reserve
+              (Parser.Private_Part.${fn.gen_fn_name}_Memo,
+               Last_Token (TDH.all));
+         % endif
+      % endfor
    end Init_Parser;
 
+   ----------------------
+   -- Trace_Memo_Stats --
+   ----------------------
+
+   procedure Trace_Memo_Stats (Parser : Parser_Type) is
+   begin
+      if not GNATCOLL.Traces.Active (Memo_Trace) then
+         return;
+      end if;
+
+      % for fn in sorted_fns:
+         <% memos = '{}_Memos'.format(fn.type.storage_type_name) %>
+         declare
+            Stats : constant ${memos}.Memo_Stats :=
+               ${memos}.Stats (Parser.Private_Part.${fn.gen_fn_name}_Memo);
+         begin
+            if Stats.Hits > 0 or else Stats.Misses > 0 then
+               GNATCOLL.Traces.Trace
+                 (Memo_Trace,
+                  "${fn.gen_fn_name} (${fn.memo_strategy.kind}):"
+                  & " hits:" & Natural'Image (Stats.Hits)
+                  & " misses:" & Natural'Image (Stats.Misses)
+                  & " evictions:" & Natural'Image (Stats.Evictions));
+            end if;
+         end;
+      % endfor
+   end Trace_Memo_Stats;
+
    ------------------------------
    -- Add_Last_Fail_Diagnostic --
    ------------------------------
@@ -262,6 +312,8 @@ package body ${ada_lib_name}.Parsers is
       --  We create this new parser instance to leverage creation of default
       --  values, so as to not repeat them.
    begin
+      pragma Debug (Trace_Memo_Stats (Parser));
+
       --  We just keep the private part, to not have to reallocate it
       New_Parser.Private_Part := Parser.Private_Part;
 
@@ -287,6 +339,12 @@ package body ${ada_lib_name}.Parsers is
 
       Cur : Free_Parse_List renames Parser.Private_Part.Parse_Lists;
    begin
+      pragma Debug (Trace_Memo_Stats (Parser));
+      % for fn in sorted_fns:
+         ${fn.type.storage_type_name}_Memos.Destroy
+           (Parser.Private_Part.${fn.gen_fn_name}_Memo);
+      % endfor
+
       while Cur /= null loop
          declare
             Next : constant Free_Parse_List := Cur.Next;
@@ -306,6 +364,19 @@ package body ${ada_lib_name}.Parsers is
    procedure Initialize (Parser : in out Parser_Type) is
    begin
       Parser.Private_Part := new Parser_Private_Part_Type'(others => <>);
+
+      --  Set the memoization strategy for all memo tables
+      % for fn in sorted_fns:
+         <%
+            memos = '{}_Memos'.format(fn.type.storage_type_name)
+            strategy = fn.memo_strategy
+         %>
+         ${memos}.Initialize
+           (Parser.Private_Part.${fn.gen_fn_name}_Memo,
+            ${memos}.${strategy.ada_kind}${(
+               ', {}'.format(strategy.size) if strategy.size else ''
+            )});
+      % endfor
    end Initialize;
 
    --------------------
@@ -276,6 +276,64 @@ package body ${ada_lib_name}.Analysis is
       Activate_Lookup_Cache := not Disable;
    end Disable_Lookup_Cache;
 
+   -----------------------------
+   -- Set_Lookup_Cache_Budget --
+   -----------------------------
+
+   procedure Set_Lookup_Cache_Budget
+     (Context : Analysis_Context'Class; Max_Memory : Long_Long_Integer) is
+   begin
+      Set_Lookup_Cache_Budget (Unwrap_Context (Context), Max_Memory);
+   end Set_Lookup_Cache_Budget;
+
+   ----------------------------
+   -- Get_Lookup_Cache_Stats --
+   ----------------------------
+
+   function Get_Lookup_Cache_Stats
+     (Context : Analysis_Context'Class) return Lookup_Cache_Stats is
+   begin
+      return Get_Lookup_Cache_Stats (Unwrap_Context (Context));
+   end Get_Lookup_Cache_Stats;
+
+   ---------------------------------
+   -- Dump_Lookup_Cache_Occupancy --
+   ---------------------------------
+
+   procedure Dump_Lookup_Cache_Occupancy (Context : Analysis_Context'Class) is
+   begin
+      Dump_Lookup_Cache_Occupancy (Unwrap_Context (Context));
+   end Dump_Lookup_Cache_Occupancy;
+
+   ----------------------------
+   -- Set_Memoization_Policy --
+   ----------------------------
+
+   procedure Set_Memoization_Policy
+     (Context : Analysis_Context'Class; Policy : Memoization_Policy) is
+   begin
+      Set_Memoization_Policy (Unwrap_Context (Context), Policy);
+   end Set_Memoization_Policy;
+
+   procedure Set_Memoization_Policy
+     (Context  : Analysis_Context'Class;
+      Property : Memoized_Property_Index;
+      Policy   : Memoization_Policy) is
+   begin
+      Set_Memoization_Policy (Unwrap_Context (Context), Property, Policy);
+   end Set_Memoization_Policy;
+
+   ---------------------------
+   -- Get_Memoization_Stats --
+   ---------------------------
+
+   function Get_Memoization_Stats
+     (Context  : Analysis_Context'Class;
+      Property : Memoized_Property_Index) return Memoization_Stats is
+   begin
+      return Get_Memoization_Stats (Unwrap_Context (Context), Property);
+   end Get_Memoization_Stats;
+
    --------------------------
    -- Has_Rewriting_Handle --
    --------------------------
@@ -890,6 +948,19 @@ package body ${ada_lib_name}.Analysis is
       Result_Status := Traverse (Node, Visit);
    end Traverse;
 
+   ---------------
+   -- Serialize --
+   ---------------
+
+   procedure Serialize
+     (Node   : ${root_entity.api_name}'Class;
+      Format : Serialization_Format;
+      Write  : not null access procedure (Bytes : String)) is
+   begin
+      Check_Safety_Net (Node.Safety_Net);
+      Serialize (Node.Internal.Node, Format, Write);
+   end Serialize;
+
    --------------------------------
    -- Assign_Names_To_Logic_Vars --
    --------------------------------
@@ -20,6 +20,7 @@ with GNATCOLL.Refcount;
    private with Langkit_Support.Boxes;
 % endif
 
+with Langkit_Support.Lexical_Envs;
 with Langkit_Support.Token_Data_Handlers;
 use Langkit_Support.Token_Data_Handlers;
 
@@ -237,6 +238,39 @@ package ${ada_lib_name}.Analysis is
    --  Debug helper: if ``Disable`` is true, disable the use of caches in
    --  lexical environment lookups. Otherwise, activate it.
 
+   subtype Lookup_Cache_Stats is
+     Langkit_Support.Lexical_Envs.Lookup_Cache_Stats;
+   --  Counters for the lexical environment lookup caches of an analysis
+   --  context.
+
+   procedure Set_Lookup_Cache_Budget
+     (Context : Analysis_Context'Class; Max_Memory : Long_Long_Integer);
+   ${ada_doc('langkit.context_set_lookup_cache_budget', 3)}
+
+   function Get_Lookup_Cache_Stats
+     (Context : Analysis_Context'Class) return Lookup_Cache_Stats;
+   ${ada_doc('langkit.context_get_lookup_cache_stats', 3)}
+
+   procedure Dump_Lookup_Cache_Occupancy (Context : Analysis_Context'Class);
+   --  Debug helper: print on the standard output, for each lexical environment
+   --  whose lookup cache has entries accounted for in ``Context``'s budget,
+   --  the number of entries and their estimated memory usage.
+
+   procedure Set_Memoization_Policy
+     (Context : Analysis_Context'Class; Policy : Memoization_Policy);
+   ${ada_doc('langkit.context_set_memoization_policy', 3)}
+
+   procedure Set_Memoization_Policy
+     (Context  : Analysis_Context'Class;
+      Property : Memoized_Property_Index;
+      Policy   : Memoization_Policy);
+   ${ada_doc('langkit.context_set_property_memoization_policy', 3)}
+
+   function Get_Memoization_Stats
+     (Context  : Analysis_Context'Class;
+      Property : Memoized_Property_Index) return Memoization_Stats;
+   ${ada_doc('langkit.context_memoization_stats', 3)}
+
    function Has_Rewriting_Handle
      (Context : Analysis_Context'Class) return Boolean;
    --  Return whether ``Context`` has a rewriting handler (see
@@ -512,6 +546,12 @@ package ${ada_lib_name}.Analysis is
    --  This is the same as Traverse function except that no result is returned
    --  i.e. the Traverse function is called and the result is simply discarded.
 
+   procedure Serialize
+     (Node   : ${root_entity.api_name}'Class;
+      Format : Serialization_Format;
+      Write  : not null access procedure (Bytes : String));
+   ${ada_doc('langkit.node_serialize', 3)}
+
    ----------------------------------------
    -- Source location-related operations --
    ----------------------------------------
@@ -1,6 +1,7 @@
 ## vim: filetype=makoada
 
 with Ada.Strings.Unbounded; use Ada.Strings.Unbounded;
+with Interfaces;            use Interfaces;
 
 with GNATCOLL.Iconv;
 with GNATCOLL.VFS; use GNATCOLL.VFS;
@@ -107,6 +108,53 @@ package body ${ada_lib_name}.Common is
       % endif
    end Precomputed_Symbol;
 
+   % if ctx.symbol_literals:
+   <%
+      perfect_hash = ctx.symbol_literals_perfect_hash
+      sym_items = ctx.sorted_symbol_literals
+      last_slot = len(perfect_hash.slots) - 1
+   %>
+
+   Precomputed_Symbol_Displacements : constant
+     array (Unsigned_32 range 0 .. ${last_slot}) of Unsigned_32 :=
+   % if last_slot == 0:
+     (0 => ${perfect_hash.displacements[0]});
+   % else:
+     (${', '.join(str(d) for d in perfect_hash.displacements)});
+   % endif
+   --  Seed for the second hash in Precomputed_Symbol_Candidate, for each
+   --  value of the first hash.
+
+   Precomputed_Symbol_Slots : constant
+     array (Unsigned_32 range 0 .. ${last_slot}) of Precomputed_Symbol_Index :=
+     (
+        % for i in perfect_hash.slots:
+           ${'0 => ' if last_slot == 0 else ''}${sym_items[i][1]}${
+              '' if loop.last else ','}
+        % endfor
+     );
+   --  Precomputed symbol that each value of the second hash designates
+   % endif
+
+   ----------------------------------
+   -- Precomputed_Symbol_Candidate --
+   ----------------------------------
+
+   function Precomputed_Symbol_Candidate
+     (T : Text_Type) return Precomputed_Symbol_Index is
+   begin
+      % if ctx.symbol_literals:
+         return Precomputed_Symbol_Slots
+           (Perfect_Hash
+              (T,
+               Precomputed_Symbol_Displacements
+                 (Perfect_Hash (T, 0) mod ${last_slot + 1}))
+            mod ${last_slot + 1});
+      % else:
+         return (raise Program_Error);
+      % endif
+   end Precomputed_Symbol_Candidate;
+
    ---------------------
    -- Token_Kind_Name --
    ---------------------
@@ -121,6 +169,26 @@ package body ${ada_lib_name}.Common is
    function Token_Kind_Literal (Token_Id : Token_Kind) return Text_Type is
      (Token_Kind_To_Literals (Token_Id).all);
 
+   ----------------------------
+   -- Memoized_Property_Name --
+   ----------------------------
+
+   function Memoized_Property_Name
+     (Property : Memoized_Property_Index) return String is
+   begin
+      % if ctx.sorted_memoized_properties:
+         case Property is
+            % for i, p in enumerate(ctx.sorted_memoized_properties, 1):
+               when ${i} => return "${p.qualname}";
+            % endfor
+         end case;
+      % else:
+         --  There is no memoized property, so there is no valid value for
+         --  Property.
+         raise Program_Error;
+      % endif
+   end Memoized_Property_Name;
+
    -----------------------
    -- Token_Error_Image --
    -----------------------
@@ -63,12 +63,18 @@ package ${ada_lib_name}.Common is
    function Precomputed_Symbol
      (Index : Precomputed_Symbol_Index) return Text_Type;
 
+   function Precomputed_Symbol_Candidate
+     (T : Text_Type) return Precomputed_Symbol_Index;
+   --  Minimal perfect hash function for the text of symbol literals, computed
+   --  at generation time.
+
    --  GNAT emits an incorrect value not in range in instantiation warning...
    --  So deactivate them at the instantiation point.
    pragma Warnings (Off, "value not in range");
    package Precomputed_Symbols
    is new Langkit_Support.Symbols.Precomputed
-     (Precomputed_Symbol_Index, Precomputed_Symbol);
+     (Precomputed_Symbol_Index, Precomputed_Symbol,
+      Precomputed_Symbol_Candidate);
    pragma Warnings (On, "value not in range");
 
    -----------
@@ -196,6 +202,54 @@ package ${ada_lib_name}.Common is
    --  Helper type to control the node traversal process. See the
    --  ``${ada_lib_name}.Analysis.Traverse`` function.
 
+   type Serialization_Format is (JSON_Format, Binary_Format);
+   ${ada_doc('langkit.serialization_format', 3)}
+
+   -------------------------------
+   -- Memoization of properties --
+   -------------------------------
+
+   type Memoization_Policy_Kind is (Unbounded, LRU, Disabled);
+   ${ada_doc('langkit.memoization_policy_kind', 3)}
+
+   type Memoization_Policy is record
+      Kind : Memoization_Policy_Kind := Unbounded;
+
+      Max_Entries : Natural := 0;
+      --  For the LRU policy, maximum number of memoization entries to keep.
+      --  Ignored for other policies.
+   end record;
+   --  Memoization policy for a memoized property
+
+   Default_Memoization_Policy : constant Memoization_Policy := (Unbounded, 0);
+
+   type Memoization_Stats is record
+      Hits : Long_Long_Integer := 0;
+      --  Number of calls whose result was found in memoization tables
+
+      Misses : Long_Long_Integer := 0;
+      --  Number of calls whose result had to be computed
+
+      Entries : Long_Long_Integer := 0;
+      --  Number of entries currently in memoization tables
+
+      Bytes : Long_Long_Integer := 0;
+      --  Estimation of the memory (in bytes) used by these entries
+   end record;
+   ${ada_doc('langkit.memoization_stats', 3)}
+
+   Memoized_Property_Count : constant Natural :=
+     ${len(ctx.sorted_memoized_properties)};
+   --  Number of memoized properties in this language
+
+   subtype Memoized_Property_Index is
+     Positive range 1 .. Memoized_Property_Count;
+   --  Index to designate a memoized property
+
+   function Memoized_Property_Name
+     (Property : Memoized_Property_Index) return String;
+   ${ada_doc('langkit.memoized_property_name', 3)}
+
    -----------------------
    -- Lexical utilities --
    -----------------------
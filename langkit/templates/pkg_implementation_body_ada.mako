@@ -391,6 +391,10 @@ package body ${ada_lib_name}.Implementation is
       Context.In_Populate_Lexical_Env := False;
       Context.Cache_Version := 0;
       Context.Reparse_Cache_Version := 0;
+      % if ctx.has_memoization:
+         Context.Mmz_Policies := (others => Default_Memoization_Policy);
+         Context.Mmz_Stats := (others => <>);
+      % endif
 
       Context.Rewriting_Handle := No_Rewriting_Handle_Pointer;
       Context.Templates_Unit := No_Analysis_Unit;
@@ -648,6 +652,80 @@ package body ${ada_lib_name}.Implementation is
       Context.Logic_Resolution_Timeout := Timeout;
    end Set_Logic_Resolution_Timeout;
 
+   -----------------------------
+   -- Set_Lookup_Cache_Budget --
+   -----------------------------
+
+   procedure Set_Lookup_Cache_Budget
+     (Context : Internal_Context; Max_Memory : Long_Long_Integer) is
+   begin
+      Set_Max_Memory (Context.Lookup_Caches_Budget, Max_Memory);
+   end Set_Lookup_Cache_Budget;
+
+   ----------------------------
+   -- Get_Lookup_Cache_Stats --
+   ----------------------------
+
+   function Get_Lookup_Cache_Stats
+     (Context : Internal_Context) return Lookup_Cache_Stats is
+   begin
+      return Get_Stats (Context.Lookup_Caches_Budget);
+   end Get_Lookup_Cache_Stats;
+
+   ---------------------------------
+   -- Dump_Lookup_Cache_Occupancy --
+   ---------------------------------
+
+   procedure Dump_Lookup_Cache_Occupancy (Context : Internal_Context) is
+   begin
+      Dump_Occupancy (Context.Lookup_Caches_Budget);
+   end Dump_Lookup_Cache_Occupancy;
+
+   ----------------------------
+   -- Set_Memoization_Policy --
+   ----------------------------
+
+   procedure Set_Memoization_Policy
+     (Context : Internal_Context; Policy : Memoization_Policy) is
+   begin
+      % if ctx.has_memoization:
+         for Property in Mmz_Property loop
+            Set_Memoization_Policy (Context, Property, Policy);
+         end loop;
+      % else:
+         pragma Unreferenced (Context, Policy);
+      % endif
+   end Set_Memoization_Policy;
+
+   procedure Set_Memoization_Policy
+     (Context  : Internal_Context;
+      Property : Memoized_Property_Index;
+      Policy   : Memoization_Policy) is
+   begin
+      % if ctx.has_memoization:
+         Set_Memoization_Policy (Context, To_Mmz_Property (Property), Policy);
+      % else:
+         pragma Unreferenced (Context, Property, Policy);
+         raise Program_Error;
+      % endif
+   end Set_Memoization_Policy;
+
+   ---------------------------
+   -- Get_Memoization_Stats --
+   ---------------------------
+
+   function Get_Memoization_Stats
+     (Context  : Internal_Context;
+      Property : Memoized_Property_Index) return Memoization_Stats is
+   begin
+      % if ctx.has_memoization:
+         return Context.Mmz_Stats (To_Mmz_Property (Property));
+      % else:
+         pragma Unreferenced (Context, Property);
+         raise Program_Error;
+      % endif
+   end Get_Memoization_Stats;
+
    --------------------------
    -- Has_Rewriting_Handle --
    --------------------------
@@ -707,6 +785,7 @@ package body ${ada_lib_name}.Implementation is
 
       Destroy (Context.Templates_Unit);
       AST_Envs.Destroy (Context.Root_Scope);
+      AST_Envs.Destroy (Context.Lookup_Caches_Budget);
       Destroy (Context.Symbols);
       Destroy (Context.Parser);
       Dec_Ref (Context.Unit_Provider);
@@ -1097,7 +1176,7 @@ package body ${ada_lib_name}.Implementation is
       Analysis_Unit_Sets.Destroy (Unit.Referenced_Units);
 
       % if ctx.has_memoization:
-         Destroy (Unit.Memoization_Map);
+         Reset_Memoization_Map (Unit);
       % endif
 
       Destroy_Rebindings (Unit.Rebindings'Access);
@@ -1745,6 +1824,170 @@ package body ${ada_lib_name}.Implementation is
       Result_Status := Traverse (Node, Visit);
    end Traverse;
 
+   ---------------
+   -- Serialize --
+   ---------------
+
+   procedure Serialize
+     (Node   : ${T.root_node.name};
+      Format : Serialization_Format;
+      Write  : not null access procedure (Bytes : String))
+   is
+      Buffer : String (1 .. 4096);
+      Last   : Natural := 0;
+      --  Output that is not passed to Write yet is Buffer (1 .. Last)
+
+      procedure Put (S : String);
+      --  Append S to the output
+
+      procedure Put_Number (N : Natural);
+      --  Append N to the output as an unsigned LEB128 number
+
+      function Field_Name
+        (Kind : ${T.node_kind}; Index : Positive) return String;
+      --  Return the name of the Index'th syntax field for nodes of the given
+      --  Kind, as exposed in the Python API.
+
+      procedure Serialize_JSON (Node : ${T.root_node.name});
+      procedure Serialize_Binary (Node : ${T.root_node.name});
+      --  Append the serialization of the subtree rooted at Node to the output
+
+      ---------
+      -- Put --
+      ---------
+
+      procedure Put (S : String) is
+      begin
+         if Last + S'Length > Buffer'Last then
+            Write (Buffer (1 .. Last));
+            Last := 0;
+
+            if S'Length > Buffer'Length then
+               Write (S);
+               return;
+            end if;
+         end if;
+
+         Buffer (Last + 1 .. Last + S'Length) := S;
+         Last := Last + S'Length;
+      end Put;
+
+      ----------------
+      -- Put_Number --
+      ----------------
+
+      procedure Put_Number (N : Natural) is
+         Rest : Natural := N;
+      begin
+         while Rest >= 128 loop
+            Put ((1 => Character'Val (128 + Rest mod 128)));
+            Rest := Rest / 128;
+         end loop;
+         Put ((1 => Character'Val (Rest)));
+      end Put_Number;
+
+      ----------------
+      -- Field_Name --
+      ----------------
+
+      function Field_Name
+        (Kind : ${T.node_kind}; Index : Positive) return String is
+      begin
+         case Kind is
+            % for n in ctx.astnode_types:
+               <%
+                  fields = (
+                     [] if n.abstract or n.is_list_type else
+                     n.get_parse_fields(
+                        lambda f: not f.abstract and not f.null
+                     )
+                  )
+               %>
+               % if fields:
+                  when ${n.ada_kind_name} =>
+                     case Index is
+                        % for i, f in enumerate(fields, 1):
+                           when ${i} =>
+                              return ${string_repr(f.api_name.lower)};
+                        % endfor
+                        when others => null;
+                     end case;
+               % endif
+            % endfor
+            when others => null;
+         end case;
+         raise Program_Error with "invalid syntax field index";
+      end Field_Name;
+
+      --------------------
+      -- Serialize_JSON --
+      --------------------
+
+      procedure Serialize_JSON (Node : ${T.root_node.name}) is
+         Is_List : constant Boolean := Is_List_Node (Node.Kind);
+         First   : Boolean := True;
+      begin
+         Put (if Is_List then "[" else "{");
+         for I in 1 .. Children_Count (Node) loop
+            declare
+               C : constant ${T.root_node.name} := Child (Node, I);
+            begin
+               --  Like the Python API's to_data method, skip null children
+
+               if C /= null then
+                  if not First then
+                     Put (", ");
+                  end if;
+                  First := False;
+
+                  if not Is_List then
+                     Put ('"' & Field_Name (Node.Kind, I) & """: ");
+                  end if;
+                  Serialize_JSON (C);
+               end if;
+            end;
+         end loop;
+         Put (if Is_List then "]" else "}");
+      end Serialize_JSON;
+
+      ----------------------
+      -- Serialize_Binary --
+      ----------------------
+
+      procedure Serialize_Binary (Node : ${T.root_node.name}) is
+      begin
+         if Node = null then
+            Put_Number (0);
+            return;
+         end if;
+
+         Put_Number (Natural (${T.node_kind}'Enum_Rep (Node.Kind)));
+         Put_Number (Natural (Node.Token_Start_Index));
+         Put_Number (Natural (Node.Token_End_Index));
+         Put_Number (Children_Count (Node));
+         for I in 1 .. Children_Count (Node) loop
+            Serialize_Binary (Child (Node, I));
+         end loop;
+      end Serialize_Binary;
+
+   begin
+      case Format is
+         when JSON_Format =>
+            if Node = null then
+               Put ("null");
+            else
+               Serialize_JSON (Node);
+            end if;
+
+         when Binary_Format =>
+            Serialize_Binary (Node);
+      end case;
+
+      if Last > 0 then
+         Write (Buffer (1 .. Last));
+      end if;
+   end Serialize;
+
    ------------------------
    -- Traverse_With_Data --
    ------------------------
@@ -2652,6 +2895,16 @@ package body ${ada_lib_name}.Implementation is
    begin
       return Convert_Unit (Unit).Context.Reparse_Cache_Version;
    end Context_Version;
+
+   ---------------------------------
+   -- Context_Lookup_Cache_Budget --
+   ---------------------------------
+
+   function Context_Lookup_Cache_Budget
+     (Unit : Generic_Unit_Ptr) return System.Address is
+   begin
+      return Convert_Unit (Unit).Context.Lookup_Caches_Budget'Address;
+   end Context_Lookup_Cache_Budget;
    ----------------------
    -- Short_Text_Image --
    ----------------------
@@ -4108,7 +4361,7 @@ package body ${ada_lib_name}.Implementation is
       if Cache_Version < Unit.Context.Cache_Version then
          Unit.Cache_Version := Unit.Context.Cache_Version;
          % if ctx.has_memoization:
-            Destroy (Unit.Memoization_Map);
+            Reset_Memoization_Map (Unit);
          % endif
       end if;
    end Reset_Caches;
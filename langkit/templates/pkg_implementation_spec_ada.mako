@@ -9,6 +9,9 @@
 <% root_node_array = T.root_node.array %>
 
 with Ada.Containers;              use Ada.Containers;
+% if ctx.has_memoization:
+with Ada.Containers.Doubly_Linked_Lists;
+% endif
 with Ada.Containers.Hashed_Maps;
 with Ada.Containers.Hashed_Sets;
 with Ada.Containers.Ordered_Maps;
@@ -208,6 +211,11 @@ private package ${ada_lib_name}.Implementation is
    function Context_Version (Unit : Generic_Unit_Ptr) return Integer;
    --  Return the version of the analysis context associated with Unit
 
+   function Context_Lookup_Cache_Budget
+     (Unit : Generic_Unit_Ptr) return System.Address;
+   --  Return the address of the lookup cache budget for the analysis context
+   --  associated with Unit.
+
    type Ref_Category is
      (${", ".join(sorted(str(cat) for cat in ctx.ref_cats))});
    type Ref_Categories is array (Ref_Category) of Boolean;
@@ -216,6 +224,7 @@ private package ${ada_lib_name}.Implementation is
    package AST_Envs is new Langkit_Support.Lexical_Envs_Impl
      (Get_Unit_Version         => Unit_Version,
       Get_Context_Version      => Context_Version,
+      Get_Lookup_Cache_Budget  => Context_Lookup_Cache_Budget,
       Node_Type                => ${T.root_node.name},
       Node_Metadata            => ${T.env_md.name},
       No_Node                  => null,
@@ -707,6 +716,12 @@ private package ${ada_lib_name}.Implementation is
    --  This is the same as Traverse function except that no result is returned
    --  i.e. the Traverse function is called and the result is simply discarded.
 
+   procedure Serialize
+     (Node   : ${T.root_node.name};
+      Format : Serialization_Format;
+      Write  : not null access procedure (Bytes : String));
+   --  Implementation for Analysis.Serialize
+
    generic
       type Data_Type is private;
       Reset_After_Traversal : Boolean := False;
@@ -1289,6 +1304,25 @@ private package ${ada_lib_name}.Implementation is
       --  interrupting the resolution because of timeout. See the
       --  Set_Logic_Resolution_Timeout procedure.
 
+      Lookup_Caches_Budget : aliased AST_Envs.Lookup_Cache_Budget;
+      --  Memory budget and counters for the lookup caches of all lexical
+      --  environments that belong to this context's units. See the
+      --  Set_Lookup_Cache_Budget procedure.
+
+      % if ctx.has_memoization:
+      Mmz_Policies : Mmz_Policy_Array;
+      --  Memoization policy for each memoized property. See the
+      --  Set_Memoization_Policy procedure.
+
+      Mmz_Stats : Mmz_Stats_Array;
+      --  Statistics for each memoized property
+
+      Mmz_LRU : Mmz_LRU_Array;
+      --  For each memoized property, list of all entries in the memoization
+      --  tables of this context's units, from the least recently used to the
+      --  most recently used.
+      % endif
+
       Cache_Version : Natural;
       --  Version number used to invalidate memoization caches in a lazy
       --  fashion. If an analysis unit's version number is strictly inferior to
@@ -1551,6 +1585,32 @@ private package ${ada_lib_name}.Implementation is
      (Context : Internal_Context; Timeout : Natural);
    --  Implementation for Analysis.Set_Logic_Resolution_Timeout
 
+   procedure Set_Lookup_Cache_Budget
+     (Context : Internal_Context; Max_Memory : Long_Long_Integer);
+   --  Implementation for Analysis.Set_Lookup_Cache_Budget
+
+   function Get_Lookup_Cache_Stats
+     (Context : Internal_Context) return Lookup_Cache_Stats;
+   --  Implementation for Analysis.Get_Lookup_Cache_Stats
+
+   procedure Dump_Lookup_Cache_Occupancy (Context : Internal_Context);
+   --  Implementation for Analysis.Dump_Lookup_Cache_Occupancy
+
+   procedure Set_Memoization_Policy
+     (Context : Internal_Context; Policy : Memoization_Policy);
+   --  Implementation for Analysis.Set_Memoization_Policy
+
+   procedure Set_Memoization_Policy
+     (Context  : Internal_Context;
+      Property : Memoized_Property_Index;
+      Policy   : Memoization_Policy);
+   --  Implementation for Analysis.Set_Memoization_Policy
+
+   function Get_Memoization_Stats
+     (Context  : Internal_Context;
+      Property : Memoized_Property_Index) return Memoization_Stats;
+   --  Implementation for Analysis.Get_Memoization_Stats
+
    function Has_Rewriting_Handle (Context : Internal_Context) return Boolean;
    --  Implementation for Analysis.Has_Rewriting_Handle
 
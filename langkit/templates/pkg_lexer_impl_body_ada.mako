@@ -11,8 +11,10 @@
    with_trivia_actions = token_actions('WithTrivia')
 %>
 
+with Ada.Characters.Handling;
 with Ada.Unchecked_Conversion;
 
+with Interfaces; use Interfaces;
 with System;
 
 with GNAT.Byte_Order_Mark;
@@ -55,6 +57,26 @@ package body ${ada_lib_name}.Lexer_Implementation is
    --  Invalid_Input if Buffer contains invalid byte sequences according to
    --  Charset.
 
+   type Native_Charset is
+     (No_Native_Charset, ASCII_Charset, Latin_1_Charset, UTF_8_Charset);
+   --  Charsets that Decode_Buffer can decode without GNATCOLL.Iconv
+
+   function Get_Native_Charset (Charset : String) return Native_Charset;
+   --  Return the Native_Charset value corresponding to the Charset name, or
+   --  No_Native_Charset if there is none.
+
+   procedure Decode_Natively
+     (Buffer  : String;
+      Charset : Native_Charset;
+      Result  : in out Text_Type;
+      Last    : out Natural)
+      with Pre => Charset /= No_Native_Charset
+                  and then Result'Length >= Buffer'Length;
+   --  Decode Buffer according to Charset into Result (starting at
+   --  Result'First) and set Last to the index of the last decoded character
+   --  in Result. Raise Invalid_Input if Buffer contains invalid byte sequences
+   --  according to Charset.
+
    procedure Extract_Tokens_From_Text_Buffer
      (Decoded_Buffer : Text_Access;
       Source_First   : Positive;
@@ -509,6 +531,184 @@ package body ${ada_lib_name}.Lexer_Implementation is
       end case;
    end Extract_Tokens;
 
+   ------------------------
+   -- Get_Native_Charset --
+   ------------------------
+
+   function Get_Native_Charset (Charset : String) return Native_Charset is
+      Name : constant String := Ada.Characters.Handling.To_Lower (Charset);
+   begin
+      if Name = "utf-8" or else Name = "utf8" then
+         return UTF_8_Charset;
+      elsif Name = "ascii" or else Name = "us-ascii" then
+         return ASCII_Charset;
+      elsif Name = "iso-8859-1" or else Name = "latin1"
+            or else Name = "latin-1"
+      then
+         return Latin_1_Charset;
+      else
+         return No_Native_Charset;
+      end if;
+   end Get_Native_Charset;
+
+   ---------------------
+   -- Decode_Natively --
+   ---------------------
+
+   procedure Decode_Natively
+     (Buffer  : String;
+      Charset : Native_Charset;
+      Result  : in out Text_Type;
+      Last    : out Natural)
+   is
+      Chunk_Size : constant := 16;
+      --  Number of bytes to process at once in the ASCII fast path
+
+      I : Positive := Buffer'First;
+      --  Index in Buffer of the next byte to decode
+
+      O : Positive := Result'First;
+      --  Index in Result of the next character to write
+
+      function Byte (Index : Positive) return Unsigned_8
+      is (Character'Pos (Buffer (Index)))
+      with Inline;
+
+      procedure Decode_ASCII_Chunks with Inline;
+      --  Decode as many chunks of Chunk_Size ASCII bytes as possible starting
+      --  at I, updating I and O accordingly.
+
+      -------------------------
+      -- Decode_ASCII_Chunks --
+      -------------------------
+
+      procedure Decode_ASCII_Chunks is
+      begin
+         --  Simple loops on fixed-size chunks enable the compiler to
+         --  vectorize both the check for non-ASCII bytes and the widening
+         --  copy.
+
+         while I <= Buffer'Last - Chunk_Size + 1 loop
+            declare
+               Acc : Unsigned_8 := 0;
+            begin
+               for J in 0 .. Chunk_Size - 1 loop
+                  Acc := Acc or Byte (I + J);
+               end loop;
+               exit when Acc >= 16#80#;
+
+               for J in 0 .. Chunk_Size - 1 loop
+                  Result (O + J) :=
+                    Wide_Wide_Character'Val (Character'Pos (Buffer (I + J)));
+               end loop;
+            end;
+            I := I + Chunk_Size;
+            O := O + Chunk_Size;
+         end loop;
+      end Decode_ASCII_Chunks;
+
+   begin
+      case Charset is
+         when No_Native_Charset =>
+            raise Program_Error;
+
+         when Latin_1_Charset =>
+            --  All bytes are valid and map to the first 256 code points
+
+            for J in Buffer'Range loop
+               Result (O) := Wide_Wide_Character'Val (Byte (J));
+               O := O + 1;
+            end loop;
+
+         when ASCII_Charset =>
+            while I <= Buffer'Last loop
+               Decode_ASCII_Chunks;
+               exit when I > Buffer'Last;
+
+               if Byte (I) >= 16#80# then
+                  raise Invalid_Input;
+               end if;
+               Result (O) := Wide_Wide_Character'Val (Byte (I));
+               I := I + 1;
+               O := O + 1;
+            end loop;
+
+         when UTF_8_Charset =>
+            while I <= Buffer'Last loop
+               Decode_ASCII_Chunks;
+               exit when I > Buffer'Last;
+
+               declare
+                  B0 : constant Unsigned_8 := Byte (I);
+
+                  Length : Positive;
+                  --  Length of the current sequence, in bytes
+
+                  Code : Unsigned_32;
+                  --  Code point for the current sequence
+
+                  Min_B1 : Unsigned_8 := 16#80#;
+                  Max_B1 : Unsigned_8 := 16#BF#;
+                  --  Range of valid values for the second byte of the
+                  --  sequence: this excludes overlong encodings, surrogates
+                  --  and code points beyond U+10FFFF.
+               begin
+                  case B0 is
+                     when 16#00# .. 16#7F# =>
+                        Length := 1;
+                        Code := Unsigned_32 (B0);
+                     when 16#C2# .. 16#DF# =>
+                        Length := 2;
+                        Code := Unsigned_32 (B0 and 16#1F#);
+                     when 16#E0# .. 16#EF# =>
+                        Length := 3;
+                        Code := Unsigned_32 (B0 and 16#0F#);
+                        if B0 = 16#E0# then
+                           Min_B1 := 16#A0#;
+                        elsif B0 = 16#ED# then
+                           Max_B1 := 16#9F#;
+                        end if;
+                     when 16#F0# .. 16#F4# =>
+                        Length := 4;
+                        Code := Unsigned_32 (B0 and 16#07#);
+                        if B0 = 16#F0# then
+                           Min_B1 := 16#90#;
+                        elsif B0 = 16#F4# then
+                           Max_B1 := 16#8F#;
+                        end if;
+                     when others =>
+                        raise Invalid_Input;
+                  end case;
+
+                  if I + Length - 1 > Buffer'Last then
+                     raise Invalid_Input;
+                  end if;
+
+                  for J in 1 .. Length - 1 loop
+                     declare
+                        B : constant Unsigned_8 := Byte (I + J);
+                     begin
+                        if (if J = 1
+                            then B not in Min_B1 .. Max_B1
+                            else B not in 16#80# .. 16#BF#)
+                        then
+                           raise Invalid_Input;
+                        end if;
+                        Code :=
+                          Shift_Left (Code, 6) or Unsigned_32 (B and 16#3F#);
+                     end;
+                  end loop;
+
+                  Result (O) := Wide_Wide_Character'Val (Code);
+                  I := I + Length;
+                  O := O + 1;
+               end;
+            end loop;
+      end case;
+
+      Last := O - 1;
+   end Decode_Natively;
+
    -------------------
    -- Decode_Buffer --
    -------------------
@@ -565,6 +765,28 @@ package body ${ada_lib_name}.Lexer_Implementation is
          return;
       end if;
 
+      --  Skip GNATCOLL.Iconv for the most common charsets: decoding them
+      --  natively is much faster, especially for ASCII text.
+
+      declare
+         Native : constant Native_Charset :=
+           (case BOM is
+            when UTF8_All => UTF_8_Charset,
+            when Unknown => Get_Native_Charset (Charset),
+            when others => No_Native_Charset);
+      begin
+         if Native /= No_Native_Charset then
+            Decode_Natively
+              (Buffer (Input_Index .. Buffer'Last), Native, Result.all,
+               Source_Last);
+            return;
+         end if;
+      exception
+         when Invalid_Input =>
+            Free (Result);
+            raise;
+      end;
+
       --  Create the Iconv converter. We will notice unknown charsets here
 
       declare
@@ -4,8 +4,36 @@
    lexer = ctx.lexer
    termination = lexer.Termination.ada_name
    lexing_failure = lexer.LexingFailure.ada_name
+   tables = emitter.dfa_code.tables
 %>
 
+## Generate code to execute the given lexer action when reaching a DFA state.
+## Note that we will still continue running the automaton: we don't want to
+## return a token as soon as we find one, but rather return the longest one.
+<%def name="action_code(action)">
+   % if action.is_case_action:
+      case Self.Last_Token_Kind is
+         % for alt in action.all_alts:
+            when ${('others' if alt.prev_token_cond is None else
+                    ' | '.join(t.ada_name
+                               for t in alt.prev_token_cond))} =>
+               Match_Kind := ${alt.send.ada_name};
+               Match_Index := Index - 1 - ${(
+                  action.match_length - alt.match_size
+               )};
+         % endfor
+      end case;
+
+   % elif action.is_ignore:
+      Match_Index := Index - 1;
+      Match_Ignore := True;
+
+   % else:
+      Match_Index := Index - 1;
+      Match_Kind := ${action.ada_name};
+   % endif
+</%def>
+
 package body ${ada_lib_name}.Lexer_State_Machine is
 
    Is_Trivia : constant array (Token_Kind) of Boolean := (
@@ -13,6 +41,14 @@ package body ${ada_lib_name}.Lexer_State_Machine is
                   for t in lexer.sorted_tokens)}
    );
 
+   % if tables:
+${tables.ada_table_decls('   ')}
+
+   function Get_Class (Char : Character_Type) return Character_Class;
+   pragma Inline (Get_Class);
+   --  Return the equivalence class for Char
+
+   % else:
    type Character_Range is record
       First, Last : Character_Type;
    end record;
@@ -23,6 +59,7 @@ package body ${ada_lib_name}.Lexer_State_Machine is
    function Contains
      (Char : Character_Type; Ranges : Character_Range_Array) return Boolean;
    --  Return whether Char is included in the given ranges
+   % endif
 
    ----------------
    -- Initialize --
@@ -62,6 +99,43 @@ package body ${ada_lib_name}.Lexer_State_Machine is
       return Self.Has_Next;
    end Has_Next;
 
+   % if tables:
+   ---------------
+   -- Get_Class --
+   ---------------
+
+   function Get_Class (Char : Character_Type) return Character_Class is
+   begin
+      if Char <= Character_Type'Val (127) then
+         return ASCII_Classes (Char);
+      end if;
+
+      % if tables.non_ascii_classes:
+      declare
+         Low  : Natural := Non_ASCII_Classes'First;
+         High : Natural := Non_ASCII_Classes'Last;
+      begin
+         while Low <= High loop
+            declare
+               Middle : constant Natural := (Low + High) / 2;
+               R      : Class_Range renames Non_ASCII_Classes (Middle);
+            begin
+               if Char < R.First then
+                  High := Middle - 1;
+               elsif Char > R.Last then
+                  Low := Middle + 1;
+               else
+                  return R.Class;
+               end if;
+            end;
+         end loop;
+      end;
+      % endif
+
+      return 0;
+   end Get_Class;
+
+   % else:
    --------------
    -- Contains --
    --------------
@@ -90,6 +164,7 @@ package body ${ada_lib_name}.Lexer_State_Machine is
    end Contains;
 
 ${emitter.dfa_code.ada_table_decls('   ')}
+   % endif
 
    ----------------
    -- Next_Token --
@@ -116,6 +191,11 @@ ${emitter.dfa_code.ada_table_decls('   ')}
       Match_Kind : Token_Kind;
       --  If we found a match and it is not ignored, kind for the token to
       --  emit. Meaningless otherwise.
+
+      % if tables:
+      State : State_Id;
+      --  Current state in the automaton
+      % endif
    begin
       First_Index := Self.Last_Token.Text_Last + 1;
 
@@ -124,6 +204,37 @@ ${emitter.dfa_code.ada_table_decls('   ')}
       Match_Index := 0;
       Match_Ignore := False;
 
+      % if tables:
+      State := 1;
+      loop
+         ## If actions are associated to this state, execute them now
+         case State_Actions (State) is
+            when 0 =>
+               null;
+            % for i, action in enumerate(tables.actions, 1):
+            when ${i} =>
+               ${action_code(action)}
+            % endfor
+         end case;
+
+         ## If we are about to read past the input buffer, just stop there
+         exit when Index > Self.Input_Last;
+
+         ## Read the current character and transition to the next state, or
+         ## stop if there is no transition for that character.
+         declare
+            Class  : constant Character_Class := Get_Class (Input (Index));
+            Offset : Positive;
+         begin
+            Index := Index + 1;
+            exit when Class = 0;
+            Offset := State_Bases (State) + Class;
+            exit when Transition_Checks (Offset) /= State;
+            State := Transition_Targets (Offset);
+         end;
+      end loop;
+
+      % else:
       % for i, state in enumerate(emitter.dfa_code.states):
          ## No transition can go to the first state, so don't emit a label
          ## for it. This avoids an "unreferenced" warning.
@@ -131,32 +242,9 @@ ${emitter.dfa_code.ada_table_decls('   ')}
             <<${state.label}>>
          % endif
 
-         ## If actions are associated to this state, execute them now. Note
-         ## that we will still continue running the automaton: we don't want to
-         ## return a token as soon as we find one, but rather return the
-         ## longest one.
+         ## If actions are associated to this state, execute them now
          % if state.action is not None:
-            % if state.action.is_case_action:
-               case Self.Last_Token_Kind is
-                  % for alt in state.action.all_alts:
-                     when ${('others' if alt.prev_token_cond is None else
-                             ' | '.join(t.ada_name
-                                        for t in alt.prev_token_cond))} =>
-                        Match_Kind := ${alt.send.ada_name};
-                        Match_Index := Index - 1 - ${(
-                           state.action.match_length - alt.match_size
-                        )};
-                  % endfor
-               end case;
-
-            % elif state.action.is_ignore:
-               Match_Index := Index - 1;
-               Match_Ignore := True;
-
-            % else:
-               Match_Index := Index - 1;
-               Match_Kind := ${state.action.ada_name};
-            % endif
+            ${action_code(state.action)}
          % endif
 
          ## If we are about to read past the input buffer, just stop there
@@ -205,6 +293,7 @@ ${emitter.dfa_code.ada_table_decls('   ')}
       % endfor
 
       <<Stop>>
+      % endif
       --  We end up here as soon as the currently analyzed character was not
       --  accepted by any transitions from the current state. Two cases from
       --  there:
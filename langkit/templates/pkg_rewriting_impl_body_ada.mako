@@ -204,6 +204,10 @@ package body ${ada_lib_name}.Rewriting_Implementation is
    procedure Untie (Handle : Node_Rewriting_Handle);
    --  Untie the node represented by Handle. Do nothing if Handle is null.
 
+   procedure Mark_Modified (Handle : Node_Rewriting_Handle);
+   --  If the node represented by Handle is tied to a unit tree, mark the
+   --  corresponding unit as modified. Do nothing otherwise.
+
    ---------------------
    -- Start_Rewriting --
    ---------------------
@@ -258,8 +262,13 @@ package body ${ada_lib_name}.Rewriting_Implementation is
    begin
       ${pre_check_rw_handle('Handle')}
 
-      --  Try to reparse all units that were potentially modified
+      --  Try to reparse all units that were modified. Units that were just
+      --  inspected keep their current tree.
       for Unit_Handle of Handle.Units loop
+         if not Unit_Handle.Modified then
+            goto Next_Unit;
+         end if;
+
          declare
             PU    : constant Processed_Unit := new Processed_Unit_Record'
               (Unit     => Unit_Handle.Unit,
@@ -296,6 +305,8 @@ package body ${ada_lib_name}.Rewriting_Implementation is
                exit;
             end if;
          end;
+
+         <<Next_Unit>>
       end loop;
 
       --  If all reparsing went fine, actually replace the AST nodes all over
@@ -364,7 +375,8 @@ package body ${ada_lib_name}.Rewriting_Implementation is
                new Unit_Rewriting_Handle_Type'(Context_Handle => Context_Handle,
                                                Unit           => Unit,
                                                Root           => <>,
-                                               Nodes          => <>);
+                                               Nodes          => <>,
+                                               Modified       => False);
          begin
             Context_Handle.Units.Insert (Filename, Result);
             Result.Root := Handle (Root (Unit));
@@ -409,6 +421,7 @@ package body ${ada_lib_name}.Rewriting_Implementation is
       Untie (Handle.Root);
       Handle.Root := Root;
       Tie (Root, No_Node_Rewriting_Handle, Handle);
+      Handle.Modified := True;
    end Set_Root;
 
    -------------
@@ -661,6 +674,25 @@ package body ${ada_lib_name}.Rewriting_Implementation is
       end if;
    end Untie;
 
+   -------------------
+   -- Mark_Modified --
+   -------------------
+
+   procedure Mark_Modified (Handle : Node_Rewriting_Handle) is
+      N : Node_Rewriting_Handle := Handle;
+   begin
+      --  Look for the root of the tree that contains Handle: if it is the
+      --  root of a unit, this unit is modified.
+
+      while N /= No_Node_Rewriting_Handle and then N.Tied loop
+         if N.Root_Of /= No_Unit_Rewriting_Handle then
+            N.Root_Of.Modified := True;
+            return;
+         end if;
+         N := N.Parent;
+      end loop;
+   end Mark_Modified;
+
    ----------
    -- Kind --
    ----------
@@ -745,6 +777,8 @@ package body ${ada_lib_name}.Rewriting_Implementation is
          Child_Slot : Node_Rewriting_Handle renames
             Handle.Children.Vector.Reference (Index);
       begin
+         Mark_Modified (Handle);
+
          --  Untie the child to be replaced if it exists
          Untie (Child_Slot);
 
@@ -791,6 +825,7 @@ package body ${ada_lib_name}.Rewriting_Implementation is
       Expand_Children (Handle);
 
       Handle.Children.Text := To_Unbounded_Wide_Wide_String (Text);
+      Mark_Modified (Handle);
    end Set_Text;
 
    -------------
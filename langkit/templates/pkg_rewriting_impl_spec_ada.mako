@@ -75,6 +75,10 @@ private package ${ada_lib_name}.Rewriting_Implementation is
       Nodes : Node_Maps.Map;
       --  Keep track of rewriting handles we create for base AST nodes that
       --  Unit owns.
+
+      Modified : Boolean;
+      --  Whether the tree of this unit was modified during the rewriting
+      --  session. Only modified units need to be reparsed on Apply.
    end record;
 
    package Node_Vectors is new Ada.Containers.Vectors
@@ -35,6 +35,12 @@ library project ${lib_name} is
 
    type Boolean is ("false", "true");
 
+   ## When building library types concurrently, each one needs its own object
+   ## directory: see the --parallel-library-types option in
+   ## langkit.libmanage.
+   Library_Type_Object_Dirs : Boolean :=
+     external ("${lib_name.upper()}_LIBRARY_TYPE_OBJ_DIRS", "false");
+
    ## Disable style checks on instrumented code
    % if emitter.coverage:
       Enable_Warnings : Boolean := "false";
@@ -107,7 +113,12 @@ library project ${lib_name} is
    % endif
 
    for Library_Dir use "lib/" & Library_Kind_Param & "/" & Build_Mode;
-   for Object_Dir use "obj/" & Build_Mode;
+   case Library_Type_Object_Dirs is
+      when "false" =>
+         for Object_Dir use "obj/" & Build_Mode;
+      when "true" =>
+         for Object_Dir use "obj/" & Build_Mode & "-" & Library_Kind_Param;
+   end case;
 
    Target := ${lib_name}'Target;
 
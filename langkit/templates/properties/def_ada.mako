@@ -185,7 +185,8 @@ begin
       % endif
 
          if Find_Memoized_Value
-           (Self.Unit, Mmz_Handle, Mmz_Val, Create_Mmz_Key'Access)
+           (Self.Unit, ${property.memoization_enum}, Mmz_Handle, Mmz_Val,
+            Create_Mmz_Key'Access)
          then
             ${gdb_memoization_lookup()}
 
@@ -26,6 +26,7 @@ from __future__ import absolute_import, division, print_function
 
 
 import argparse
+import array
 import collections
 import ctypes
 import json
@@ -534,6 +535,41 @@ class AnalysisContext(object):
         ${py_doc('langkit.context_discard_errors_in_populate_lexical_env', 8)}
         _discard_errors_in_populate_lexical_env(self._c_value, bool(discard))
 
+    _memoization_policy_kinds = ('unbounded', 'lru', 'disabled')
+
+    def set_memoization_policy(self, kind, max_entries=0, property_name=None):
+        ${py_doc('langkit.context_set_memoization_policy', 8)}
+        try:
+            c_kind = self._memoization_policy_kinds.index(kind)
+        except ValueError:
+            raise ValueError('Invalid memoization policy: {}'.format(
+                repr(kind)
+            ))
+
+        if property_name is None:
+            indexes = [0]
+        else:
+            indexes = [i for i, name in enumerate(memoized_properties(), 1)
+                       if name == property_name]
+            if not indexes:
+                raise ValueError('No such memoized property: {}'.format(
+                    repr(property_name)
+                ))
+
+        for i in indexes:
+            _context_set_memoization_policy(self._c_value, i, c_kind,
+                                            max_entries)
+
+    def memoization_stats(self):
+        ${py_doc('langkit.context_memoization_stats', 8)}
+        result = {}
+        for i, name in enumerate(memoized_properties(), 1):
+            c_stats = MemoizationStats._c_type()
+            _context_memoization_stats(self._c_value, i,
+                                       ctypes.byref(c_stats))
+            result[name] = c_stats._wrap()
+        return result
+
     class _c_struct(ctypes.Structure):
         _fields_ = [('serial_number', ctypes.c_uint64)]
     _c_type = _hashable_c_pointer(_c_struct)
@@ -693,6 +729,12 @@ class AnalysisUnit(object):
         ${py_doc('langkit.python.AnalysisUnit.iter_tokens', 8)}
         return self.TokenIterator(self.first_token)
 
+    def export_tokens(self, start=0, stop=None):
+        ${py_doc('langkit.unit_export_tokens', 8)}
+        total = self.token_count + self.trivia_count
+        start, stop, _ = slice(start, stop).indices(total)
+        return TokenColumns._export(self, start, max(0, stop - start))
+
     @property
     def filename(self):
         ${py_doc('langkit.unit_filename', 8)}
@@ -878,6 +920,36 @@ class Diagnostic(object):
             return Diagnostic(self.sloc_range._wrap(), self.message._wrap())
 
 
+class MemoizationStats(object):
+    ${py_doc('langkit.memoization_stats', 4)}
+
+    def __init__(self, hits, misses, entries, bytes):
+        self.hits = hits
+        self.misses = misses
+        self.entries = entries
+        self.bytes = bytes
+
+    def __repr__(self):
+        return ('<MemoizationStats hits={} misses={} entries={} bytes={}>'
+                .format(self.hits, self.misses, self.entries, self.bytes))
+
+    class _c_type(ctypes.Structure):
+        _fields_ = [("hits", ctypes.c_longlong),
+                    ("misses", ctypes.c_longlong),
+                    ("entries", ctypes.c_longlong),
+                    ("bytes", ctypes.c_longlong)]
+
+        def _wrap(self):
+            return MemoizationStats(self.hits, self.misses, self.entries,
+                                    self.bytes)
+
+
+def memoized_properties():
+    ${py_doc('langkit.memoized_properties', 4)}
+    return [_unwrap_str(_memoized_property_name(i))
+            for i in range(1, _memoized_property_count() + 1)]
+
+
 class Token(ctypes.Structure):
     ${py_doc('langkit.token_reference_type', 4)}
 
@@ -1035,6 +1107,84 @@ class Token(ctypes.Structure):
         return (self._token_data, self._token_index, self._trivia_index)
 
 
+_token_columns = [('kinds',         'i', ctypes.c_int),
+                  ('start_offsets', 'i', ctypes.c_int),
+                  ('end_offsets',   'i', ctypes.c_int),
+                  ('start_lines',   'I', ctypes.c_uint32),
+                  ('start_columns', 'H', ctypes.c_uint16),
+                  ('end_lines',     'I', ctypes.c_uint32),
+                  ('end_columns',   'H', ctypes.c_uint16),
+                  ('is_trivia',     'B', ctypes.c_ubyte)]
+"""
+Name, ``array`` type code and ctypes element type for all the columns in
+``TokenColumns``.
+"""
+
+_token_kind_names = {}
+"""
+Cache for token kind names, indexed by token kind.
+"""
+
+
+class TokenColumns(object):
+    ${py_doc('langkit.python.TokenColumns', 4)}
+
+    class _c_type(ctypes.Structure):
+        _fields_ = [(name, ctypes.POINTER(c_type))
+                    for name, _, c_type in _token_columns]
+
+    def __init__(self, unit, columns):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Please use AnalysisUnit.export_tokens instead.
+        """
+        self.unit = unit
+        (self.kinds,
+         self.start_offsets, self.end_offsets,
+         self.start_lines, self.start_columns,
+         self.end_lines, self.end_columns,
+         self.is_trivia) = columns
+        self._source_text = None
+
+    @classmethod
+    def _export(cls, unit, first, count):
+        columns = [array.array(typecode, [0]) * count
+                   for _, typecode, _ in _token_columns]
+        c_columns = cls._c_type(*[
+            ctypes.cast(column.buffer_info()[0], ctypes.POINTER(c_type))
+            for column, (_, _, c_type) in zip(columns, _token_columns)
+        ])
+        count = _unit_export_tokens(unit._c_value, first, count,
+                                    ctypes.byref(c_columns))
+        for column in columns:
+            del column[count:]
+        return cls(unit, columns)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def kind(self, i):
+        ${py_doc('langkit.python.TokenColumns.kind', 8)}
+        kind = self.kinds[i]
+        try:
+            return _token_kind_names[kind]
+        except KeyError:
+            name = _unwrap_str(_token_kind_name(kind))
+            _token_kind_names[kind] = name
+            return name
+
+    def text(self, i):
+        ${py_doc('langkit.python.TokenColumns.text', 8)}
+        if self._source_text is None:
+            self._source_text = self.unit.text
+        return self._source_text[self.start_offsets[i]:self.end_offsets[i]]
+
+    def sloc_range(self, i):
+        ${py_doc('langkit.python.TokenColumns.sloc_range', 8)}
+        return SlocRange(Sloc(self.start_lines[i], self.start_columns[i]),
+                         Sloc(self.end_lines[i], self.end_columns[i]))
+
+
 ## TODO: if this is needed some day, also bind create_unit_provider to allow
 ## Python users to create their own unit providers.
 class UnitProvider(object):
@@ -1257,23 +1407,50 @@ class ${root_astnode_name}(object):
 
     def find(self, ast_type_or_pred, **kwargs):
         ${py_doc('langkit.python.root_node.find', 8)}
+        # When looking for nodes of given types with no other filter, let the
+        # native library stop its traversal at the first match. Otherwise,
+        # traverse the tree lazily from Python, so that we stop there too.
+        sought_types = self._sought_types(ast_type_or_pred)
+        if sought_types is not None and not kwargs:
+            nodes = self._find_all_kinds(sought_types, max_count=1)
+            return nodes[0] if nodes else None
+
         try:
-            return next(self.finditer(ast_type_or_pred, **kwargs))
+            return next(self._finditer(ast_type_or_pred, kwargs,
+                                       native=False))
         except StopIteration:
             return None
 
     def finditer(self, ast_type_or_pred, **kwargs):
         ${py_doc('langkit.python.root_node.finditer', 8)}
-        # Create a "pred" function to use as the node filter during the
-        # traversal.
+        return self._finditer(ast_type_or_pred, kwargs, native=True)
+
+    @staticmethod
+    def _sought_types(ast_type_or_pred):
+        """
+        If ``ast_type_or_pred`` is a node type or a sequence of node types,
+        return the corresponding tuple of node types. Return None otherwise.
+        """
         if isinstance(ast_type_or_pred, type):
-            sought_type = ast_type_or_pred
-            pred = lambda node: isinstance(node, sought_type)
+            return (ast_type_or_pred, )
         elif isinstance(ast_type_or_pred, collections.Sequence):
-            sought_types = ast_type_or_pred
-            pred = lambda node: isinstance(node, tuple(sought_types))
+            return tuple(ast_type_or_pred)
         else:
+            return None
+
+    def _finditer(self, ast_type_or_pred, kwargs, native):
+        """
+        Implementation of ``finditer``. If ``native`` is true and
+        ``ast_type_or_pred`` designates node types, let the native library
+        fetch all matching nodes at once. Otherwise, traverse the tree lazily.
+        """
+        # Create a "pred" function to use as the node filter during the
+        # traversal.
+        sought_types = self._sought_types(ast_type_or_pred)
+        if sought_types is None:
             pred = ast_type_or_pred
+        else:
+            pred = lambda node: isinstance(node, sought_types)
 
         def match(left, right):
             """
@@ -1300,8 +1477,45 @@ class ${root_astnode_name}(object):
                         if c is not None:
                             yield c
 
+        # When looking for nodes of given types, let the native library do the
+        # traversal and the filtering: this is much faster than walking the
+        # tree node by node from Python.
+        if native and sought_types is not None:
+            nodes = self._find_all_kinds(sought_types)
+            if not kwargs:
+                return iter(nodes)
+            return (n for n in nodes
+                    if all([match(getattr(n, key, None), val)
+                            for key, val in kwargs.items()]))
+
         return helper(self)
 
+    _kinds_for_types = {}
+    """
+    Cache for the lists of concrete node kinds corresponding to tuples of node
+    types. See ``_find_all_kinds``.
+    """
+
+    def _find_all_kinds(self, sought_types, max_count=0):
+        """
+        Return the list of all nodes in this node's subtree (excluding this
+        node) that are instances of one of the ``sought_types`` node types, in
+        prefix order. If ``max_count`` is not zero, return at most the first
+        ``max_count`` such nodes.
+        """
+        try:
+            kinds = ${root_astnode_name}._kinds_for_types[sought_types]
+        except KeyError:
+            kinds = [kind for kind, cls in _kind_to_astnode_cls.items()
+                     if issubclass(cls, sought_types)]
+            ${root_astnode_name}._kinds_for_types[sought_types] = kinds
+
+        c_kinds = (ctypes.c_int * len(kinds))(*kinds)
+        c_result = self._eval_field(${pyapi.c_type(T.entity.array)}(),
+                                    _node_find_all, c_kinds, len(kinds),
+                                    max_count)
+        return ${pyapi.wrap_value('c_result', T.entity.array)}
+
     @property
     def parent_chain(self):
         ${py_doc('langkit.python.root_node.parent_chain', 8)}
@@ -1335,18 +1549,49 @@ class ${root_astnode_name}(object):
 
     def to_data(self):
         ${py_doc('langkit.python.root_node.to_data', 8)}
-        if self.is_list_type:
-            return [i.to_data() for i in self if i is not None]
-        else:
-            return {n: v.to_data()
-                    for n, v in self.iter_fields()
-                    if v is not None}
+        return json.loads(self.to_json())
 
     def to_json(self):
         """
         Return a JSON representation of this node.
         """
-        return json.dumps(self.to_data())
+        return self.serialize().decode('ascii')
+
+    _serialization_formats = ('json', 'binary')
+
+    _serialization_buffer_size = 4096
+    """
+    Size of the buffer to allocate for a first serialization attempt. Bigger
+    serializations need a second call to the library, with a buffer of the
+    exact size.
+    """
+
+    def serialize(self, format='json', file=None):
+        ${py_doc('langkit.node_serialize', 8)}
+        try:
+            c_format = self._serialization_formats.index(format)
+        except ValueError:
+            raise ValueError('Invalid serialization format: {}'.format(
+                repr(format)
+            ))
+        c_node = self._unwrap(self)
+
+        if file is not None:
+            if isinstance(file, int):
+                fd = file
+            else:
+                file.flush()
+                fd = file.fileno()
+            _node_serialize_to_fd(c_node, c_format, fd)
+            return None
+
+        size = self._serialization_buffer_size
+        buf = ctypes.create_string_buffer(size)
+        result_size = _node_serialize(c_node, c_format, buf, size)
+        if result_size > size:
+            buf = ctypes.create_string_buffer(result_size)
+            _node_serialize(c_node, c_format, buf, result_size)
+        return ctypes.string_at(buf, result_size)
 
     def is_a(self, *types):
         """
@@ -1569,6 +1814,23 @@ _discard_errors_in_populate_lexical_env = _import_func(
    '${capi.get_name("context_discard_errors_in_populate_lexical_env")}',
    [AnalysisContext._c_type, ctypes.c_int], None
 )
+_context_set_memoization_policy = _import_func(
+   '${capi.get_name("context_set_memoization_policy")}',
+   [AnalysisContext._c_type, ctypes.c_int, ctypes.c_int, ctypes.c_int], None
+)
+_context_memoization_stats = _import_func(
+   '${capi.get_name("context_memoization_stats")}',
+   [AnalysisContext._c_type, ctypes.c_int,
+    ctypes.POINTER(MemoizationStats._c_type)], None
+)
+_memoized_property_count = _import_func(
+   '${capi.get_name("memoized_property_count")}',
+   [], ctypes.c_int, exc_wrap=False
+)
+_memoized_property_name = _import_func(
+   '${capi.get_name("memoized_property_name")}',
+   [ctypes.c_int], ctypes.POINTER(ctypes.c_char)
+)
 _get_analysis_unit_from_file = _import_func(
     '${capi.get_name("get_analysis_unit_from_file")}',
     [AnalysisContext._c_type,  # context
@@ -1710,6 +1972,26 @@ _node_child = _import_func(
     [ctypes.POINTER(${c_entity}), ctypes.c_uint, ctypes.POINTER(${c_entity})],
     ctypes.c_int
 )
+_node_find_all = _import_func(
+    '${capi.get_name("node_find_all")}',
+    [ctypes.POINTER(${c_entity}),
+     ctypes.POINTER(ctypes.c_int),
+     ctypes.c_uint,
+     ctypes.c_uint,
+     ctypes.POINTER(${pyapi.c_type(T.entity.array)})],
+    ctypes.c_int
+)
+_node_serialize = _import_func(
+    '${capi.get_name("node_serialize")}',
+    [ctypes.POINTER(${c_entity}), ctypes.c_int, ctypes.c_char_p,
+     ctypes.c_size_t],
+    ctypes.c_size_t
+)
+_node_serialize_to_fd = _import_func(
+    '${capi.get_name("node_serialize_to_fd")}',
+    [ctypes.POINTER(${c_entity}), ctypes.c_int, ctypes.c_int],
+    ctypes.c_int
+)
 
 % for astnode in ctx.astnode_types:
     % for field in astnode.fields_with_accessors():
@@ -1740,6 +2022,12 @@ ${exts.include_extension(
 )}
 
 # Misc
+_unit_export_tokens = _import_func(
+    '${capi.get_name("unit_export_tokens")}',
+    [AnalysisUnit._c_type, ctypes.c_int, ctypes.c_int,
+     ctypes.POINTER(TokenColumns._c_type)],
+    ctypes.c_int
+)
 _token_kind_name = _import_func(
    "${capi.get_name('token_kind_name')}",
    [ctypes.c_int], ctypes.POINTER(ctypes.c_char)
@@ -8,6 +8,7 @@
 <%namespace name="struct_types"  file="struct_types_py.mako" />
 
 import argparse
+import array
 import sys
 from typing import (
     Any, AnyStr, Callable, ClassVar, Dict, IO, Iterator, List, Optional as Opt,
@@ -85,6 +86,15 @@ class AnalysisContext(object):
         ${py_doc('langkit.context_discard_errors_in_populate_lexical_env', 8,
                  or_pass=True)}
 
+    def set_memoization_policy(self,
+                               kind: str,
+                               max_entries: int = 0,
+                               property_name: Opt[str] = None) -> None:
+        ${py_doc('langkit.context_set_memoization_policy', 8, or_pass=True)}
+
+    def memoization_stats(self) -> Dict[str, MemoizationStats]:
+        ${py_doc('langkit.context_memoization_stats', 8, or_pass=True)}
+
 class AnalysisUnit(object):
     ${py_doc('langkit.analysis_unit_type', 4)}
 
@@ -143,6 +153,10 @@ class AnalysisUnit(object):
     def iter_tokens(self) -> AnalysisUnit.TokenIterator:
         ${py_doc('langkit.python.AnalysisUnit.iter_tokens', 8, or_pass=True)}
 
+    def export_tokens(self, start: int = 0,
+                      stop: Opt[int] = None) -> TokenColumns:
+        ${py_doc('langkit.unit_export_tokens', 8, or_pass=True)}
+
     @property
     def filename(self) -> str:
         ${py_doc('langkit.unit_filename', 8, or_pass=True)}
@@ -201,6 +215,23 @@ class Diagnostic(object):
     def __repr__(self) -> str: ...
 
 
+class MemoizationStats(object):
+    ${py_doc('langkit.memoization_stats', 4)}
+
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+    def __init__(self, hits: int, misses: int, entries: int,
+                 bytes: int) -> None: ...
+    def __repr__(self) -> str: ...
+
+
+def memoized_properties() -> List[str]:
+    ${py_doc('langkit.memoized_properties', 4, or_pass=True)}
+
+
 class Token(object):
     ${py_doc('langkit.token_reference_type', 4)}
 
@@ -259,6 +290,31 @@ class Token(object):
         ${py_doc('langkit.python.Token.to_data', 8, or_pass=True)}
 
 
+class TokenColumns(object):
+    ${py_doc('langkit.python.TokenColumns', 4)}
+
+    unit: AnalysisUnit
+    kinds: array.array
+    start_offsets: array.array
+    end_offsets: array.array
+    start_lines: array.array
+    start_columns: array.array
+    end_lines: array.array
+    end_columns: array.array
+    is_trivia: array.array
+
+    def __len__(self) -> int: ...
+
+    def kind(self, i: int) -> str:
+        ${py_doc('langkit.python.TokenColumns.kind', 8, or_pass=True)}
+
+    def text(self, i: int) -> str:
+        ${py_doc('langkit.python.TokenColumns.text', 8, or_pass=True)}
+
+    def sloc_range(self, i: int) -> SlocRange:
+        ${py_doc('langkit.python.TokenColumns.sloc_range', 8, or_pass=True)}
+
+
 class UnitProvider(object):
     ${py_doc('langkit.unit_provider_type', 4)}
 
@@ -379,6 +435,10 @@ class ${root_astnode_name}(object):
     def to_json(self) -> str:
         ${py_doc('langkit.python.root_node.to_json', 8, or_pass=True)}
 
+    def serialize(self, format: str = 'json',
+                  file: Union[None, int, IO[Any]] = None) -> Opt[bytes]:
+        ${py_doc('langkit.node_serialize', 8, or_pass=True)}
+
     def is_a(self, *types: Type[${root_astnode_name}]) -> bool:
         ${py_doc('langkit.python.root_node.is_a', 8, or_pass=True)}
 
@@ -27,7 +27,8 @@ setup(
               'langkit.stylechecks',
               'langkit.utils'],
     package_data={'langkit': [
-        'coverage.css', 'support/*.adb', 'support/*.ads', 'support/*.gpr',
+        'coverage.css', 'lexer/unicode_data.bin', 'support/*.adb',
+        'support/*.ads', 'support/*.gpr',
         'templates/*.mako', 'templates/*/*.mako'
     ]},
     scripts=[os.path.join('scripts', 'create-project.py')]
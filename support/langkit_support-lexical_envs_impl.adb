@@ -92,6 +92,46 @@ package body Langkit_Support.Lexical_Envs_Impl is
    procedure Reset_Lookup_Cache (Self : Lexical_Env);
    --  Reset Self's lexical environment lookup cache
 
+   function Convert is new Ada.Unchecked_Conversion
+     (System.Address, Lookup_Cache_Budget_Access);
+
+   function Lookup_Cache_Budget_For
+     (Owner : Generic_Unit_Ptr) return Lookup_Cache_Budget_Access
+   is
+     (if Owner = No_Generic_Unit
+      then null
+      else Convert (Get_Lookup_Cache_Budget (Owner)));
+   --  Return the lookup cache budget for environments that belong to Owner
+
+   function Lookup_Cache_Entry_Cost
+     (Elements : Lookup_Result_Vector) return Long_Long_Integer
+   is
+     (Long_Long_Integer
+        ((Lookup_Cache_Key'Size + Lookup_Cache_Entry'Size) / 8
+         + Lookup_Cache_Slot'Size / 8
+         + Lookup_Result_Item_Vectors.Length (Elements)
+           * Lookup_Result_Item'Size / 8));
+   --  Return an estimation of the memory (in bytes) used by a lookup cache
+   --  entry whose results are Elements, including its bookkeeping in the
+   --  cache budget.
+
+   function Allocate_Slot
+     (Self : in out Lookup_Cache_Budget;
+      Env  : Lexical_Env_Access;
+      Key  : Lookup_Cache_Key;
+      Cost : Long_Long_Integer) return Positive;
+   --  Account for the entry for Key in Env's lookup cache in Self and return
+   --  the index of the slot allocated for it.
+
+   procedure Release_Slot (Self : in out Lookup_Cache_Budget; Slot : Positive);
+   --  Stop accounting for the cache entry that uses Slot in Self
+
+   procedure Enforce_Max_Memory
+     (Self : in out Lookup_Cache_Budget; Keep : Natural := 0);
+   --  Evict cache entries accounted for in Self until their memory usage is
+   --  below the limit, or until only the entry for the Keep slot is left (if
+   --  Keep is not 0). The cache entry for the Keep slot is never evicted.
+
    ----------------
    -- Text_Image --
    ----------------
@@ -133,12 +173,195 @@ package body Langkit_Support.Lexical_Envs_Impl is
    begin
       for C of Env.Lookup_Cache loop
          C.Elements.Destroy;
+         if C.Slot /= 0 then
+            Release_Slot (Env.Lookup_Cache_Budget.all, C.Slot);
+         end if;
       end loop;
 
       Env.Lookup_Cache.Clear;
       Env.Lookup_Cache_Valid := True;
    end Reset_Lookup_Cache;
 
+   -------------------
+   -- Allocate_Slot --
+   -------------------
+
+   function Allocate_Slot
+     (Self : in out Lookup_Cache_Budget;
+      Env  : Lexical_Env_Access;
+      Key  : Lookup_Cache_Key;
+      Cost : Long_Long_Integer) return Positive
+   is
+      Slot_Value : constant Lookup_Cache_Slot :=
+        (Env => Env, Key => Key, Cost => Cost, Referenced => True);
+      Result     : Positive;
+   begin
+      --  Newly cached entries start with the Referenced flag set so that they
+      --  survive at least one turn of the clock hand.
+
+      if Self.Free_Slots.Length > 0 then
+         Result := Self.Free_Slots.Pop;
+         Self.Slots.Set (Result, Slot_Value);
+      else
+         Self.Slots.Append (Slot_Value);
+         Result := Self.Slots.Last_Index;
+      end if;
+
+      Self.Stats.Entries := Self.Stats.Entries + 1;
+      Self.Stats.Memory := Self.Stats.Memory + Cost;
+      return Result;
+   end Allocate_Slot;
+
+   ------------------
+   -- Release_Slot --
+   ------------------
+
+   procedure Release_Slot (Self : in out Lookup_Cache_Budget; Slot : Positive)
+   is
+      S : Lookup_Cache_Slot renames Self.Slots.Get_Access (Slot).all;
+   begin
+      Self.Stats.Entries := Self.Stats.Entries - 1;
+      Self.Stats.Memory := Self.Stats.Memory - S.Cost;
+      S.Env := null;
+      Self.Free_Slots.Append (Slot);
+   end Release_Slot;
+
+   ------------------------
+   -- Enforce_Max_Memory --
+   ------------------------
+
+   procedure Enforce_Max_Memory
+     (Self : in out Lookup_Cache_Budget; Keep : Natural := 0)
+   is
+      Min_Entries : constant Long_Long_Integer := (if Keep = 0 then 0 else 1);
+   begin
+      if Self.Max_Memory = 0 then
+         return;
+      end if;
+
+      while Self.Stats.Memory > Self.Max_Memory
+            and then Self.Stats.Entries > Min_Entries
+      loop
+         if Self.Hand > Self.Slots.Last_Index then
+            Self.Hand := 1;
+         end if;
+
+         declare
+            S : Lookup_Cache_Slot renames
+              Self.Slots.Get_Access (Self.Hand).all;
+         begin
+            if S.Env = null or else Self.Hand = Keep then
+               null;
+
+            elsif S.Referenced then
+               --  This entry was used recently: give it a second chance
+               S.Referenced := False;
+
+            else
+               declare
+                  Env      : constant Lexical_Env_Access := S.Env;
+                  Position : Lookup_Cache_Maps.Cursor :=
+                    Env.Lookup_Cache.Find (S.Key);
+                  Elements : Lookup_Result_Vector :=
+                    Lookup_Cache_Maps.Element (Position).Elements;
+               begin
+                  if Caches_Trace.Active then
+                     Caches_Trace.Trace
+                       ("Evicting lookup cache entry for "
+                        & Image (S.Key.Symbol));
+                  end if;
+
+                  Lookup_Result_Item_Vectors.Destroy (Elements);
+                  Env.Lookup_Cache.Delete (Position);
+                  Release_Slot (Self, Self.Hand);
+                  Self.Stats.Evictions := Self.Stats.Evictions + 1;
+               end;
+            end if;
+         end;
+
+         Self.Hand := Self.Hand + 1;
+      end loop;
+   end Enforce_Max_Memory;
+
+   --------------------
+   -- Set_Max_Memory --
+   --------------------
+
+   procedure Set_Max_Memory
+     (Self : in out Lookup_Cache_Budget; Max_Memory : Long_Long_Integer) is
+   begin
+      Self.Max_Memory := Max_Memory;
+      Enforce_Max_Memory (Self);
+   end Set_Max_Memory;
+
+   --------------------
+   -- Dump_Occupancy --
+   --------------------
+
+   procedure Dump_Occupancy (Self : Lookup_Cache_Budget) is
+
+      type Env_Occupancy is record
+         Env     : Lexical_Env_Access;
+         Entries : Natural;
+         Memory  : Long_Long_Integer;
+      end record;
+
+      package Env_Occupancy_Vectors is new Langkit_Support.Vectors
+        (Env_Occupancy);
+
+      Occupancy : Env_Occupancy_Vectors.Vector;
+      Found     : Boolean;
+   begin
+      Put_Line
+        ("Lookup caches:" & Self.Stats.Entries'Image & " entries,"
+         & Self.Stats.Memory'Image & " bytes");
+
+      --  Group slots by environment, preserving the order in which
+      --  environments first appear in the ring.
+
+      for S of Self.Slots loop
+         if S.Env /= null then
+            Found := False;
+            for I in 1 .. Occupancy.Last_Index loop
+               declare
+                  O : Env_Occupancy renames Occupancy.Get_Access (I).all;
+               begin
+                  if O.Env = S.Env then
+                     O.Entries := O.Entries + 1;
+                     O.Memory := O.Memory + S.Cost;
+                     Found := True;
+                     exit;
+                  end if;
+               end;
+            end loop;
+
+            if not Found then
+               Occupancy.Append ((S.Env, 1, S.Cost));
+            end if;
+         end if;
+      end loop;
+
+      for O of Occupancy loop
+         Put_Line
+           (Lexical_Env_Image (Wrap (O.Env), Dump_Content => False)
+            & ":" & O.Entries'Image & " entries," & O.Memory'Image
+            & " bytes");
+      end loop;
+
+      Occupancy.Destroy;
+   end Dump_Occupancy;
+
+   -------------
+   -- Destroy --
+   -------------
+
+   procedure Destroy (Self : in out Lookup_Cache_Budget) is
+   begin
+      Self.Slots.Destroy;
+      Self.Free_Slots.Destroy;
+      Self := (others => <>);
+   end Destroy;
+
    -----------------------
    -- Simple_Env_Getter --
    -----------------------
@@ -434,6 +657,7 @@ package body Langkit_Support.Lexical_Envs_Impl is
             Rebindings_Pool          => null,
             Lookup_Cache_Valid       => True,
             Lookup_Cache             => Lookup_Cache_Maps.Empty_Map,
+            Lookup_Cache_Budget      => Lookup_Cache_Budget_For (Owner),
             Rebindings_Assoc_Ref_Env => -1),
          Owner => Owner);
    end Create_Lexical_Env;
@@ -974,7 +1198,7 @@ package body Langkit_Support.Lexical_Envs_Impl is
 
          declare
             Val : constant Lookup_Cache_Entry :=
-              (Computing, Empty_Lookup_Result_Vector);
+              (Computing, Empty_Lookup_Result_Vector, 0);
          begin
             Env.Lookup_Cache.Insert
               (Res_Key, Val, Cached_Res_Cursor, Inserted);
@@ -998,6 +1222,16 @@ package body Langkit_Support.Lexical_Envs_Impl is
                when Computing =>
                   return;
                when Computed =>
+                  if Res_Val.Slot /= 0 then
+                     declare
+                        Budget : Lookup_Cache_Budget renames
+                          Env.Lookup_Cache_Budget.all;
+                     begin
+                        Budget.Stats.Hits := Budget.Stats.Hits + 1;
+                        Budget.Slots.Get_Access (Res_Val.Slot).Referenced :=
+                          True;
+                     end;
+                  end if;
                   Local_Results.Concat (Res_Val.Elements);
                   return;
                when None =>
@@ -1107,7 +1341,28 @@ package body Langkit_Support.Lexical_Envs_Impl is
         and then Lookup_Kind = Recursive
         and then Need_Cache
       then
-         Env.Lookup_Cache.Include (Res_Key, (Computed, Local_Results));
+         declare
+            Budget : constant Lookup_Cache_Budget_Access :=
+              Env.Lookup_Cache_Budget;
+            Slot   : Natural := 0;
+         begin
+            if Budget /= null then
+               Budget.Stats.Misses := Budget.Stats.Misses + 1;
+               Slot := Allocate_Slot
+                 (Budget.all, Env, Res_Key,
+                  Lookup_Cache_Entry_Cost (Local_Results));
+            end if;
+
+            Env.Lookup_Cache.Include
+              (Res_Key, (Computed, Local_Results, Slot));
+
+            --  Never evict the entry we just added: its elements are still
+            --  used below.
+
+            if Budget /= null then
+               Enforce_Max_Memory (Budget.all, Keep => Slot);
+            end if;
+         end;
          Outer_Results.Concat (Local_Results);
          Local_Results := Outer_Results;
       end if;
@@ -21,10 +21,159 @@
 -- <http://www.gnu.org/licenses/>.                                          --
 ------------------------------------------------------------------------------
 
+with Ada.Unchecked_Deallocation;
+
 package body Langkit_Support.Packrat is
 
-   function Entry_Index (Offset : Token_Index) return Natural is
-     (Integer (Offset) mod Memo_Size);
+   procedure Free is new Ada.Unchecked_Deallocation
+     (Memo_Entry_Array, Memo_Entry_Array_Access);
+   procedure Free is new Ada.Unchecked_Deallocation
+     (Memo_Entry_Maps.Map, Memo_Entry_Map_Access);
+
+   procedure Grow (Memo : in out Memo_Type; Index : Natural);
+   --  Make sure that the entries table for Memo (a Dense table) is allocated
+   --  and contains Index.
+
+   function Lookup
+     (Stats  : in out Memo_Stats;
+      E      : Memo_Entry;
+      Offset : Token_Index) return Memo_Entry
+     with Inline;
+   --  Return E if it is a valid entry for Offset, and an entry with no result
+   --  otherwise. Update Stats accordingly.
+
+   procedure Store
+     (Stats     : in out Memo_Stats;
+      E         : in out Memo_Entry;
+      New_Entry : Memo_Entry)
+     with Inline;
+   --  Overwrite E with New_Entry, updating Stats if this evicts an entry for
+   --  another offset.
+
+   procedure Count_Get (Stats : in out Memo_Stats; Found : Boolean);
+   --  Update Stats for a Get call. Found designates whether Get returned an
+   --  entry.
+
+   procedure Count_Eviction (Stats : in out Memo_Stats);
+   --  Update Stats for an entry eviction
+
+   ----------
+   -- Grow --
+   ----------
+
+   procedure Grow (Memo : in out Memo_Type; Index : Natural) is
+      New_Size : Natural;
+      Old      : Memo_Entry_Array_Access;
+   begin
+      if Memo.Entries = null then
+         New_Size := Natural'Max (Memo_Size, Index + 1);
+         Memo.Entries := new Memo_Entry_Array (0 .. New_Size - 1);
+
+      elsif Index > Memo.Entries'Last then
+         New_Size := Natural'Max (2 * Memo.Entries'Length, Index + 1);
+         Old := Memo.Entries;
+         Memo.Entries := new Memo_Entry_Array (0 .. New_Size - 1);
+         Memo.Entries (Old'Range) := Old.all;
+         Free (Old);
+      end if;
+   end Grow;
+
+   ------------
+   -- Lookup --
+   ------------
+
+   function Lookup
+     (Stats  : in out Memo_Stats;
+      E      : Memo_Entry;
+      Offset : Token_Index) return Memo_Entry is
+   begin
+      if E.State /= No_Result and then E.Offset = Offset then
+         pragma Debug (Count_Get (Stats, True));
+         return E;
+      else
+         pragma Debug (Count_Get (Stats, False));
+         return (State => No_Result, others => <>);
+      end if;
+   end Lookup;
+
+   -----------
+   -- Store --
+   -----------
+
+   procedure Store
+     (Stats     : in out Memo_Stats;
+      E         : in out Memo_Entry;
+      New_Entry : Memo_Entry) is
+   begin
+      pragma Debug
+        (E.State /= No_Result and then E.Offset /= New_Entry.Offset,
+         Count_Eviction (Stats));
+      E := New_Entry;
+   end Store;
+
+   ---------------
+   -- Count_Get --
+   ---------------
+
+   procedure Count_Get (Stats : in out Memo_Stats; Found : Boolean) is
+   begin
+      if Found then
+         Stats.Hits := Stats.Hits + 1;
+      else
+         Stats.Misses := Stats.Misses + 1;
+      end if;
+   end Count_Get;
+
+   --------------------
+   -- Count_Eviction --
+   --------------------
+
+   procedure Count_Eviction (Stats : in out Memo_Stats) is
+   begin
+      Stats.Evictions := Stats.Evictions + 1;
+   end Count_Eviction;
+
+   ----------------
+   -- Initialize --
+   ----------------
+
+   procedure Initialize
+     (Memo : in out Memo_Type;
+      Kind : Memo_Kind;
+      Size : Positive := Memo_Size) is
+   begin
+      Destroy (Memo);
+      Memo.Kind := Kind;
+      Memo.Size := Size;
+
+      --  Allocate only the storage that this strategy uses: Ring tables with
+      --  the default size use the Ring inline array and Dense tables
+      --  allocate their entries on demand.
+
+      case Kind is
+         when Ring =>
+            if Size /= Memo_Size then
+               Memo.Entries := new Memo_Entry_Array (0 .. Size - 1);
+            end if;
+
+         when Dense =>
+            null;
+
+         when Hashed =>
+            Memo.Map := new Memo_Entry_Maps.Map;
+      end case;
+   end Initialize;
+
+   -------------
+   -- Reserve --
+   -------------
+
+   procedure Reserve (Memo : in out Memo_Type; Last_Offset : Token_Index) is
+   begin
+      if Memo.Kind = Dense then
+         Grow (Memo, Integer (Last_Offset));
+      end if;
+   end Reserve;
 
    -----------
    -- Clear --
@@ -32,23 +181,78 @@ package body Langkit_Support.Packrat is
 
    procedure Clear (Memo : in out Memo_Type) is
    begin
-      for E of Memo loop
+      if Memo.Kind = Hashed then
+         Memo.Map.Clear;
+      elsif Memo.Entries /= null then
+         for E of Memo.Entries.all loop
+            E.State := No_Result;
+         end loop;
+      elsif Memo.Kind = Ring then
+         for E of Memo.Ring loop
+            E.State := No_Result;
+         end loop;
+      end if;
+      Memo.Stats := (others => 0);
+   end Clear;
+
+   -------------
+   -- Destroy --
+   -------------
+
+   procedure Destroy (Memo : in out Memo_Type) is
+   begin
+      for E of Memo.Ring loop
          E.State := No_Result;
       end loop;
-   end Clear;
+      Free (Memo.Entries);
+      Free (Memo.Map);
+      Memo.Stats := (others => 0);
+   end Destroy;
 
    ---------
    -- Get --
    ---------
 
-   function Get (Memo : Memo_Type; Offset : Token_Index) return Memo_Entry is
-      E : Memo_Entry renames Memo (Entry_Index (Offset));
+   function Get
+     (Memo : in out Memo_Type; Offset : Token_Index) return Memo_Entry is
    begin
-      if E.Offset = Offset then
-         return E;
-      else
-         return (State => No_Result, others => <>);
-      end if;
+      case Memo.Kind is
+         when Ring =>
+            declare
+               Index : constant Natural := Integer (Offset) mod Memo.Size;
+            begin
+               if Memo.Entries = null then
+                  return Lookup (Memo.Stats, Memo.Ring (Index), Offset);
+               else
+                  return Lookup (Memo.Stats, Memo.Entries (Index), Offset);
+               end if;
+            end;
+
+         when Dense =>
+            declare
+               Index : constant Natural := Integer (Offset);
+            begin
+               if Memo.Entries /= null
+                  and then Index <= Memo.Entries'Last
+               then
+                  return Lookup (Memo.Stats, Memo.Entries (Index), Offset);
+               end if;
+            end;
+
+         when Hashed =>
+            declare
+               Cur : constant Memo_Entry_Maps.Cursor :=
+                  Memo.Map.Find (Offset);
+            begin
+               if Memo_Entry_Maps.Has_Element (Cur) then
+                  pragma Debug (Count_Get (Memo.Stats, True));
+                  return Memo_Entry_Maps.Element (Cur);
+               end if;
+            end;
+      end case;
+
+      pragma Debug (Count_Get (Memo.Stats, False));
+      return (State => No_Result, others => <>);
    end Get;
 
    ---------
@@ -60,12 +264,53 @@ package body Langkit_Support.Packrat is
                   Instance          : T;
                   Offset, Final_Pos : Token_Index)
    is
-      E : Memo_Entry renames Memo (Entry_Index (Offset));
+      New_Entry : constant Memo_Entry :=
+        (State     => (if Is_Success then Success else Failure),
+         Instance  => Instance,
+         Offset    => Offset,
+         Final_Pos => Final_Pos);
    begin
-      E := (State     => (if Is_Success then Success else Failure),
-            Instance  => Instance,
-            Offset    => Offset,
-            Final_Pos => Final_Pos);
+      case Memo.Kind is
+         when Ring =>
+            declare
+               Index : constant Natural := Integer (Offset) mod Memo.Size;
+            begin
+               if Memo.Entries = null then
+                  Store (Memo.Stats, Memo.Ring (Index), New_Entry);
+               else
+                  Store (Memo.Stats, Memo.Entries (Index), New_Entry);
+               end if;
+            end;
+
+         when Dense =>
+            declare
+               Index : constant Natural := Integer (Offset);
+            begin
+               Grow (Memo, Index);
+               Store (Memo.Stats, Memo.Entries (Index), New_Entry);
+            end;
+
+         when Hashed =>
+            Memo.Map.Include (Offset, New_Entry);
+      end case;
    end Set;
 
+   ----------
+   -- Kind --
+   ----------
+
+   function Kind (Memo : Memo_Type) return Memo_Kind is
+   begin
+      return Memo.Kind;
+   end Kind;
+
+   -----------
+   -- Stats --
+   -----------
+
+   function Stats (Memo : Memo_Type) return Memo_Stats is
+   begin
+      return Memo.Stats;
+   end Stats;
+
 end Langkit_Support.Packrat;
@@ -30,14 +30,69 @@ package body Langkit_Support.Symbols.Precomputed is
    function Create_Symbol_Table return Precomputed_Symbol_Table is
    begin
       return Result : constant Precomputed_Symbol_Table
-        := new Precomputed_Symbol_Table_Record do
+        := new Precomputed_Symbol_Table_Record
+      do
+         --  There is no perfect hash function for an empty set of symbols
+
+         Result.Use_Perfect_Hash :=
+           Precomputed_Symbol_Index'First <= Precomputed_Symbol_Index'Last;
+
          for I in Precomputed_Symbol_Index'Range loop
-            Result.Precomputed (I) := Find
-              (Symbol_Table (Result), Precomputed_Symbol (I));
+            declare
+               T : constant Text_Type := Precomputed_Symbol (I);
+            begin
+               if Result.Use_Perfect_Hash
+                  and then Precomputed_Symbol_Candidate (T) /= I
+               then
+                  --  The perfect hash function cannot find this symbol (for
+                  --  instance because canonicalization altered its text, or
+                  --  made it equal to another precomputed symbol): fall back
+                  --  to the hash table for all precomputed symbols.
+
+                  Result.Use_Perfect_Hash := False;
+                  for J in 1 .. Result.Symbols.Last_Index loop
+                     Result.Symbols_Map.Insert
+                       (Result.Symbols.Get (J), Thin_Symbol (J));
+                  end loop;
+               end if;
+
+               if Result.Use_Perfect_Hash then
+                  --  Only T can map to I, so T cannot be in the table yet
+
+                  Result.Symbols.Append (new Text_Type'(T));
+                  Result.Precomputed (I) :=
+                    Thin_Symbol (Result.Symbols.Last_Index);
+               else
+                  Result.Precomputed (I) := Find (Symbol_Table (Result), T);
+               end if;
+            end;
          end loop;
       end return;
    end Create_Symbol_Table;
 
+   ----------------------
+   -- Find_Precomputed --
+   ----------------------
+
+   overriding function Find_Precomputed
+     (Self : Precomputed_Symbol_Table_Record;
+      T    : Text_Type) return Thin_Symbol
+   is
+   begin
+      if not Self.Use_Perfect_Hash then
+         return No_Thin_Symbol;
+      end if;
+
+      declare
+         Result : constant Thin_Symbol :=
+           Self.Precomputed (Precomputed_Symbol_Candidate (T));
+      begin
+         return (if Self.Symbols.Get (Positive (Result)).all = T
+                 then Result
+                 else No_Thin_Symbol);
+      end;
+   end Find_Precomputed;
+
    ------------------------
    -- Precomputed_Symbol --
    ------------------------
@@ -75,12 +75,21 @@ package body Langkit_Support.Symbols is
    is
       use Maps;
 
-      T_Acc  : Symbol_Type := T'Unrestricted_Access;
-      Result : constant Cursor := ST.Symbols_Map.Find (T_Acc);
+      Precomputed : constant Thin_Symbol := Find_Precomputed (ST.all, T);
+      T_Acc       : Symbol_Type;
+      Result      : Cursor;
    begin
+      --  Precomputed symbols are not in the hash table: look for them first
+
+      if Precomputed /= No_Thin_Symbol then
+         return Precomputed;
+      end if;
+
       --  If we already have such a symbol, return the access we already
       --  internalized. Otherwise, give up if asked to.
 
+      T_Acc := T'Unrestricted_Access;
+      Result := ST.Symbols_Map.Find (T_Acc);
       if Has_Element (Result) then
          return Element (Result);
       elsif not Create then
@@ -96,6 +105,18 @@ package body Langkit_Support.Symbols is
       return Thin_Symbol (ST.Symbols.Last_Index);
    end Find;
 
+   ----------------------
+   -- Find_Precomputed --
+   ----------------------
+
+   function Find_Precomputed
+     (Self : Symbol_Table_Record; T : Text_Type) return Thin_Symbol
+   is
+      pragma Unreferenced (Self, T);
+   begin
+      return No_Thin_Symbol;
+   end Find_Precomputed;
+
    -------------
    -- Destroy --
    -------------
@@ -128,6 +149,30 @@ package body Langkit_Support.Symbols is
       end if;
    end Hash;
 
+   ------------------
+   -- Perfect_Hash --
+   ------------------
+
+   function Perfect_Hash (T : Text_Type; Seed : Unsigned_32) return Unsigned_32
+   is
+      Result : Unsigned_32 := 16#811C_9DC5# xor Seed;
+   begin
+      --  FNV-1a over code points, with an offset basis altered by Seed...
+
+      for C of T loop
+         Result := (Result xor Wide_Wide_Character'Pos (C)) * 16#0100_0193#;
+      end loop;
+
+      --  ... followed by the finalization step of MurmurHash3, so that all
+      --  bits of the result depend on Seed.
+
+      Result := Result xor Shift_Right (Result, 16);
+      Result := Result * 16#85EB_CA6B#;
+      Result := Result xor Shift_Right (Result, 13);
+      Result := Result * 16#C2B2_AE35#;
+      return Result xor Shift_Right (Result, 16);
+   end Perfect_Hash;
+
    ----------------
    -- Get_Symbol --
    ----------------
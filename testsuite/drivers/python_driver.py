@@ -70,6 +70,9 @@ class PythonDriver(BaseDriver):
         if self.valgrind_enabled:
             derived_env['VALGRIND_ENABLED'] = '1'
 
+        if self.env.build_cache_dir:
+            derived_env['LANGKIT_BUILD_CACHE_DIR'] = self.env.build_cache_dir
+
         self.run_and_check(argv + self.script_and_args, derived_env)
 
     @property
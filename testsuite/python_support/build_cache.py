@@ -0,0 +1,176 @@
+"""
+Testsuite-wide cache for the compilation of generated libraries.
+
+Testcases all generate a "libfoolang" library, and many of the units they
+generate are identical from one testcase to the other. This cache saves the
+object and ALI files of each unit after a build, and restores them before the
+next builds when the unit and all the generated sources it depends on are
+unchanged, so that GPRbuild does not recompile it.
+
+Restored ALI files carry the timestamps of the sources for which they were
+produced, so builds using the cache must run GPRbuild with the "-m" switch
+(minimal recompilation: rely on checksums rather than timestamps).
+
+Dependencies that are not generated sources (GNAT runtime, Langkit_Support,
+...) are considered constant: this is true as long as the cache is used for a
+single testsuite run.
+"""
+
+import glob
+import json
+import os
+import os.path as P
+import re
+import shutil
+
+from langkit.caching import content_digest, write_file_atomically
+
+
+max_candidates = 16
+"""
+Maximum number of cache entries to keep for each unit.
+"""
+
+
+class BuildCache:
+    def __init__(self, cache_dir, obj_dir, src_dirs, salt):
+        """
+        :param str cache_dir: Directory that contains cache entries. It is
+            shared by all the testcases of a testsuite run.
+        :param str obj_dir: Object directory for the generated library.
+        :param list[str] src_dirs: Source directories for the generated
+            library.
+        :param str salt: Anything else that affects compilation (compilation
+            switches, scenario variables, ...).
+        """
+        self.cache_dir = cache_dir
+        self.obj_dir = obj_dir
+        self.src_dirs = src_dirs
+        self.salt = salt
+
+    @classmethod
+    def for_project(cls, cache_dir, project_file, obj_dir, src_dirs,
+                    scenario_vars):
+        """
+        Create a build cache for the given generated library project.
+
+        :param str project_file: Project file for the generated library. Its
+            Compiler package is part of the key for all cache entries.
+        :param list[str] scenario_vars: GPRbuild arguments to set scenario
+            variables.
+        """
+        with open(project_file) as f:
+            m = re.search(r'^ *package Compiler is$.*^ *end Compiler;$',
+                          f.read(), re.MULTILINE | re.DOTALL)
+        compiler_pkg = m.group(0) if m else ''
+        return cls(cache_dir, obj_dir, src_dirs,
+                   json.dumps([compiler_pkg, scenario_vars]))
+
+    def _source_digest(self, filename):
+        """
+        Return the digest for the ``filename`` source file, or None if it is
+        not part of the generated library.
+        """
+        for d in self.src_dirs:
+            path = P.join(d, filename)
+            if P.isfile(path):
+                with open(path, 'rb') as f:
+                    return content_digest(f.read())
+        return None
+
+    def _key(self, deps):
+        """
+        Return the cache key for a unit that depends on the ``deps`` source
+        files, given the current content of these files.
+        """
+        return content_digest(json.dumps(
+            [self.salt] + [[d, self._source_digest(d)] for d in sorted(deps)]
+        ).encode('utf-8'))
+
+    def _manifest(self, ali_name):
+        """
+        Return the name of the file that lists cache entries for the unit whose
+        ALI file is ``ali_name``.
+        """
+        return P.join(self.cache_dir, ali_name + '.json')
+
+    def _load_manifest(self, ali_name):
+        try:
+            with open(self._manifest(ali_name)) as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return []
+
+    def restore(self):
+        """
+        Restore in the object directory the compilation results of all units
+        that are up-to-date in the cache.
+
+        :return: The number of units restored.
+        """
+        if not P.isdir(self.cache_dir):
+            return 0
+        os.makedirs(self.obj_dir, exist_ok=True)
+
+        ali_names = sorted({
+            P.splitext(P.basename(f))[0] + '.ali'
+            for d in self.src_dirs
+            for pattern in ('*.ads', '*.adb')
+            for f in glob.glob(P.join(d, pattern))
+        })
+
+        count = 0
+        for ali_name in ali_names:
+            for entry in self._load_manifest(ali_name):
+                key = self._key(entry['deps'])
+                if key != entry['key']:
+                    continue
+
+                base = P.splitext(ali_name)[0]
+                try:
+                    for ext in ('.ali', '.o'):
+                        dest = P.join(self.obj_dir, base + ext)
+                        shutil.copyfile(P.join(self.cache_dir, key + ext),
+                                        dest)
+                        os.utime(dest)
+                except IOError:
+                    # Another testcase may be updating this entry
+                    continue
+                count += 1
+                break
+        return count
+
+    def store(self):
+        """
+        Save in the cache the compilation results of all units in the object
+        directory.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        for ali in glob.glob(P.join(self.obj_dir, '*.ali')):
+            obj = P.splitext(ali)[0] + '.o'
+            if not P.isfile(obj):
+                continue
+
+            with open(ali) as f:
+                deps = [line.split()[1] for line in f
+                        if line.startswith('D ')]
+            key = self._key(deps)
+
+            ali_name = P.basename(ali)
+            manifest = self._load_manifest(ali_name)
+            if any(entry['key'] == key for entry in manifest):
+                continue
+
+            # Write the entry files first, so that the manifest never lists
+            # incomplete entries.
+            for filename, ext in ((obj, '.o'), (ali, '.ali')):
+                with open(filename, 'rb') as f:
+                    write_file_atomically(P.join(self.cache_dir, key + ext),
+                                          f.read())
+
+            manifest.insert(0, {'key': key, 'deps': deps})
+            write_file_atomically(
+                self._manifest(ali_name),
+                json.dumps(manifest[:max_candidates]).encode('utf-8')
+            )
@@ -10,6 +10,7 @@ from langkit.compile_context import CompileCtx, UnparseScript
 from langkit.diagnostics import DiagnosticError, Diagnostics, WarningSet
 from langkit.libmanage import ManageScript
 
+from build_cache import BuildCache
 from drivers.valgrind import valgrind_cmd
 
 
@@ -44,6 +45,10 @@ end Gen;
 
 valgrind_enabled = bool(os.environ.get('VALGRIND_ENABLED'))
 
+# If the testsuite provides one, directory for the build cache shared by all
+# testcases.
+build_cache_dir = os.environ.get('LANGKIT_BUILD_CACHE_DIR')
+
 
 # Determine where to find the root directory for Langkit sources
 langkit_root = os.environ.get('LANGKIT_ROOT_DIR')
@@ -174,7 +179,8 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
                   warning_set=default_warning_set, generate_unparser=False,
                   symbol_canonicalizer=None, mains=False,
                   show_property_logging=False, unparse_script=unparse_script,
-                  strict_sound_envs: bool = False):
+                  strict_sound_envs: bool = False,
+                  table_driven_lexer: bool = False):
     """
     Compile and emit code for `ctx` and build the generated library. Then,
     execute the provided scripts/programs, if any.
@@ -218,6 +224,8 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
     :param None|str unparse_script: Script to unparse the language spec.
 
     :param strict_sound_envs: Pass --strict-sound-envs to generation.
+
+    :param table_driven_lexer: Pass --table-driven-lexer to generation.
     """
     assert not types_from_lkt or lkt_file is not None
 
@@ -229,6 +237,25 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
         def create_context(self, args):
             return self._cached_context
 
+        def do_build(self, args):
+            if not build_cache_dir:
+                return super().do_build(args)
+
+            extensions_src_dir = P.abspath(P.join('extensions', 'src'))
+            cache = BuildCache.for_project(
+                build_cache_dir,
+                self.lib_project,
+                self.dirs.build_dir('obj', self.build_mode),
+                [self.dirs.build_dir('src')] + (
+                    [extensions_src_dir] if P.isdir(extensions_src_dir) else []
+                ),
+                self.gpr_scenario_vars(),
+            )
+            cache.restore()
+            args.gargs = (args.gargs or []) + ['-m']
+            super().do_build(args)
+            cache.store()
+
     build_mode = 'dev'
 
     def manage_run(generate_only, types_from_lkt, additional_args):
@@ -266,6 +293,8 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
             argv.append('--generate-unparser')
         if strict_sound_envs:
             argv.append('--strict-sound-envs')
+        if table_driven_lexer:
+            argv.append('--table-driven-lexer')
 
         # For testsuite performance, do not generate mains unless told
         # otherwise.
@@ -0,0 +1,27 @@
+"""
+Check that memoization strategies are rejected for unknown rules.
+"""
+
+from langkit.dsl import ASTNode, abstract
+from langkit.parsers import Grammar, MemoStrategy
+
+from utils import emit_and_print_errors
+
+
+@abstract
+class FooNode(ASTNode):
+    pass
+
+
+class ExampleNode(FooNode):
+    pass
+
+
+grammar = Grammar('main_rule')
+grammar.add_rules(
+    main_rule=ExampleNode('example')
+)
+grammar.set_memo_strategies(main_rule=MemoStrategy.dense(),
+                            mian_rule=MemoStrategy.hashed())
+emit_and_print_errors(grammar, lkt_file='foo.lkt')
+print('Done')
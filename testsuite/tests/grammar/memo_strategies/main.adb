@@ -0,0 +1,50 @@
+with Ada.Text_IO; use Ada.Text_IO;
+
+with GNATCOLL.Traces;
+
+with Libfoolang.Analysis; use Libfoolang.Analysis;
+
+--  Parse sources with all memo tables logging their usage statistics to the
+--  LIBFOOLANG.PACKRAT_STATS trace. Statistics for a parsing session are logged
+--  when the parser is reset for the next session, or when it is destroyed.
+
+procedure Main is
+
+   procedure Parse (Filename, Buffer : String);
+   --  Parse Buffer and abort if there are parsing errors
+
+   Ctx : Analysis_Context := Create_Context;
+
+   -----------
+   -- Parse --
+   -----------
+
+   procedure Parse (Filename, Buffer : String) is
+      U : constant Analysis_Unit := Ctx.Get_From_Buffer
+        (Filename => Filename, Buffer => Buffer);
+   begin
+      Put_Line ("== " & Buffer & " ==");
+      if U.Has_Diagnostics then
+         raise Program_Error;
+      end if;
+   end Parse;
+
+begin
+   GNATCOLL.Traces.Parse_Config_File;
+   Put_Line ("main.adb: Running...");
+
+   Parse ("1.txt", "a = b + f(1, g(c + 2)) + 3;");
+   Parse ("2.txt", "f(a + b, c); f();");
+   Parse ("3.txt", "a + b + c; a = b; 1;");
+
+   --  Number tables use the ring strategy: parsing numbers at offsets 1 and
+   --  17 must evict entries.
+
+   Parse ("4.txt", "1 + 2 + 3 + 4 + 5 + 6 + 7 + 8 + 9;");
+
+   --  Destroy the context (and thus its parser) to get the statistics for
+   --  the last parsing session.
+
+   Ctx := No_Analysis_Context;
+   Put_Line ("main.adb: Done.");
+end Main;
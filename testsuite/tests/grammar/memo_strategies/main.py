@@ -0,0 +1,33 @@
+import sys
+
+import libfoolang
+
+
+def dump(node, indent=''):
+    """
+    Print the kind of ``node`` and of its children, as well as the text of
+    token nodes.
+    """
+    if node.is_token_node:
+        print('{}{} {}'.format(indent, node.kind_name, node.text))
+    else:
+        print('{}{}'.format(indent, node.kind_name))
+        for child in node:
+            dump(child, indent + '  ')
+
+
+ctx = libfoolang.AnalysisContext()
+for source in [
+    b'a = b + f(1, g(c + 2)) + 3;',
+    b'f(a + b, c); f();',
+    b'a + b + c; a = b; 1;',
+]:
+    print('== {} =='.format(source.decode()))
+    u = ctx.get_from_buffer('main.txt', source)
+    for d in u.diagnostics:
+        print(d)
+    dump(u.root)
+    print('')
+
+print('main.py: Done')
+sys.stdout.flush()
@@ -0,0 +1,78 @@
+"""
+Check that parsers work with the dense and hashed memoization strategies,
+including when they backtrack, and that memo tables report their usage
+statistics (hits, misses and evictions) in the PACKRAT_STATS trace.
+"""
+
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.parsers import Grammar, List, MemoStrategy, Or
+
+from lexer_example import Token, foo_lexer
+from utils import build_and_run
+
+
+@abstract
+class FooNode(ASTNode):
+    pass
+
+
+@abstract
+class Expr(FooNode):
+    pass
+
+
+class Name(Expr):
+    token_node = True
+
+
+class Number(Expr):
+    token_node = True
+
+
+class Plus(Expr):
+    left = Field(type=Expr)
+    right = Field(type=Expr)
+
+
+class Call(Expr):
+    name = Field(type=Name)
+    args = Field(type=Expr.list)
+
+
+@abstract
+class Stmt(FooNode):
+    pass
+
+
+class Assign(Stmt):
+    name = Field(type=Name)
+    value = Field(type=Expr)
+
+
+class ExprStmt(Stmt):
+    expr = Field(type=Expr)
+
+
+# All alternatives below start with the same rules, so parsing backtracks a
+# lot and relies on memo tables to avoid parsing the same input again.
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.stmt, empty_valid=True),
+    stmt=Or(Assign(g.name, '=', g.expr, ';'),
+            ExprStmt(g.expr, ';')),
+    expr=Or(Plus(g.atom, '+', g.expr),
+            g.atom),
+    atom=Or(Call(g.name, '(', List(g.expr, sep=',', empty_valid=True), ')'),
+            g.name,
+            g.number),
+    name=Name(Token.Identifier),
+    number=Number(Token.Number),
+)
+g.set_memo_strategies(stmt=MemoStrategy.dense(),
+                      expr=MemoStrategy.hashed(),
+                      atom=MemoStrategy.dense(),
+                      name=MemoStrategy.hashed())
+
+build_and_run(g, lexer=foo_lexer, py_script='main.py', ada_main='main.adb',
+              unparse_script=None)
+print('Done')
@@ -0,0 +1,76 @@
+with Ada.Text_IO; use Ada.Text_IO;
+
+with Libfoolang.Analysis; use Libfoolang.Analysis;
+
+procedure Main is
+   Ctx : constant Analysis_Context := Create_Context;
+   U   : constant Analysis_Unit := Ctx.Get_From_Buffer
+     (Filename => "foo.txt",
+      Buffer   => "def a { def b { def c } }");
+
+   procedure Put_Stats (Label : String);
+   --  Print lookup cache counters for Ctx
+
+   procedure Lookup (N : Program);
+   --  Run a lexical environment lookup from N
+
+   ---------------
+   -- Put_Stats --
+   ---------------
+
+   procedure Put_Stats (Label : String) is
+      S : constant Lookup_Cache_Stats := Get_Lookup_Cache_Stats (Ctx);
+   begin
+      Put_Line ("== " & Label & " ==");
+      Put_Line ("hits:" & S.Hits'Image);
+      Put_Line ("misses:" & S.Misses'Image);
+      Put_Line ("evictions:" & S.Evictions'Image);
+      Put_Line ("entries:" & S.Entries'Image);
+      New_Line;
+   end Put_Stats;
+
+   ------------
+   -- Lookup --
+   ------------
+
+   procedure Lookup (N : Program) is
+      Result : constant Foo_Node_Array := N.P_Lookup;
+   begin
+      Put_Line ("lookup:" & Integer'Image (Result'Length) & " result(s)");
+   end Lookup;
+
+   C : Program;
+begin
+   if U.Has_Diagnostics then
+      raise Program_Error;
+   end if;
+   U.Populate_Lexical_Env;
+
+   C := U.Root.As_Program.F_Program_List.Child (1).As_Program
+        .F_Program_List.Child (1).As_Program;
+   Put_Stats ("Initial state");
+
+   Lookup (C);
+   Put_Stats ("After first lookup");
+
+   Lookup (C);
+   Put_Stats ("After second lookup");
+
+   Set_Lookup_Cache_Budget (Ctx, 1);
+   Put_Stats ("After setting a tiny budget");
+
+   --  Entry sizes depend on the target, so dump occupancy only once all
+   --  entries are evicted.
+
+   Dump_Lookup_Cache_Occupancy (Ctx);
+   New_Line;
+
+   Lookup (C);
+   Put_Stats ("After lookup with a tiny budget");
+
+   Set_Lookup_Cache_Budget (Ctx, 0);
+   Lookup (C);
+   Put_Stats ("After lookup with no budget");
+
+   Put_Line ("main.adb: Done.");
+end Main;
@@ -0,0 +1,35 @@
+"""
+Test the memory budget and the counters for lexical environment lookup
+caches.
+"""
+
+from langkit.dsl import ASTNode, Field, T
+from langkit.envs import EnvSpec, add_env, add_to_env_kv
+from langkit.expressions import Self, langkit_property
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Id(FooNode):
+    token_node = True
+
+
+class Program(FooNode):
+    name = Field(type=T.Id)
+    program_list = Field(T.Program.list)
+    env_spec = EnvSpec(
+        add_to_env_kv(Self.name.symbol, Self),
+        add_env()
+    )
+
+    @langkit_property(return_type=T.FooNode.entity.array, public=True)
+    def lookup():
+        return Self.children_env.get(Self.name.symbol)
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', ada_main='main.adb')
+print('Done')
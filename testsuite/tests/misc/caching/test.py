@@ -0,0 +1,92 @@
+"""
+Check that the emitter cache tracks written files: reruns that produce the
+same content leave files untouched, while hand-edited outputs and changed
+inputs are detected.
+"""
+
+import os
+import os.path as P
+
+from langkit.caching import Cache, write_file_atomically
+
+
+cache_dir = P.abspath('cache')
+output = P.abspath('output.txt')
+
+
+def mtime():
+    return os.stat(output).st_mtime_ns
+
+
+def check(label, cache, inputs):
+    print('{}: up-to-date for {}: {}'.format(
+        label, inputs, cache.is_up_to_date(output, inputs)
+    ))
+
+
+def write(label, cache, content, inputs):
+    before = mtime() if P.exists(output) else None
+    written = cache.write_file(output, content, inputs)
+    with open(output, 'rb') as f:
+        assert f.read() == content
+    print('{}: written: {}, mtime preserved: {}'.format(
+        label, written, mtime() == before
+    ))
+    cache.save()
+
+
+# First run: the output does not exist yet
+cache = Cache(cache_dir)
+check('First run', cache, 'inputs-1')
+write('First run', cache, b'content 1\n', 'inputs-1')
+
+# Pretend that the file was written long ago, so that the next writes, if
+# any, are guaranteed to change its modification time.
+os.utime(output, ns=(10 ** 18, 10 ** 18))
+cache.accept_changes(output)
+cache.save()
+
+# Rerun with the same inputs: there is nothing to do
+cache = Cache(cache_dir)
+check('No-op rerun', cache, 'inputs-1')
+write('No-op rerun', cache, b'content 1\n', 'inputs-1')
+
+# Edit the output by hand: the cache must not trust its entry anymore, and
+# rewriting the file must restore its content.
+with open(output, 'wb') as f:
+    f.write(b'hand-edited\n')
+cache = Cache(cache_dir)
+check('Hand-edited output', cache, 'inputs-1')
+write('Hand-edited output', cache, b'content 1\n', 'inputs-1')
+
+# Change the inputs: the output must be produced again, but if it yields the
+# same content, the file must be left untouched.
+os.utime(output, ns=(10 ** 18, 10 ** 18))
+cache.accept_changes(output)
+cache.save()
+cache = Cache(cache_dir)
+check('Changed inputs', cache, 'inputs-2')
+write('Changed inputs', cache, b'content 1\n', 'inputs-2')
+check('Changed inputs', cache, 'inputs-2')
+
+# Changed inputs that yield a new content
+cache = Cache(cache_dir)
+check('New content', cache, 'inputs-3')
+write('New content', cache, b'content 2\n', 'inputs-3')
+
+# Content digests must follow file changes
+cache = Cache(cache_dir)
+digest = cache.files_digest([output])
+with open(output, 'wb') as f:
+    f.write(b'content 3, with a different size\n')
+print('Digest updated: {}'.format(digest != cache.files_digest([output])))
+
+# Atomic writes must leave no temporary file behind
+write_file_atomically(output, b'atomic\n')
+with open(output, 'rb') as f:
+    print('Atomic write: {!r}'.format(f.read()))
+print('Temporary files: {}'.format(
+    sorted(f for f in os.listdir('.') if f.endswith('.tmp'))
+))
+
+print('Done')
@@ -39,6 +39,22 @@ for c in ('i', 'j', 'k'):
     check_ranges('Overlappingranges (2)', CharSet(('i', 'o'), (c, 'p')))
 
 check_ranges('Negation', CharSet(('\x00', '\x10'), ('b', 'y')).negation)
+check_ranges('Double negation',
+             CharSet(('\x00', '\x10'), ('b', 'y')).negation.negation)
+
+set_1 = CharSet(('a', 'f'), ('m', 'p'), 'x')
+set_2 = CharSet(('d', 'n'), ('q', 'x'))
+check_ranges('Union', set_1 | set_2)
+check_ranges('Intersection', set_1 & set_2)
+check_ranges('Difference', set_1 - set_2)
+check_ranges('Empty intersection', CharSet('a') & CharSet('b'))
+
+for label, cs in [('Split ASCII (1)', CharSet(('a', 'z'), ('\x7f', '\x90'))),
+                  ('Split ASCII (2)', CharSet(('a', '\x7f'), '\x80')),
+                  ('Split ASCII (3)', CharSet('a', ('\x80', '\x90')))]:
+    ascii, non_ascii = cs.split_ascii_subsets
+    check_ranges('{} - ASCII'.format(label), ascii)
+    check_ranges('{} - non-ASCII'.format(label), non_ascii)
 
 
 print('Done')
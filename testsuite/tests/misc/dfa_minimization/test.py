@@ -0,0 +1,58 @@
+"""
+Check that lexer DFA minimization merges equivalent states and preserves the
+set of accepted inputs.
+"""
+
+from langkit.lexer.regexp import NFAState, RegexpCollection
+
+
+def get_action(state):
+    labels = sorted(state.labels)
+    return labels[0][1] if labels else None
+
+
+def run(dfa, text):
+    """
+    Run ``dfa`` on ``text`` and return the list of actions for the states it
+    goes through.
+    """
+    result = [get_action(dfa)]
+    state = dfa
+    for char in text:
+        for char_set, next_state in state.transitions:
+            if char in char_set:
+                state = next_state
+                break
+        else:
+            break
+        result.append(get_action(state))
+    return result
+
+
+for label, rules, inputs in [
+    ('Keywords', [('if', 'If'), ('in', 'In'), ('is', 'Is'),
+                  ('[a-z]+', 'Id')],
+     ['i', 'if', 'ifx', 'in', 'is', 'ix', 'x']),
+    ('Same action', [('ab', 'T'), ('cb', 'T')],
+     ['ab', 'cb', 'ac', 'b']),
+    ('Unicode', [('\\p{Lu}\\p{Ll}*', 'Cap'), ('\\p{Ll}+', 'Low')],
+     ['Ab', 'ab', '\u00c9t\u00e9', '\u00e9t\u00e9', 'A1']),
+]:
+    print('== {} =='.format(label))
+
+    regexps = RegexpCollection()
+    nfa = NFAState()
+    for i, (regexp, action) in enumerate(rules):
+        start, end = regexps.nfa_for(regexp)
+        end.label = (i, action)
+        nfa.add_transition(None, start)
+
+    dfa = nfa.to_dfa()
+    min_dfa = dfa.minimize(get_action)
+    print('{} states -> {} states'.format(len(dfa.reachable_states),
+                                          len(min_dfa.reachable_states)))
+    for text in inputs:
+        assert run(dfa, text) == run(min_dfa, text), text
+    print('')
+
+print('Done')
@@ -0,0 +1,69 @@
+"""
+Check that documentation templates are compiled lazily, that compiled
+templates are cached on disk, that unused cache directories are evicted and
+that invalid templates are reported even when they are not used.
+"""
+
+import os
+import os.path as P
+
+from langkit.documentation import instantiate_templates
+
+
+entries = {
+    'foo': 'Foo for ${lang}',
+    'bar': 'Bar for ${lang}',
+    'broken': 'Broken <%def name="foo()">',
+}
+cache_dir = P.abspath('cache')
+templates_dir = None
+
+
+def cached_files():
+    return (sorted(os.listdir(templates_dir))
+            if templates_dir and P.isdir(templates_dir) else [])
+
+
+os.environ['LANGKIT_CACHE_DIR'] = cache_dir
+
+# Creating the database must not compile anything, even invalid templates
+db = instantiate_templates(entries)
+templates_dir = db.cache_dir
+print('Cached templates after creation: {}'.format(len(cached_files())))
+
+print(db['foo'].render(lang='ada'))
+print('Cached templates after use: {}'.format(len(cached_files())))
+
+# Another database must reuse the compiled template from the first one
+mtimes = {f: os.stat(P.join(templates_dir, f)).st_mtime_ns
+          for f in cached_files()}
+db = instantiate_templates(entries)
+print(db['foo'].render(lang='python'))
+print('Cached templates reused: {}'.format(
+    {f: os.stat(P.join(templates_dir, f)).st_mtime_ns
+     for f in cached_files()} == mtimes
+))
+
+# Unused entries must still be checked when reporting unused entries
+db.report_unused()
+
+# An empty LANGKIT_CACHE_DIR disables the cache
+os.environ['LANGKIT_CACHE_DIR'] = ''
+db = instantiate_templates({'baz': 'Baz for ${lang}'})
+print('Cache directory: {}'.format(db.cache_dir))
+print(db['baz'].render(lang='c'))
+print('Cached templates: {}'.format(len(cached_files())))
+
+# Databases with other entries must use another cache directory, and
+# directories that were not used for a long time must be removed.
+os.environ['LANGKIT_CACHE_DIR'] = cache_dir
+other_db = instantiate_templates({'foo': 'Other foo for ${lang}'})
+print('Same cache directory for other entries: {}'.format(
+    other_db.cache_dir == templates_dir
+))
+os.utime(templates_dir, (0, 0))
+instantiate_templates({'foo': 'Another foo for ${lang}'})
+print('Unused directory kept: {}'.format(P.isdir(templates_dir)))
+print('Used directory kept: {}'.format(P.isdir(other_db.cache_dir)))
+
+print('Done')
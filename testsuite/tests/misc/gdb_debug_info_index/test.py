@@ -0,0 +1,80 @@
+"""
+Check that debug info index files for GDB helpers round-trip the directives
+found in the source file, that they are ignored when stale and that they are
+not written for sources with malformed directives.
+"""
+
+import os.path as P
+
+from langkit.gdb.debug_info import (
+    index_filename, load_index, scan_directives, write_index
+)
+
+
+source = P.abspath('foo-implementation.adb')
+index = index_filename(source)
+
+
+def write_source(lines):
+    with open(source, 'w') as f:
+        for line in lines:
+            f.write(line + '\n')
+
+
+def scan():
+    with open(source) as f:
+        return list(scan_directives(f))
+
+
+def check(label):
+    directives = load_index(source)
+    print('{}: index file: {}, index loaded: {}'.format(
+        label, P.exists(index), directives is not None
+    ))
+    if directives is not None:
+        print('  same as scanned directives: {}'.format(directives == scan()))
+        for d in directives:
+            print('  {}'.format(d))
+
+
+write_source([
+    'package body Foo is',
+    '   --# property-start Foo.bar foo.py:10',
+    '   function Bar return Boolean is',
+    '   begin',
+    '      --# bind "x y" X',
+    '      return True;',
+    '   end Bar;',
+    '   --# property-end',
+    'end Foo;',
+])
+check('No index yet')
+
+write_index(source)
+check('Index written')
+
+# Changing the source file makes the existing index stale, and writing it
+# again brings it up to date.
+write_source([
+    'package body Foo is',
+    '   --  Line added by a pretty-printer',
+    '   --# property-start Foo.bar foo.py:10',
+    '   --# property-end',
+    'end Foo;',
+])
+check('Source changed')
+
+write_index(source)
+check('Index rewritten')
+
+# Malformed directives: the stale index is removed and no new index is
+# written, so that GDB helpers get to report the error.
+write_source([
+    'package body Foo is',
+    '   --#',
+    'end Foo;',
+])
+write_index(source)
+check('Malformed directive')
+
+print('Done')
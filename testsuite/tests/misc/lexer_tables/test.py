@@ -0,0 +1,90 @@
+"""
+Check that transition tables for the table-driven lexer backend implement the
+same automaton as the DFA they are computed from.
+"""
+
+from langkit.lexer.regexp import DFACodeGenHolder, NFAState, RegexpCollection
+
+
+def get_action(labels):
+    labels = sorted(labels)
+    return labels[0][1] if labels else None
+
+
+def run_dfa(dfa, text):
+    """
+    Run ``dfa`` on ``text`` and return the list of actions for the states it
+    goes through.
+    """
+    result = [get_action(dfa.labels)]
+    state = dfa
+    for char in text:
+        for char_set, next_state in state.transitions:
+            if char in char_set:
+                state = next_state
+                break
+        else:
+            break
+        result.append(get_action(state.labels))
+    return result
+
+
+def run_tables(tables, text):
+    """
+    Likewise, but using transition tables, mimicking the generated code.
+    """
+    def action(state):
+        index = tables.state_actions[state - 1]
+        return tables.actions[index - 1] if index else None
+
+    state = 1
+    result = [action(state)]
+    for char in text:
+        char = ord(char)
+        cls = 0
+        if char < 128:
+            cls = tables.ascii_classes[char]
+        else:
+            for low, high, c in tables.non_ascii_classes:
+                if low <= char <= high:
+                    cls = c
+        if cls == 0:
+            break
+        offset = tables.bases[state - 1] + cls
+        if tables.checks[offset] != state:
+            break
+        state = tables.targets[offset]
+        result.append(action(state))
+    return result
+
+
+for label, rules, inputs in [
+    ('Keywords', [('if', 'If'), ('in', 'In'), ('is', 'Is'),
+                  ('[a-z]+', 'Id'), ('[0-9]+', 'Num')],
+     ['i', 'if', 'ifx', 'in', 'is', 'ix', 'x', '12', '1a', '!']),
+    ('Unicode', [('\\p{Lu}\\p{Ll}*', 'Cap'), ('\\p{Ll}+', 'Low'),
+                 ('[^a-z]', 'Other')],
+     ['Ab', 'ab', '\u00c9t\u00e9', '\u00e9t\u00e9', 'A1', ' ']),
+]:
+    print('== {} =='.format(label))
+
+    regexps = RegexpCollection()
+    nfa = NFAState()
+    for i, (regexp, action) in enumerate(rules):
+        start, end = regexps.nfa_for(regexp)
+        end.label = (i, action)
+        nfa.add_transition(None, start)
+
+    dfa = nfa.to_dfa()
+    tables = DFACodeGenHolder(dfa, get_action, table_driven=True).tables
+    print('{} classes, {} actions, {} states, {} table entries'.format(
+        tables.classes_count, len(tables.actions), len(tables.bases),
+        len(tables.targets)
+    ))
+    for text in inputs:
+        result = run_tables(tables, text)
+        assert run_dfa(dfa, text) == result, text
+        print('{}: {}'.format(ascii(text), result[-1]))
+    print('')
+
+print('Done')
@@ -0,0 +1,40 @@
+"""
+Generate a small library in the "build" directory, using the number of jobs
+given in argument to render sources.
+"""
+
+import sys
+
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.expressions import Self, langkit_property
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token, foo_lexer
+from utils import prepare_context
+
+
+@abstract
+class FooNode(ASTNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Example(FooNode):
+    name = Field(type=Name)
+
+    @langkit_property(public=True)
+    def first_name():
+        return Self.name
+
+
+grammar = Grammar('main_rule')
+grammar.add_rules(
+    main_rule=List(Example('example', Name(Token.Identifier))),
+)
+
+ctx = prepare_context(grammar, foo_lexer)
+ctx.create_all_passes('build', jobs=int(sys.argv[1]), render_cache=False)
+ctx.emit()
@@ -0,0 +1,41 @@
+"""
+Check that rendering sources concurrently (jobs > 1) generates exactly the same
+library as sequential rendering.
+"""
+
+import os
+import os.path as P
+import shutil
+import subprocess
+import sys
+
+
+def generate(jobs):
+    """
+    Generate the library in the "build" directory using ``jobs`` processes to
+    render sources and return the set of generated files, excluding the
+    emitter cache, which records file timestamps.
+    """
+    subprocess.check_call([sys.executable, 'gen.py', str(jobs)])
+    result = set()
+    for root, dirnames, filenames in os.walk('build'):
+        dirnames[:] = [d for d in dirnames if d != 'langkit_cache']
+        result.update(P.relpath(P.join(root, f), 'build') for f in filenames)
+    return result
+
+
+def read(filename):
+    with open(filename, 'rb') as f:
+        return f.read()
+
+
+sequential_files = generate(jobs=1)
+shutil.move('build', 'build-sequential')
+parallel_files = generate(jobs=4)
+
+print('Same files: {}'.format(sequential_files == parallel_files))
+for f in sorted(sequential_files & parallel_files):
+    if read(P.join('build-sequential', f)) != read(P.join('build', f)):
+        print('Different content: {}'.format(f))
+
+print('Done')
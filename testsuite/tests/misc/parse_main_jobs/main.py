@@ -0,0 +1,60 @@
+import itertools
+import subprocess
+
+
+sources = {
+    'a.txt': 'example a\n',
+    'b.txt': 'example b example c\n',
+    'c.txt': 'example d\nexample e\nexample f\n',
+    'error.txt': 'example 1\n',
+}
+filenames = sorted(sources)
+for filename, content in sources.items():
+    with open(filename, 'w') as f:
+        f.write(content)
+
+with open('files.txt', 'w') as f:
+    for filename in filenames:
+        f.write(filename + '\n')
+
+
+def parse(*args):
+    p = subprocess.run(['foo_parse'] + list(args), stdout=subprocess.PIPE,
+                       stderr=subprocess.STDOUT, check=False,
+                       universal_newlines=True)
+    return p.returncode, p.stdout
+
+
+# Reference outputs: parse each file alone, sequentially
+outputs = {}
+for filename in filenames:
+    status, outputs[filename] = parse('-f', filename)
+    print('{}: exit status: {}, has output: {}'.format(
+        filename, status, bool(outputs[filename])
+    ))
+print('Diagnostic for error.txt mentions it: {}'.format(
+    'error.txt:1:' in outputs['error.txt']
+))
+
+
+def check(label, *args):
+    """
+    Run the parse main with the given arguments, which must process all files,
+    and check that its output is the concatenation of the reference outputs
+    for all files, in any order: jobs print results for each file atomically,
+    but not in a predictable order.
+    """
+    status, output = parse(*args)
+    expected = {''.join(outputs[f] for f in order)
+                for order in itertools.permutations(filenames)}
+    print('{}: exit status: {}, same results: {}'.format(
+        label, status, output in expected
+    ))
+
+
+check('-j1 -F', '-j1', '-F', 'files.txt')
+check('-j2 -F', '-j2', '-F', 'files.txt')
+check('-j2 -f', '-j2', *itertools.chain.from_iterable(
+    ('-f', f) for f in filenames
+))
+check('-j8 -F', '-j8', '-F', 'files.txt')
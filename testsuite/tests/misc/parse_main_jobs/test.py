@@ -0,0 +1,32 @@
+"""
+Check that the "parse" main program gives the same results when parsing files
+concurrently (-j2) as when parsing them one at a time.
+"""
+
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token, foo_lexer
+from utils import build_and_run
+
+
+@abstract
+class FooNode(ASTNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Example(FooNode):
+    name = Field(type=Name)
+
+
+grammar = Grammar('main_rule')
+grammar.add_rules(
+    main_rule=List(Example('example', Name(Token.Identifier))),
+)
+build_and_run(grammar, lexer=foo_lexer, py_script='main.py', mains=True,
+              unparse_script=None)
+print('Done')
@@ -0,0 +1,58 @@
+"""
+Check that PerfectHash computes minimal perfect hash functions, both for
+random strings and for real sets of symbols.
+"""
+
+import keyword
+import random
+
+from langkit.perfect_hash import PerfectHash
+
+
+ada_keywords = [
+    'abort', 'abs', 'abstract', 'accept', 'access', 'aliased', 'all', 'and',
+    'array', 'at', 'begin', 'body', 'case', 'constant', 'declare', 'delay',
+    'delta', 'digits', 'do', 'else', 'elsif', 'end', 'entry', 'exception',
+    'exit', 'for', 'function', 'generic', 'goto', 'if', 'in', 'interface',
+    'is', 'limited', 'loop', 'mod', 'new', 'not', 'null', 'of', 'or',
+    'others', 'out', 'overriding', 'package', 'pragma', 'private',
+    'procedure', 'protected', 'raise', 'range', 'record', 'rem', 'renames',
+    'requeue', 'return', 'reverse', 'select', 'separate', 'some', 'subtype',
+    'synchronized', 'tagged', 'task', 'terminate', 'then', 'type', 'until',
+    'use', 'when', 'while', 'with', 'xor',
+]
+
+
+def random_keys(rng, count):
+    alphabet = 'abcdefghijklmnopqrstuvwxyz_\u00e9\u03bb\u4e2d'
+    result = set()
+    while len(result) < count:
+        result.add(''.join(rng.choice(alphabet)
+                           for _ in range(rng.randint(1, 12))))
+    return sorted(result)
+
+
+def check(label, keys):
+    ph = PerfectHash(keys)
+    n = len(keys)
+    assert sorted(ph.slots) == list(range(n)), label
+    assert len(ph.displacements) == n, label
+    for i, key in enumerate(keys):
+        assert ph.lookup(key) == i, (label, key)
+    print('{}: OK'.format(label))
+
+
+rng = random.Random(1)
+check('Ada keywords', ada_keywords)
+check('Python keywords', sorted(keyword.kwlist))
+check('Single key', ['foo'])
+check('Two keys', ['foo', 'bar'])
+for count in (10, 100, 1000, 5000):
+    check('{} random keys'.format(count), random_keys(rng, count))
+
+# Strings that are not keys must map to some key, which callers then compare
+ph = PerfectHash(ada_keywords)
+for text in ('', 'Begin', 'begin_', 'not_a_keyword'):
+    assert 0 <= ph.lookup(text) < len(ada_keywords)
+
+print('Done')
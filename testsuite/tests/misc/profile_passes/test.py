@@ -0,0 +1,82 @@
+"""
+Check that generating a library with passes profiling enabled writes a JSON
+profile that lists the passes that were run, with per-item profiles for the
+passes that process nodes and properties.
+"""
+
+import contextlib
+import io
+import json
+import os.path as P
+
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.expressions import Self, langkit_property
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token, foo_lexer
+from utils import prepare_context
+
+
+@abstract
+class FooNode(ASTNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Example(FooNode):
+    name = Field(type=Name)
+
+    @langkit_property(public=True)
+    def first_name():
+        return Self.name
+
+
+grammar = Grammar('main_rule')
+grammar.add_rules(
+    main_rule=List(Example('example', Name(Token.Identifier))),
+)
+
+profile_file = P.join('build', 'passes_profile.json')
+ctx = prepare_context(grammar, foo_lexer)
+ctx.create_all_passes('build', profile_passes=profile_file)
+
+# The report table contains timings, which are not stable: just check that it
+# was printed.
+report = io.StringIO()
+with contextlib.redirect_stdout(report):
+    ctx.emit()
+print('Report printed: {}'.format(
+    'Passes profile written to {}'.format(profile_file) in report.getvalue()
+))
+
+print('Profile written: {}'.format(P.exists(profile_file)))
+with open(profile_file) as f:
+    profiles = json.load(f)
+names = [p['name'] for p in profiles]
+
+print('Valid measures: {}'.format(all(
+    p['wall_time'] >= 0 and p['cpu_time'] >= 0 for p in profiles
+)))
+
+# Passes are listed in execution order
+expected = ['compute types', 'construct and type expressions',
+            'compile parsers', 'emit Ada sources', 'emit Python API']
+print('Expected passes in order: {}'.format(
+    [n for n in names if n in expected] == expected
+))
+
+# Passes that process nodes and properties one by one have item profiles
+for pass_name, item_name in [
+    ('validate AST node fields', 'Example'),
+    ('construct and type expressions', 'Example.first_name'),
+]:
+    items = [i['name']
+             for p in profiles if p['name'] == pass_name
+             for i in p.get('items', [])]
+    print('{}: has item {}: {}'.format(pass_name, item_name,
+                                       item_name in items))
+
+print('Done')
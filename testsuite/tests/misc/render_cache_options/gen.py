@@ -0,0 +1,47 @@
+"""
+Generate a small library in the "build" directory, with the emitter cache
+enabled and with the code generation options in the "options.json" file.
+"""
+
+import json
+from langkit.compile_context import CompileCtx
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.expressions import Self, langkit_property
+from langkit.parsers import Grammar, List
+
+from lexer_example import Token, foo_lexer
+from utils import default_warning_set
+
+
+@abstract
+class FooNode(ASTNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Example(FooNode):
+    name = Field(type=Name)
+
+    @langkit_property(public=True)
+    def first_name():
+        return Self.name
+
+
+grammar = Grammar('main_rule')
+grammar.add_rules(
+    main_rule=List(Example('example', Name(Token.Identifier))),
+)
+
+with open('options.json') as f:
+    options = json.load(f)
+
+# Do not use utils.prepare_context, as it removes the "build" directory, and
+# thus the emitter cache.
+ctx = CompileCtx(lang_name='Foo', short_name='Foo', lexer=foo_lexer,
+                 grammar=grammar)
+ctx.warnings = default_warning_set
+ctx.create_all_passes('build', **options)
+ctx.emit()
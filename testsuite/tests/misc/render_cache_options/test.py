@@ -0,0 +1,55 @@
+"""
+Check that the emitter cache does not consider generated sources up-to-date
+when code generation options change, even though the program generating them
+runs with the same command-line arguments.
+"""
+
+import json
+import os
+import os.path as P
+import subprocess
+import sys
+
+
+gen_py = P.abspath('gen.py')
+
+
+def generate(options, dirname='.'):
+    """
+    Generate the library in the "build" subdirectory of ``dirname`` with the
+    given options. Each generation runs with the same command-line arguments.
+    """
+    os.makedirs(dirname, exist_ok=True)
+    with open(P.join(dirname, 'options.json'), 'w') as f:
+        json.dump(options, f)
+    subprocess.check_call([sys.executable, gen_py], cwd=dirname)
+
+
+def read_sources(dirname):
+    result = {}
+    src_dir = P.join(dirname, 'build', 'src')
+    for f in os.listdir(src_dir):
+        with open(P.join(src_dir, f), 'rb') as f_obj:
+            result[f] = f_obj.read()
+    return result
+
+
+generate({'no_property_checks': False})
+first_sources = read_sources('.')
+
+generate({'no_property_checks': False})
+print('Same options: same sources: {}'.format(
+    read_sources('.') == first_sources
+))
+
+# Different options: the sources must be the same as for a fresh generation
+# with these options, not the ones left by the previous run.
+generate({'no_property_checks': True})
+generate({'no_property_checks': True}, 'fresh')
+sources = read_sources('.')
+print('Other options: sources changed: {}'.format(sources != first_sources))
+print('Other options: same sources as a fresh generation: {}'.format(
+    sources == read_sources('fresh')
+))
+
+print('Done')
@@ -0,0 +1,59 @@
+with Ada.Text_IO; use Ada.Text_IO;
+
+with Libfoolang.Analysis;      use Libfoolang.Analysis;
+with Libfoolang.Common;        use Libfoolang.Common;
+with Libfoolang.Introspection; use Libfoolang.Introspection;
+with Libfoolang.Rewriting;     use Libfoolang.Rewriting;
+
+with Process_Apply;
+
+procedure Apply_Untouched is
+
+   procedure Check (Label : String; Node : Foo_Node);
+   --  Print whether Node is still a valid reference
+
+   -----------
+   -- Check --
+   -----------
+
+   procedure Check (Label : String; Node : Foo_Node) is
+   begin
+      Put_Line (Label & ": " & Node.Image);
+   exception
+      when Stale_Reference_Error =>
+         Put_Line (Label & ": <stale reference>");
+   end Check;
+
+   Ctx    : constant Analysis_Context := Create_Context;
+   Unit_A : constant Analysis_Unit :=
+      Get_From_Buffer (Ctx, "a.txt", Buffer => "def a = 1" & ASCII.LF);
+   Unit_B : constant Analysis_Unit :=
+      Get_From_Buffer (Ctx, "b.txt", Buffer => "def b = 2" & ASCII.LF);
+   Unit_C : constant Analysis_Unit :=
+      Get_From_Buffer (Ctx, "c.txt", Buffer => "def c = 3" & ASCII.LF);
+
+   Root_A : constant Foo_Node := Root (Unit_A);
+   Root_B : constant Foo_Node := Root (Unit_B);
+   Root_C : constant Foo_Node := Root (Unit_C);
+
+   RH : Rewriting_Handle := Start_Rewriting (Ctx);
+   DA : constant Node_Rewriting_Handle := Handle (Root_A.Child (1));
+   DB : constant Node_Rewriting_Handle := Handle (Root_B.Child (1));
+begin
+   --  Modify unit A, and only inspect unit B: only unit A must be reparsed
+
+   Set_Child (DA, Index (Kind (DA), Def_F_Expr),
+              Create_Token_Node (RH, Foo_Literal, "11"));
+   Put_Line ("Unparsed B: " & Image (Unparse (DB)));
+
+   Put_Line ("Applying the diff...");
+   Process_Apply (RH);
+
+   Check ("Old root A", Root_A);
+   Check ("Old root B", Root_B);
+   Check ("Old root C", Root_C);
+   Check ("New root A", Root (Unit_A));
+   Put_Line ("a.txt: " & Image (Root (Unit_A).Text));
+
+   Put_Line ("apply_untouched.adb: Done.");
+end Apply_Untouched;
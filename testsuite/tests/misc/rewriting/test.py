@@ -54,7 +54,8 @@ build_and_run(lkt_file='expected_concrete_syntax.lkt',
                         'templates.adb',
                         'preserve_formatting.adb',
                         'preserve_formatting_wrap.adb',
-                        'clone_synthetic.adb'],
+                        'clone_synthetic.adb',
+                        'apply_untouched.adb'],
               generate_unparser=True,
               types_from_lkt=True)
 print('Done')
@@ -0,0 +1,130 @@
+"""
+Regression guard for the performance of the NFA to DFA subset construction on
+a Unicode-heavy set of lexing rules: check that it completes within a generous
+time limit. Also check that the resulting DFA accepts the same inputs as the
+NFA it comes from.
+
+Run this script manually with --debug to use it as a benchmark: it then prints
+the time it took to compute the DFA (best of --repeat runs).
+"""
+
+import argparse
+import time
+
+from langkit.lexer.regexp import NFAState, RegexpCollection
+
+
+# Generous upper bound for the conversion time, in seconds: the point is to
+# catch pathological regressions, not to measure small variations.
+TIME_LIMIT = 30
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument(
+    '--debug', action='store_true',
+    help='Print the time it takes to run the subset construction.'
+)
+parser.add_argument(
+    '--repeat', type=int, default=1,
+    help='Number of times to run the subset construction. Only the best time'
+         ' is reported.'
+)
+args = parser.parse_args()
+
+
+def get_action(labels):
+    labels = sorted(labels)
+    return labels[0][1] if labels else None
+
+
+def run_nfa(nfa, text):
+    """
+    Run ``nfa`` on ``text`` and return the list of actions for the sets of
+    states it goes through.
+    """
+    states = NFAState.follow_spontaneous_transitions([nfa])
+    result = []
+    for char in text:
+        result.append(get_action({s.label for s in states
+                                  if s.label is not None}))
+        states = NFAState.follow_spontaneous_transitions(
+            [next_state
+             for s in states
+             for chars, next_state in s.transitions
+             if chars is not None and char in chars]
+        )
+        if not states:
+            return result
+    result.append(get_action({s.label for s in states
+                              if s.label is not None}))
+    return result
+
+
+def run_dfa(dfa, text):
+    """
+    Likewise, for ``dfa``.
+    """
+    result = [get_action(dfa.labels)]
+    state = dfa
+    for char in text:
+        for char_set, next_state in state.transitions:
+            if char in char_set:
+                state = next_state
+                break
+        else:
+            break
+        result.append(get_action(state.labels))
+    return result
+
+
+keywords = ['abort', 'abs', 'abstract', 'accept', 'access', 'aliased', 'all',
+            'and', 'array', 'at', 'begin', 'body', 'case', 'constant',
+            'declare', 'delay', 'delta', 'digits', 'do', 'else', 'elsif',
+            'end', 'entry', 'exception', 'exit', 'for', 'function', 'generic',
+            'goto', 'if', 'in', 'interface', 'is', 'limited', 'loop', 'mod',
+            'new', 'not', 'null', 'of', 'or', 'others', 'out', 'overriding',
+            'package', 'pragma', 'private', 'procedure', 'protected', 'raise',
+            'range', 'record', 'rem', 'renames', 'requeue', 'return',
+            'reverse', 'select', 'separate', 'some', 'subtype',
+            'synchronized', 'tagged', 'task', 'terminate', 'then', 'type',
+            'until', 'use', 'when', 'while', 'with', 'xor']
+
+rules = [(kw, kw.capitalize()) for kw in keywords] + [
+    ('(\\p{L}|\\p{Nl})(\\p{L}|\\p{Nl}|\\p{Mn}|\\p{Mc}|\\p{Nd}|\\p{Pc})*',
+     'Identifier'),
+    ('\\p{Nd}+(\\.\\p{Nd}+)?', 'Number'),
+    ('"(\\p{L}|\\p{N}|\\p{P}|\\p{S}|\\p{Zs})*"', 'String'),
+    ('(\\p{Zs}|\\p{Zl}|\\p{Zp})+', 'Whitespace'),
+    ('--(\\p{L}|\\p{N}|\\p{P}|\\p{S}|\\p{Zs}|\\p{M})*', 'Comment'),
+]
+
+regexps = RegexpCollection()
+nfa = NFAState()
+for i, (regexp, action) in enumerate(rules):
+    start, end = regexps.nfa_for(regexp)
+    end.label = (i, action)
+    nfa.add_transition(None, start)
+
+times = []
+for _ in range(max(args.repeat, 1)):
+    start_time = time.perf_counter()
+    dfa = nfa.to_dfa()
+    times.append(time.perf_counter() - start_time)
+elapsed = min(times)
+if args.debug:
+    print('Subset construction: {:.3f}s (best of {} runs)'
+          .format(elapsed, len(times)))
+if elapsed > TIME_LIMIT:
+    print('Subset construction took {:.2f}s (limit: {}s)'
+          .format(elapsed, TIME_LIMIT))
+
+print('{} DFA states'.format(len(dfa.reachable_states)))
+
+for text in keywords + [
+    'abortion', 'if_then', 'x', '\u00e9t\u00e9', '\u0391\u03b2\u03b3',
+    '\u2160\u2161', 'a\u0301b', '12', '12.34', '12.', '\u0661\u0662',
+    '"hello world"', '"\u00e9\u20ac"', '"unterminated', ' \u00a0\u2028',
+    '-- comment \u00e9', '-x', '!',
+]:
+    assert run_nfa(nfa, text) == run_dfa(dfa, text), text
+
+print('Done')
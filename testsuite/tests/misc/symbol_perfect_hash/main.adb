@@ -0,0 +1,72 @@
+with Ada.Text_IO; use Ada.Text_IO;
+with Interfaces;  use Interfaces;
+
+with Langkit_Support.Symbols; use Langkit_Support.Symbols;
+with Langkit_Support.Text;    use Langkit_Support.Text;
+
+with Libfoolang.Common; use Libfoolang.Common;
+
+procedure Main is
+   use Libfoolang.Common.Precomputed_Symbols;
+
+   PST : constant Precomputed_Symbol_Table := Create_Symbol_Table;
+   ST  : Symbol_Table := Symbol_Table (PST);
+
+   procedure Put_Hash (T : Text_Type; Seed : Unsigned_32);
+   --  Print the hash of T with Seed. This must be the same as what the
+   --  langkit.perfect_hash Python module computes.
+
+   --------------
+   -- Put_Hash --
+   --------------
+
+   procedure Put_Hash (T : Text_Type; Seed : Unsigned_32) is
+   begin
+      Put_Line
+        ("Perfect_Hash (" & Image (T, With_Quotes => True) & ","
+         & Unsigned_32'Image (Seed) & ") ="
+         & Unsigned_32'Image (Perfect_Hash (T, Seed)));
+   end Put_Hash;
+
+begin
+   Put_Hash ("", 0);
+   Put_Hash ("begin", 0);
+   Put_Hash ("begin", 42);
+   Put_Hash ((1 => Wide_Wide_Character'Val (16#E9#)), 7);
+   New_Line;
+
+   --  All precomputed symbols must be found through the generated perfect
+   --  hash function, and looking them up in a symbol table must return the
+   --  precomputed symbols.
+
+   for I in Precomputed_Symbol_Index loop
+      declare
+         T : constant Text_Type := Precomputed_Symbol (I);
+         S : constant Symbol_Type := Find (ST, T);
+      begin
+         if Precomputed_Symbol_Candidate (T) /= I then
+            Put_Line ("Not found through the perfect hash: " & Image (T));
+         elsif S /= Symbol_Type'(Precomputed_Symbol (PST, I)) then
+            Put_Line ("Not found through Find: " & Image (T));
+         end if;
+      end;
+   end loop;
+
+   declare
+      Keyword : constant Symbol_Type := Find (ST, "begin");
+      Other   : constant Symbol_Type := Find (ST, "beginning");
+   begin
+      Put_Line ("Keyword: " & Image (Keyword, With_Quotes => True));
+      Put_Line
+        ("Same as precomputed: "
+         & Boolean'Image
+             (Keyword = Symbol_Type'
+                (Precomputed_Symbol (PST, Precomputed_Symbol_Begin))));
+      Put_Line ("Other: " & Image (Other, With_Quotes => True));
+      Put_Line
+        ("Found again: " & Boolean'Image (Other = Find (ST, "beginning")));
+   end;
+
+   Destroy (ST);
+   Put_Line ("main.adb: Done.");
+end Main;
@@ -0,0 +1,49 @@
+"""
+Check that precomputed symbols are found through the perfect hash function
+that Langkit generates for them, i.e. that the Python and the Ada
+implementations of this hash function agree.
+"""
+
+from langkit.dsl import ASTNode, abstract
+from langkit.parsers import Grammar, List, Or
+
+from lexer_example import Token, foo_lexer
+from utils import build_and_run
+
+
+keywords = [
+    'abort', 'abs', 'abstract', 'accept', 'access', 'aliased', 'all', 'and',
+    'array', 'at', 'begin', 'body', 'case', 'constant', 'declare', 'delay',
+    'delta', 'digits', 'do', 'else', 'elsif', 'end', 'entry', 'exception',
+    'exit', 'for', 'function', 'generic', 'goto', 'if', 'in', 'interface',
+    'is', 'limited', 'loop', 'mod', 'new', 'not', 'of', 'or', 'others', 'out',
+    'overriding', 'package', 'pragma', 'private', 'procedure', 'protected',
+    'raise', 'range', 'record', 'rem', 'renames', 'requeue', 'return',
+    'reverse', 'select', 'separate', 'some', 'subtype', 'synchronized',
+    'tagged', 'task', 'terminate', 'then', 'type', 'until', 'use', 'when',
+    'while', 'with', 'xor',
+]
+
+
+@abstract
+class FooNode(ASTNode):
+    pass
+
+
+class Keyword(FooNode):
+    token_node = True
+
+
+class Name(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(Or(*[Keyword(Token.Identifier(match_text=kw))
+                        for kw in keywords],
+                      Name(Token.Identifier))),
+)
+
+build_and_run(g, lexer=foo_lexer, ada_main='main.adb', unparse_script=None)
+print('Done')
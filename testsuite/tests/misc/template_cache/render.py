@@ -0,0 +1,14 @@
+"""
+Render the "hello" template from the template directory given in argument and
+print the result, as well as the directory that contains compiled templates.
+"""
+
+import os.path as P
+import sys
+
+from langkit import template_utils
+
+
+template_utils.add_template_dir(P.abspath(sys.argv[1]))
+print(template_utils.Renderer().render('hello', name='world').strip())
+print(template_utils._template_lookup.module_directory)
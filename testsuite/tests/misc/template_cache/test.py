@@ -0,0 +1,68 @@
+"""
+Check that compiled templates are cached on disk: the cache must be shared by
+identical templates from different source trees, invalidated when templates
+change, cleaned up and disabled when LANGKIT_CACHE_DIR is empty.
+"""
+
+import os
+import os.path as P
+import shutil
+import subprocess
+import sys
+
+
+cache_dir = P.abspath('cache')
+
+
+def write_template(dirname, content):
+    os.makedirs(dirname, exist_ok=True)
+    with open(P.join(dirname, 'hello.mako'), 'w') as f:
+        f.write(content)
+
+
+def render(label, template_dir, cache=cache_dir):
+    """
+    Render the "hello" template from ``template_dir`` in a new process, print
+    the result and return the directory of compiled templates.
+    """
+    env = dict(os.environ)
+    env['LANGKIT_CACHE_DIR'] = cache
+    output, module_dir = subprocess.check_output(
+        [sys.executable, 'render.py', template_dir], env=env,
+        encoding='utf-8'
+    ).splitlines()
+    print('{}: {}'.format(label, output))
+    return None if module_dir == 'None' else module_dir
+
+
+def module_file(module_dir):
+    return P.join(module_dir, 'hello.mako.py')
+
+
+write_template('tree1', 'Hello, ${name}!')
+dir1 = render('First generation', 'tree1')
+print('Module saved: {}'.format(P.isfile(module_file(dir1))))
+
+# Reuse compiled modules for identical templates, even from another tree
+shutil.copytree('tree1', 'tree2')
+dir2 = render('Other source tree', 'tree2')
+print('Same modules: {}'.format(dir1 == dir2))
+
+# Editing a template must invalidate the cache
+write_template('tree1', 'Goodbye, ${name}!')
+dir3 = render('Edited template', 'tree1')
+print('Same modules: {}'.format(dir1 == dir3))
+
+# Directories that were not used for a long time must be removed
+os.utime(dir1, (0, 0))
+render('Eviction', 'tree1')
+print('Unused directory kept: {}'.format(P.isdir(dir1)))
+print('Used directory kept: {}'.format(P.isdir(dir3)))
+
+# An empty LANGKIT_CACHE_DIR disables the cache
+shutil.rmtree(cache_dir)
+dir4 = render('Disabled cache', 'tree1', cache='')
+print('Modules directory: {}'.format(dir4))
+print('Cache created: {}'.format(P.exists(cache_dir)))
+
+print('Done')
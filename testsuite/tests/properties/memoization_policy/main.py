@@ -0,0 +1,52 @@
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+
+def print_stats(label):
+    print('== {} =='.format(label))
+    for name, stats in sorted(ctx.memoization_stats().items()):
+        print('  {}: hits={} misses={} entries={}'.format(
+            name, stats.hits, stats.misses, stats.entries
+        ))
+
+
+def call_double(*values):
+    print('double: {}'.format([u.root.p_double(v) for v in values]))
+
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('main.txt', b'example')
+if u.diagnostics:
+    for d in u.diagnostics:
+        print(d)
+    sys.exit(1)
+
+print('Memoized properties: {}'.format(libfoolang.memoized_properties()))
+
+call_double(1, 2, 1, 1)
+u.root.p_self_node
+print_stats('Unbounded')
+
+ctx.set_memoization_policy('lru', max_entries=1,
+                           property_name='Example.double')
+print_stats('LRU (1 entry)')
+call_double(1, 2, 2, 1)
+print_stats('LRU (1 entry)')
+
+ctx.set_memoization_policy('disabled')
+print_stats('Disabled')
+call_double(3, 3)
+u.root.p_self_node
+print_stats('Disabled')
+
+for args in [('foo', ), ('lru', 0, 'Example.foo')]:
+    try:
+        ctx.set_memoization_policy(*args)
+    except ValueError as exc:
+        print('ValueError: {}'.format(exc))
+
+print('main.py: Done.')
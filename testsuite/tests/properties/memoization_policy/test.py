@@ -0,0 +1,28 @@
+"""
+Check that memoization policies and statistics for memoized properties work
+as expected.
+"""
+
+from langkit.dsl import ASTNode, T
+from langkit.expressions import Self, langkit_property
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+
+    @langkit_property(public=True, memoized=True)
+    def double(n=T.Int):
+        return n * 2
+
+    @langkit_property(public=True, memoized=True)
+    def self_node():
+        return Self.as_bare_entity
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py')
+print('Done')
@@ -0,0 +1,49 @@
+"""
+Test the bulk export of tokens.
+"""
+
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('foo.txt', b' (a (b c d)) ')
+if u.diagnostics:
+    for d in u.diagnostics:
+        print(d)
+    sys.exit(1)
+
+# Check that the full export is consistent with the token iteration API
+tokens = list(u.iter_tokens())
+columns = u.export_tokens()
+assert len(columns) == len(tokens)
+for i, t in enumerate(tokens):
+    assert columns.kind(i) == t.kind
+    assert columns.text(i) == t.text
+    assert columns.sloc_range(i) == t.sloc_range
+    assert bool(columns.is_trivia[i]) == t.is_trivia
+print('Full export: {} tokens'.format(len(columns)))
+print('')
+
+
+def dump(label, columns):
+    print('== {} =='.format(label))
+    for i in range(len(columns)):
+        print('  {:<11} {:<4} {:>2}-{:<2} {} {}'.format(
+            columns.kind(i), repr(str(columns.text(i))),
+            columns.start_offsets[i], columns.end_offsets[i],
+            columns.sloc_range(i),
+            'trivia' if columns.is_trivia[i] else 'token'
+        ))
+    print('')
+
+
+dump('export_tokens(2, 5)', u.export_tokens(2, 5))
+dump('export_tokens(-2)', u.export_tokens(-2))
+dump('export_tokens(20)', u.export_tokens(20))
+
+print('main.py: Done.')
@@ -0,0 +1,45 @@
+import libfoolang
+
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_file('foo.txt')
+
+
+def check(label, node, sought, **kwargs):
+    types = sought if isinstance(sought, type) else tuple(sought)
+    result = node.findall(sought, **kwargs)
+    expected = node.findall(lambda n: isinstance(n, types), **kwargs)
+    assert result == expected, (result, expected)
+
+    print('== {} =='.format(label))
+    for n in result:
+        print('   ', n)
+
+
+root = unit.root
+check('Name', root, libfoolang.Name)
+check('Enum', root, libfoolang.Enum)
+check('[EnumNull, PlusQualifierPresent]', root,
+      [libfoolang.EnumNull, libfoolang.PlusQualifierPresent])
+check('FooNode', root, libfoolang.FooNode)
+check('Param with f_name', root, libfoolang.Param, f_name=root[2].f_name)
+check('FooNode in the second Param', root[1], libfoolang.FooNode)
+check('Param in the second Param', root[1], libfoolang.Param)
+
+
+def check_find(label, node, sought, **kwargs):
+    types = sought if isinstance(sought, type) else tuple(sought)
+    result = node.find(sought, **kwargs)
+    expected = node.find(lambda n: isinstance(n, types), **kwargs)
+    assert result == expected, (result, expected)
+    print('find {}: {}'.format(label, result))
+
+
+check_find('Name', root, libfoolang.Name)
+check_find('[EnumNull, PlusQualifierPresent]', root,
+           [libfoolang.EnumNull, libfoolang.PlusQualifierPresent])
+check_find('Param with f_name', root, libfoolang.Param,
+           f_name=root[2].f_name)
+check_find('Param in the second Param', root[1], libfoolang.Param)
+
+print('Done.')
@@ -0,0 +1,66 @@
+import libfoolang
+from libfoolang import _py2to3
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext('iso-8859-1')
+
+prefix = b'example # '
+long_ascii = b'0123456789abcdef' * 3
+
+testcases = [
+    # Pure ASCII text, shorter and longer than the fast path chunks
+    (b'', 'utf-8'),
+    (b'abc', 'utf-8'),
+    (long_ascii, 'utf-8'),
+    (long_ascii, 'ascii'),
+
+    # Non-ASCII characters at various positions in ASCII runs
+    (b'H\xc3\xa9llo', 'utf-8'),
+    (long_ascii[:5] + b'\xc3\xa9' + long_ascii, 'utf-8'),
+    (long_ascii + b'\xe2\x82\xac', 'utf-8'),
+    (b'\xf0\x9f\x98\x80' + long_ascii + b'\xf4\x8f\xbf\xbf', 'utf-8'),
+    (b'\xef\xbf\xbf\xed\x9f\xbf\xee\x80\x80', 'utf-8'),
+
+    # Invalid UTF-8 sequences: stray continuation byte, overlong encodings,
+    # surrogates, code points beyond U+10FFFF and truncated sequences.
+    (long_ascii + b'\x80', 'utf-8'),
+    (b'\xc0\x80', 'utf-8'),
+    (b'\xe0\x80\x80', 'utf-8'),
+    (b'\xf0\x80\x80\x80', 'utf-8'),
+    (b'\xed\xa0\x80', 'utf-8'),
+    (b'\xf4\x90\x80\x80', 'utf-8'),
+    (b'\xf5\x80\x80\x80', 'utf-8'),
+    (b'\xe2\x82', 'utf-8'),
+    (b'\xe2\x82abc', 'utf-8'),
+
+    # Charset names are case insensitive
+    (b'H\xc3\xa9llo', 'UTF8'),
+    (b'H\xe9llo', 'Latin1'),
+    (b'Hello', 'US-ASCII'),
+
+    # ASCII and ISO-8859-1
+    (long_ascii + b'\xe9', 'ascii'),
+    (long_ascii + b'\xe9\xff\x80', 'iso-8859-1'),
+
+    # Byte order marks override the context-wide charset
+    (b'\xef\xbb\xbf' + prefix + b'H\xc3\xa9llo', ''),
+]
+
+for buffer, charset in testcases:
+    # Byte order marks must come first: do not add the prefix in this case
+    if not buffer.startswith(b'\xef\xbb\xbf'):
+        buffer = prefix + buffer
+
+    u = ctx.get_from_buffer('foo.txt', buffer, charset)
+    if u.diagnostics:
+        result = '\n'.join(['diagnostics:'] +
+                           ['    {}'.format(d) for d in u.diagnostics])
+    else:
+        result = _py2to3.text_repr(u.text)
+    print('  buffer={}, charset={}: {}'.format(
+        _py2to3.bytes_repr(buffer), repr(charset), result,
+    ))
+
+print('main.py: Done.')
@@ -0,0 +1,22 @@
+"""
+Test the decoding of source buffers for charsets that are decoded without
+iconv: ASCII, ISO-8859-1 and UTF-8, including invalid byte sequences and
+non-ASCII characters around the boundaries of the ASCII fast path chunks.
+"""
+
+from langkit.dsl import ASTNode
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+    token_node = True
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              types_from_lkt=True)
+print('Done')
@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+import tempfile
+
+import libfoolang as lfl
+
+
+print('main.py: Running...')
+
+
+def legacy_to_data(node):
+    """
+    Python-level implementation of the to_data method, which walks the tree
+    through node wrappers.
+    """
+    if node.is_list_type:
+        return [legacy_to_data(n) for n in node if n is not None]
+    else:
+        return {n: legacy_to_data(v)
+                for n, v in node.iter_fields()
+                if v is not None}
+
+
+def decode(data):
+    """
+    Print the tree that the given binary serialization represents.
+    """
+    pos = [0]
+
+    def number():
+        result = shift = 0
+        while True:
+            byte = bytearray(data[pos[0]:pos[0] + 1])[0]
+            pos[0] += 1
+            result |= (byte & 0x7f) << shift
+            shift += 7
+            if byte < 0x80:
+                return result
+
+    def node(indent):
+        kind = number()
+        if kind == 0:
+            print('{}None'.format(indent))
+            return
+        start, end, count = number(), number(), number()
+        print('{}{} {}-{}'.format(
+            indent, lfl._kind_to_astnode_cls[kind].__name__, start, end
+        ))
+        for _ in range(count):
+            node(indent + '  ')
+
+    node('  ')
+    assert pos[0] == len(data)
+
+
+ctx = lfl.AnalysisContext()
+u = ctx.get_from_buffer('foo.txt', b'def a = 1 + b\ndef f(x, y) = (x)')
+if u.diagnostics:
+    for d in u.diagnostics:
+        print(d)
+    sys.exit(1)
+
+print('== JSON ==')
+json_str = u.root.to_json()
+print(json_str)
+assert json_str == json.dumps(legacy_to_data(u.root))
+assert u.root.to_data() == legacy_to_data(u.root)
+assert u.root[1].to_json() == json.dumps(legacy_to_data(u.root[1]))
+print('')
+
+print('== Binary ==')
+data = u.root.serialize('binary')
+decode(data)
+print('')
+
+print('== Serialization to a file ==')
+fd, path = tempfile.mkstemp()
+try:
+    with os.fdopen(fd, 'wb') as f:
+        u.root.serialize('binary', f)
+    with open(path, 'rb') as f:
+        assert f.read() == data
+    print('Same as in-memory serialization')
+finally:
+    os.remove(path)
+print('')
+
+print('== Invalid format ==')
+try:
+    u.root.serialize('xml')
+except ValueError as exc:
+    print('ValueError: {}'.format(exc))
+print('')
+
+print('main.py: Done.')
@@ -0,0 +1,65 @@
+"""
+Generate and build a library with a lexer that exercises all kinds of lexer
+actions, then run "main.py" with it. Use the table-driven lexer backend if the
+TABLE_DRIVEN_LEXER environment variable is set to "1".
+"""
+
+import os
+
+from langkit.dsl import ASTNode, abstract
+from langkit.lexer import (Alt, Case, Ignore, Lexer, LexerToken, Literal,
+                           Pattern, WithSymbol, WithText, WithTrivia)
+from langkit.parsers import Grammar, List
+
+from utils import build_and_run
+
+
+class Token(LexerToken):
+    Def = WithText()
+    Identifier = WithSymbol()
+    Number = WithText()
+    String = WithText()
+    LPar = WithText()
+    RPar = WithText()
+    Tick = WithText()
+    Char = WithText()
+
+    Whitespace = WithTrivia()
+    Comment = WithTrivia()
+
+
+lexer = Lexer(Token)
+lexer.add_rules(
+    (Pattern(r'[ \n\r\t]+'), Token.Whitespace),
+    (Pattern(r'--[^\n]*'), Token.Comment),
+    (Pattern(r'\{[^}]*\}'), Ignore()),
+
+    (Literal('def'), Token.Def),
+    (Pattern(r'(\p{L}|_)(\p{L}|\p{Nd}|_)*'), Token.Identifier),
+    (Pattern(r'[0-9]+'), Token.Number),
+    (Pattern(r'"[^"]*"'), Token.String),
+    (Literal('('), Token.LPar),
+    (Literal(')'), Token.RPar),
+
+    Case(Pattern("'.'"),
+         Alt(prev_token_cond=(Token.Identifier, Token.RPar),
+             send=Token.Tick,
+             match_size=1),
+         Alt(send=Token.Char, match_size=3)),
+)
+
+
+@abstract
+class FooNode(ASTNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(main_rule=List(Name(Token.Identifier), empty_valid=True))
+
+build_and_run(g, lexer=lexer, py_script='main.py', unparse_script=None,
+              table_driven_lexer=os.environ['TABLE_DRIVEN_LEXER'] == '1')
@@ -0,0 +1,22 @@
+import libfoolang
+
+
+sources = [
+    'def foo(x) 42 "some string" -- comment\n',
+    "f'a' x'b' (y)'c' 'd' 'e",
+    'caf\u00e9 \u03bb\u03bb2 _\u00e9t\u00e9 {ignored text} x',
+    'x @ y $ \u00a7',
+    '',
+]
+
+ctx = libfoolang.AnalysisContext()
+for i, source in enumerate(sources):
+    u = ctx.get_from_buffer('src-{}.txt'.format(i), source.encode('utf-8'))
+    print('== {} =='.format(ascii(source)))
+    t = u.first_token
+    while t is not None:
+        print('  {} {}'.format(t.kind, ascii(t.text)))
+        t = t.next
+    print('  Invalid tokens: {}'.format(
+        len([d for d in u.diagnostics if 'Invalid token' in d.message])
+    ))
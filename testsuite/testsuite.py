@@ -87,6 +87,11 @@ class LangkitTestsuite(Testsuite):
                  ' testsuite tear_up step. This is used to speed up successive'
                  ' testsuite runs during development.'
         )
+        parser.add_argument(
+            '--disable-build-cache', action='store_true',
+            help='Disable the cache that lets testcases reuse the compilation'
+                 ' of generated units that are identical across testcases.'
+        )
         parser.add_argument(
             '--pretty-print', action='store_true',
             help='Pretty-print generated source code.'
@@ -105,6 +110,18 @@ class LangkitTestsuite(Testsuite):
             'restricted_env': self.env.options.restricted_env,
         }
 
+        # Keep Langkit's caches (compiled templates, ...) in the working
+        # directory, so that testsuite runs do not fill the user's cache.
+        os.environ['LANGKIT_CACHE_DIR'] = os.path.join(self.working_dir,
+                                                       'langkit-cache')
+
+        # Share the compilation of identical generated units across testcases
+        self.env.build_cache_dir = (
+            None
+            if self.env.options.disable_build_cache
+            else os.path.join(self.working_dir, 'build-cache')
+        )
+
         if self.env.options.coverage:
             # Create a directory that we'll use to:
             #